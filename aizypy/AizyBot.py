@@ -1,19 +1,66 @@
+import asyncio
 import logging
-from typing import Optional, Any, Callable, Awaitable, List, Union
+import os
+import pickle
+import time
+from typing import TYPE_CHECKING, Optional, Any, Callable, Awaitable, Dict, Iterable, List, Union
 from .CandleData import CandleData
-from .OrderManager import OrderManager, OrderStatus
+from .LogPipeline import LogPipeline
+from .OrderManager import OrderArchive, OrderManager, OrderStatus
+from .PerformanceMetrics import PerformanceMetrics
 from .Trade import Trade
+from .Tracer import Tracer
 from .WebSocketHandler import WebSocketHandler
 
+if TYPE_CHECKING:
+    from .CandleSeries import CandleSeries, CandleWindow
+
 class AizyBot:
-    """Base trading bot class implementing core trading functionality."""
+    """Base trading bot class implementing core trading functionality.
+    
+    The candle buffers (and with them NumPy) are imported when the first
+    bot is created rather than with this module, so importing AizyBot
+    stays cheap for tools that only need the class.
+    
+    Attributes:
+        candles: Rolling buffer of the most recent candles, updated before
+            each call to bot_action
+        pair_candles: Rolling buffer of each pair added with subscribe;
+            candles of those pairs are kept here instead of in ``candles``
+        tracer: Optional latency tracer recording the strategy callback,
+            order placement, closes, websocket sends and tick-to-order time
+        metrics: Streaming performance metrics (equity, drawdown, ratios,
+            win rate, exposure) updated as candles arrive and trades open
+            and close, readable at any time; a live bot runs indefinitely,
+            so no per-candle equity curve is kept
+        snapshot_path: File the bot state is snapshotted to and restored
+            from on start (None disables snapshots)
+        snapshot_interval: Seconds between periodic snapshots
+    """
+
+    SNAPSHOT_MAGIC = b"AIZYSNP1"
     
-    def __init__(self, log_file: str = "log.txt", websocket: Optional[Any] = None) -> None:
-        self.logger: logging.Logger = self._setup_logger(log_file)
-        self.websocket_handler: WebSocketHandler = WebSocketHandler(self.logger)
-        self.order_manager: OrderManager = OrderManager(self.logger)
+    def __init__(self, log_file: str = "log.txt", websocket: Optional[Any] = None,
+                 history_size: int = 1000, log_format: str = "text", log_level: int = logging.DEBUG,
+                 queue_size: Optional[int] = None, overflow: str = "block", tracer: Optional[Tracer] = None,
+                 retain_orders: Optional[int] = None, order_archive: Optional[str] = None,
+                 snapshot_path: Optional[str] = None, snapshot_interval: float = 60.0) -> None:
+        from .CandleSeries import CandleSeries
+        self.logger: logging.Logger = self._setup_logger(log_file, log_format, log_level)
+        self.tracer: Optional[Tracer] = tracer
+        self.websocket_handler: WebSocketHandler = WebSocketHandler(self.logger, queue_size, overflow, tracer)
+        self.order_manager: OrderManager = OrderManager(
+            self.logger, retain_orders, OrderArchive(order_archive) if order_archive else None)
+        self.candles: CandleSeries = CandleSeries(history_size)
+        self.pair_candles: Dict[str, CandleSeries] = {}
+        self.metrics: PerformanceMetrics = PerformanceMetrics(keep_equity_curve=False)
+        self.snapshot_path: Optional[str] = snapshot_path
+        self.snapshot_interval: float = snapshot_interval
+        self._state_fields: List[str] = []
+        self._next_snapshot: float = time.monotonic() + snapshot_interval
+        self._snapshot_write: Optional[asyncio.Future] = None
         self.websocket_handler.set_websocket(websocket)
-        self.websocket_handler.set_callback(self.bot_action)
+        self.websocket_handler.set_callback(self._on_candle)
 
     async def bot_setup(self) -> None:
         """Initialize bot settings and configurations."""
@@ -30,27 +77,277 @@ class AizyBot:
         """
         raise NotImplementedError("bot_action method should be implemented by the subclass")
 
-    def _setup_logger(self, log_file: str) -> logging.Logger:
+    def warm_up(self, history: Union['CandleWindow', Iterable[CandleData]], pair: Optional[str] = None) -> 'CandleWindow':
+        """Backfill the bot with a block of historical candles in one call.
+        
+        The candles are written to the pair's buffer in one vectorized step
+        and handed to ``on_warm_up`` as arrays, so indicators are primed in
+        bulk instead of through one ``bot_action`` per candle. No orders
+        are placed and the performance metrics are not touched.
+        
+        Args:
+            history: Historical candles, oldest first, as a CandleWindow of
+                OHLCV arrays (e.g. ``VectorTestEngine.load()``) or an
+                iterable of CandleData (e.g. a CandleSource)
+            pair: Pair the history belongs to; candles of pairs not added
+                with subscribe go to ``candles``
+                
+        Returns:
+            The history as a CandleWindow of arrays
+        """
+        import numpy as np
+        from .CandleSeries import CandleWindow
+        last_timestamp = None
+        if not isinstance(history, CandleWindow):
+            candles = list(history)
+            rows = np.array([candle.to_row() for candle in candles], dtype=float).reshape(-1, 6)
+            history = CandleWindow(*(np.ascontiguousarray(rows[:, i]) for i in range(1, 6)))
+            if candles:
+                last_timestamp = candles[-1].timestamp
+        series = self.pair_candles.get(pair, self.candles)
+        series.extend_values(*history)
+        if last_timestamp is not None:
+            series.last_timestamp = last_timestamp
+        self.on_warm_up(history, pair)
+        self.logger.info("Warmed up with %d candles", len(history.close))
+        return history
+
+    def on_warm_up(self, candles: 'CandleWindow', pair: Optional[str] = None) -> None:
+        """Prime strategy state from a block of historical candles.
+        
+        Override in subclasses, typically with ``Indicator.warm_up`` on the
+        columns; the default does nothing.
+        
+        Args:
+            candles: Historical OHLCV arrays, oldest first
+            pair: Pair passed to ``warm_up``
+        """
+
+    def subscribe(self, pair: str) -> None:
+        """Follow a trading pair with its own candle buffer and dispatch task.
+        
+        Candles of the pair are routed by ``candle_data.pair`` and handled
+        independently of other pairs, so a slow strategy on one pair does
+        not delay the rest.
+        
+        Args:
+            pair: Trading pair symbol, e.g. 'BTC/USD'
+        """
+        from .CandleSeries import CandleSeries
+        self.pair_candles[pair] = CandleSeries(self.candles.capacity)
+        self.websocket_handler.subscribe(pair, self._on_candle)
+
+    async def _on_candle(self, candle_data: CandleData) -> None:
+        """Record incoming candle data in the rolling buffer and run the strategy.
+        
+        Args:
+            candle_data: Candlestick data received from the WebSocket
+        """
+        if isinstance(candle_data, CandleData):
+            pair = candle_data.pair if candle_data.pair in self.pair_candles else None
+            self.pair_candles.get(pair, self.candles).append(candle_data)
+            self.metrics.update(candle_data.close, pair)
+        await self.bot_action(candle_data)
+        if self.snapshot_path is not None and time.monotonic() >= self._next_snapshot:
+            self._snapshot_in_background()
+
+    def _snapshot_in_background(self) -> None:
+        """Take a periodic snapshot without blocking the event loop on disk I/O.
+        
+        The state is pickled here, between two candles, so the snapshot is
+        consistent; writing and replacing the file happen on the default
+        executor. A snapshot is skipped while the previous write is still
+        running.
+        """
+        if self._snapshot_write is not None and not self._snapshot_write.done():
+            return
+        self._next_snapshot = time.monotonic() + self.snapshot_interval
+        data = self._snapshot_data()
+        self._snapshot_write = asyncio.get_running_loop().run_in_executor(
+            None, self._write_snapshot, self.snapshot_path, data, False)
+
+    def register_state(self, *names: str) -> None:
+        """Include strategy attributes in snapshots.
+        
+        Registered attributes are saved by ``snapshot`` and set back by
+        ``restore``, so indicators, price histories and position flags
+        survive a restart without replaying candles. Values must be
+        picklable (indicators, lists, dicts, deques, NumPy arrays...).
+        
+        Args:
+            *names: Attribute names, e.g. ``self.register_state("rsi", "last_position")``
+        """
+        for name in names:
+            if name not in self._state_fields:
+                self._state_fields.append(name)
+
+    def snapshot(self, path: Optional[str] = None) -> int:
+        """Write the bot state to a binary snapshot file.
+        
+        The snapshot holds the orders in memory (open positions, pending
+        orders and retained terminal orders), the candle buffers, the
+        performance metrics and the registered strategy attributes. It is
+        pickled to a temporary file that then atomically replaces ``path``,
+        so a crash mid-write leaves the previous snapshot intact. This call
+        writes the file inline; the periodic snapshots taken while candles
+        are handled write it on a worker thread.
+        
+        Args:
+            path: Snapshot file (defaults to ``snapshot_path``)
+            
+        Returns:
+            Size of the snapshot in bytes
+            
+        Raises:
+            ValueError: If no path is given and snapshot_path is not set
+        """
+        path = path or self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path given")
+        data = self._snapshot_data()
+        self._write_snapshot(path, data)
+        self._next_snapshot = time.monotonic() + self.snapshot_interval
+        return len(data)
+
+    def _snapshot_data(self) -> bytes:
+        """Serialize the bot state for a snapshot.
+        
+        Returns:
+            Snapshot file contents
+        """
+        state = {
+            "orders": self.order_manager.get_state(),
+            "candles": self.candles,
+            "pair_candles": self.pair_candles,
+            "metrics": self.metrics,
+            "strategy": {name: getattr(self, name) for name in self._state_fields},
+        }
+        return self.SNAPSHOT_MAGIC + pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _write_snapshot(self, path: str, data: bytes, raise_errors: bool = True) -> None:
+        """Write snapshot contents to a temporary file that then replaces ``path``.
+        
+        Args:
+            path: Snapshot file
+            data: Snapshot file contents
+            raise_errors: Whether a failed write raises; otherwise it is
+                logged and the previous snapshot is kept
+        """
+        temporary = f"{path}.tmp"
+        try:
+            with open(temporary, "wb") as f:
+                f.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            if raise_errors:
+                raise
+            self.logger.exception("Failed to write snapshot to %s", path)
+            return
+        self.logger.debug("Wrote snapshot to %s (%d bytes)", path, len(data))
+
+    def restore(self, path: Optional[str] = None) -> bool:
+        """Load the bot state from a snapshot written by ``snapshot``.
+        
+        Candle buffers are resized to this bot's history size and buffers
+        of pairs no longer subscribed are skipped. Snapshots are pickles:
+        only restore files written by your own bots.
+        
+        Args:
+            path: Snapshot file (defaults to ``snapshot_path``)
+            
+        Returns:
+            True if a snapshot was restored, False if the file does not exist
+            
+        Raises:
+            ValueError: If no path is given and snapshot_path is not set, or
+                the file is not a snapshot
+        """
+        path = path or self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path given")
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        if not data.startswith(self.SNAPSHOT_MAGIC):
+            raise ValueError(f"{path} is not an AizyBot snapshot")
+        state = pickle.loads(data[len(self.SNAPSHOT_MAGIC):])
+        self.order_manager.set_state(state["orders"])
+        self.candles = self._resized(state["candles"], self.candles.capacity)
+        for pair, series in state["pair_candles"].items():
+            if pair in self.pair_candles:
+                self.pair_candles[pair] = self._resized(series, self.pair_candles[pair].capacity)
+        self.metrics = state["metrics"]
+        for name, value in state["strategy"].items():
+            setattr(self, name, value)
+        self.logger.info("Restored snapshot from %s", path)
+        return True
+
+    @staticmethod
+    def _resized(series: 'CandleSeries', capacity: int) -> 'CandleSeries':
+        """Get a restored candle buffer with the given capacity.
+        
+        Args:
+            series: Buffer loaded from a snapshot
+            capacity: Capacity the bot was configured with
+            
+        Returns:
+            The buffer itself, or a copy of its most recent candles
+        """
+        from .CandleSeries import CandleSeries
+        if series.capacity == capacity:
+            return series
+        resized = CandleSeries(capacity)
+        resized.extend_values(*series.last(capacity))
+        resized.last_timestamp = series.last_timestamp
+        return resized
+
+    def _setup_logger(self, log_file: str, log_format: str = "text", log_level: int = logging.DEBUG) -> logging.Logger:
         """Configure logging for the bot.
         
+        Records are queued and written to the log file by a background
+        thread (see LogPipeline), so logging never blocks the event loop.
+        
         Args:
             log_file: Path to the log file
+            log_format: 'text' for plain lines or 'jsonl' for JSON lines
+            log_level: Minimum level logged; records below it cost nothing
             
         Returns:
             Configured logger instance
         """
         logger = logging.getLogger("AizyBot")
-        logger.setLevel(logging.DEBUG)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        logger.setLevel(log_level)
+        LogPipeline.for_file(log_file, log_format).attach(logger)
         return logger
 
     async def start(self) -> None:
-        """Start the bot and establish WebSocket connection."""
+        """Start the bot and establish WebSocket connection.
+        
+        With a snapshot path, the last snapshot is restored first, so the
+        bot resumes with its orders, candles and strategy state.
+        """
+        if self.snapshot_path is not None:
+            self.restore()
         await self.websocket_handler.connect()
         self.logger.info("Bot started and listening for messages.")
 
+    async def stop(self) -> None:
+        """Stop handling messages and write a final snapshot.
+        
+        Messages still queued are dropped; await
+        ``websocket_handler.drain()`` first to handle them.
+        """
+        await self.websocket_handler.close()
+        if self._snapshot_write is not None:
+            await self._snapshot_write
+        if self.snapshot_path is not None:
+            self.snapshot()
+        if self.order_manager.archive is not None:
+            self.order_manager.archive.flush()
+        self.logger.info("Bot stopped.")
+
     async def place_order(self, side: str, amount: float, price: float, pair: str, order_type: str = "market") -> None:
         """Place a new trading order.
         
@@ -61,12 +358,134 @@ class AizyBot:
             pair: Trading pair (e.g., 'BTC/USD')
             order_type: Type of order (default: 'market')
         """
+        tracer = self.tracer
+        started = tracer.start() if tracer else None
         order = self.order_manager.create_order(side, amount, price, pair, order_type)
         
         if self.order_manager.validate_order(order):
             self.order_manager.execute_order(order)
             if self.websocket_handler.ws:
+                if tracer:
+                    tracer.mark_order(pair=pair, side=side)
+                    sent = tracer.start()
                 await self.websocket_handler.ws.send_order(order)
+                if tracer:
+                    tracer.finish("ws.send_order", sent)
+            if order.status == OrderStatus.ACTIVE:
+                self._record_open(order)
+        if tracer:
+            tracer.finish("bot.place_order", started, pair=pair, side=side)
+
+    async def place_orders(self, orders: Iterable[Dict[str, Any]]) -> List[Trade]:
+        """Place a batch of orders with a single websocket message.
+        
+        Orders are validated in one pass and sent together through the
+        websocket's ``send_orders`` when it has one (falling back to one
+        ``send_order`` per order).
+        
+        Args:
+            orders: Order parameters, one dictionary per order with the
+                ``place_order`` keys (side, amount, price, pair and
+                optionally order_type)
+                
+        Returns:
+            The orders that were placed
+        """
+        tracer = self.tracer
+        started = tracer.start() if tracer else None
+        placed = self.order_manager.place_orders(orders)
+        if placed:
+            if tracer:
+                tracer.mark_order(orders=len(placed))
+            await self._send_batch("send_orders", "send_order", placed)
+            for order in placed:
+                if order.status == OrderStatus.ACTIVE:
+                    self._record_open(order)
+        if tracer:
+            tracer.finish("bot.place_orders", started, orders=len(placed))
+        return placed
+
+    async def cancel_orders(self, predicate: Optional[Callable[[Trade], bool]] = None,
+                            pair: Optional[str] = None) -> List[Trade]:
+        """Cancel every open (not yet active) order matching a predicate.
+        
+        Args:
+            predicate: Function selecting the orders to cancel (all if None)
+            pair: Only consider orders for this trading pair
+            
+        Returns:
+            The cancelled orders
+        """
+        cancelled = self.order_manager.cancel_orders(predicate, pair)
+        if cancelled:
+            await self._send_batch("send_cancel_orders", "send_cancel_order", cancelled)
+        return cancelled
+
+    async def close_all(self, pair: Optional[str] = None, side: Optional[str] = None) -> List[Trade]:
+        """Close every active trade, optionally filtered by pair and side.
+        
+        Args:
+            pair: Only close trades for this trading pair
+            side: Only close trades on this side ('buy' or 'sell')
+            
+        Returns:
+            The closed trades
+        """
+        closed = self.order_manager.close_all(pair, side)
+        if closed:
+            await self._send_batch("send_close_orders", "send_close_order", closed)
+            for order in closed:
+                self._record_close(order)
+        return closed
+
+    async def _send_batch(self, batch_method: str, single_method: str, orders: List[Trade]) -> None:
+        """Send orders to the websocket in one message when it supports batches.
+        
+        Args:
+            batch_method: Name of the websocket method taking a list of orders
+            single_method: Name of the per-order fallback method
+            orders: Orders to send
+        """
+        ws = self.websocket_handler.ws
+        if not ws:
+            return
+        send_batch = getattr(ws, batch_method, None)
+        if send_batch is not None:
+            started = self.tracer.start() if self.tracer else None
+            await send_batch(orders)
+            if self.tracer:
+                self.tracer.finish(f"ws.{batch_method}", started, orders=len(orders))
+            return
+        send = getattr(ws, single_method, None)
+        if send is not None:
+            for order in orders:
+                await send(order)
+
+    async def fill_order(self, order: Trade) -> bool:
+        """Record a limit order fill reported by the exchange.
+        
+        The order becomes an active trade and ``on_order_filled`` is called.
+        
+        Args:
+            order: The pending order that was filled
+            
+        Returns:
+            True if the order was pending and is now active, False otherwise
+        """
+        if not self.order_manager.fill_order(order):
+            return False
+        self._record_open(order)
+        await self.on_order_filled(order)
+        return True
+
+    async def on_order_filled(self, order: Trade) -> None:
+        """React to a limit order being filled.
+        
+        Override in subclasses; the default does nothing.
+        
+        Args:
+            order: The order that was filled, now an active trade
+        """
 
     async def close_trade(self, order: Union[str, Trade]) -> None:
         """Close an active trade.
@@ -74,13 +493,42 @@ class AizyBot:
         Args:
             order: Either the order ID (str) or Trade object to close
         """
+        tracer = self.tracer
+        started = tracer.start() if tracer else None
         if isinstance(order, str):
-            order = next((o for o in self.order_manager.orders if o.order_id == order), None)
+            order = self.order_manager.get_order_by_id(order)
         
         if order and order.status == OrderStatus.ACTIVE:
             self.order_manager.close_order(order)
             if self.websocket_handler.ws:
+                sent = tracer.start() if tracer else None
                 await self.websocket_handler.ws.send_close_order(order)
+                if tracer:
+                    tracer.finish("ws.send_close_order", sent)
+            self._record_close(order)
+        if tracer:
+            tracer.finish("bot.close_trade", started)
+
+    def _record_open(self, order: Trade) -> None:
+        """Add a newly active trade to the performance metrics.
+        
+        The entry price is the fill price reported on the order when the
+        exchange sets one, the order price otherwise.
+        
+        Args:
+            order: Trade that became active
+        """
+        pair = order.pair if order.pair in self.pair_candles else None
+        self.metrics.open_position(order.side, getattr(order, "entry_price", None) or order.price, pair)
+
+    def _record_close(self, order: Trade) -> None:
+        """Realize a closed trade in the performance metrics at the latest price.
+        
+        Args:
+            order: Trade that was closed
+        """
+        pair = order.pair if order.pair in self.pair_candles else None
+        self.metrics.close_position(order.side, getattr(order, "entry_price", None) or order.price, pair=pair)
 
     def list_active_trades(self) -> List[Trade]:
         """Get all active trades.
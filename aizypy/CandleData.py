@@ -1,47 +1,145 @@
-from typing import Dict
+import gc
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+EPOCH = datetime(1970, 1, 1)
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector during an allocation burst.
+
+    Decoding a batch allocates many small objects that can never form
+    cycles; letting the collector run repeatedly over them mid-batch costs
+    more than the decoding itself.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
 class CandleData:
     """Represents candlestick data for a trading instrument.
-    
+
     A candlestick represents price movement over a specific time period,
     including opening price, highest price, lowest price, closing price,
     and trading volume.
-    
+
+    Instances use ``__slots__`` and store the timestamp as integer epoch
+    milliseconds, which keeps each candle at a fixed, small size (88 bytes
+    for the object on CPython 3.11, versus 176 bytes for a regular instance
+    and its ``__dict__``). The human-readable form is available as
+    ``datetime``.
+
     Attributes:
-        timestamp: Time period of the candlestick
+        timestamp: Start of the period in milliseconds since the Unix epoch (UTC)
         open: Opening price of the period
         high: Highest price reached during the period
         low: Lowest price reached during the period
         close: Closing price of the period
         volume: Trading volume during the period
+        pair: Trading pair the candle belongs to, if known
     """
-    
-    def __init__(self, timestamp: str, open: float, high: float, low: float, close: float, volume: float) -> None:
+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume", "pair")
+
+    def __init__(self, timestamp: Union[int, float, str, datetime], open: float, high: float, low: float,
+                 close: float, volume: float, pair: Optional[str] = None) -> None:
         """Initialize a new candlestick data instance.
-        
+
         Args:
-            timestamp: Time period of the candlestick
+            timestamp: Start of the period in any form accepted by
+                ``to_epoch_ms``; numbers below 1e11 are epoch seconds (use
+                ``from_ms`` for values already in milliseconds)
             open: Opening price of the period
             high: Highest price reached during the period
             low: Lowest price reached during the period
             close: Closing price of the period
             volume: Trading volume during the period
+            pair: Trading pair the candle belongs to, if known
         """
-        self.timestamp: str = timestamp
+        self.timestamp: int = (timestamp if type(timestamp) is int and timestamp >= 100_000_000_000
+                               else self.to_epoch_ms(timestamp))
         self.open: float = open
         self.high: float = high
         self.low: float = low
         self.close: float = close
         self.volume: float = volume
+        self.pair: Optional[str] = pair
+
+    @classmethod
+    def from_ms(cls, timestamp: int, open: float, high: float, low: float, close: float, volume: float,
+                pair: Optional[str] = None) -> 'CandleData':
+        """Create a candle whose timestamp is already in epoch milliseconds.
+
+        Unlike the constructor, the timestamp is stored as given instead of
+        guessing its unit, so millisecond values below 1e11 (before March
+        1973, such as 0 or 60000) are kept. Sources that know their unit
+        (candle files, generators, the market data bus) use this.
+
+        Args:
+            timestamp: Start of the period in milliseconds since the Unix epoch
+            open: Opening price of the period
+            high: Highest price reached during the period
+            low: Lowest price reached during the period
+            close: Closing price of the period
+            volume: Trading volume during the period
+            pair: Trading pair the candle belongs to, if known
+
+        Returns:
+            A new CandleData instance
+        """
+        candle = cls.__new__(cls)
+        candle.timestamp = int(timestamp)
+        candle.open = open
+        candle.high = high
+        candle.low = low
+        candle.close = close
+        candle.volume = volume
+        candle.pair = pair
+        return candle
+
+    @staticmethod
+    def to_epoch_ms(value: Union[int, float, str, datetime]) -> int:
+        """Convert a timestamp to integer epoch milliseconds.
+
+        Numbers below 1e11 are taken as epoch seconds and larger ones as
+        epoch milliseconds. Naive datetimes are taken as UTC.
+
+        Args:
+            value: Epoch number, numeric or ISO 8601 string, or datetime
+
+        Returns:
+            Milliseconds since the Unix epoch (UTC)
+        """
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return (value - EPOCH) // timedelta(milliseconds=1)
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                return CandleData.to_epoch_ms(datetime.fromisoformat(value.strip()))
+        return int(value * 1000) if abs(value) < 1e11 else int(value)
+
+    @property
+    def datetime(self) -> datetime:
+        """Start of the period as a naive UTC datetime."""
+        return EPOCH + timedelta(milliseconds=self.timestamp)
 
     @classmethod
     def from_json(cls, data: Dict[str, str]) -> 'CandleData':
         """Create a CandleData instance from JSON data.
-        
+
         Args:
             data: Dictionary containing candlestick data with keys:
-                 timestamp, open, high, low, close, volume
-        
+                 timestamp, open, high, low, close, volume and optionally pair
+
         Returns:
             A new CandleData instance initialized with the provided data
         """
@@ -51,14 +149,76 @@ class CandleData:
             high=float(data["high"]),
             low=float(data["low"]),
             close=float(data["close"]),
-            volume=float(data["volume"])
+            volume=float(data["volume"]),
+            pair=data.get("pair")
         )
 
+    @classmethod
+    def from_json_many(cls, messages: Iterable[Any]) -> List['CandleData']:
+        """Create CandleData instances from a batch of decoded messages.
+
+        Each message may be a dictionary with the ``from_json`` keys or a
+        compact ``[timestamp, open, high, low, close, volume]`` row. The
+        batch is converted in one tight loop with the constructor and field
+        lookups hoisted out of it, and with the cyclic garbage collector
+        paused.
+
+        Args:
+            messages: Decoded JSON messages
+
+        Returns:
+            List of new CandleData instances, in input order
+        """
+        new = cls
+        to_ms = cls.to_epoch_ms
+        candles = []
+        append = candles.append
+        with _gc_paused():
+            for message in messages:
+                if type(message) is dict:
+                    timestamp = message["timestamp"]
+                    open_, high, low = message["open"], message["high"], message["low"]
+                    close, volume = message["close"], message["volume"]
+                    pair = message.get("pair")
+                else:
+                    timestamp, open_, high, low, close, volume = message
+                    pair = None
+                append(new(
+                    timestamp if type(timestamp) is int and timestamp >= 100_000_000_000 else to_ms(timestamp),
+                    float(open_), float(high), float(low), float(close), float(volume), pair
+                ))
+        return candles
+
+    @classmethod
+    def decode(cls, payload: Union[bytes, str]) -> List['CandleData']:
+        """Decode a raw JSON payload holding one or many candles.
+
+        The payload is parsed with a single ``json.loads`` call and may be
+        one candle object, a list of candle objects or rows, or an object
+        with the list under a ``candles`` key.
+
+        Args:
+            payload: Raw JSON text or bytes
+
+        Returns:
+            List of new CandleData instances
+        """
+        with _gc_paused():
+            data = json.loads(payload)
+        if isinstance(data, dict):
+            data = data["candles"] if "candles" in data else [data]
+        return cls.from_json_many(data)
+
+    def to_row(self) -> Sequence[float]:
+        """Return the candle as a compact ``[timestamp, open, high, low, close, volume]`` row."""
+        return [self.timestamp, self.open, self.high, self.low, self.close, self.volume]
+
     def __repr__(self) -> str:
         """Return a string representation of the candlestick data.
-        
+
         Returns:
             A formatted string containing all candlestick attributes
         """
+        pair = f", pair={self.pair!r}" if self.pair is not None else ""
         return (f"CandleData(timestamp={self.timestamp}, open={self.open}, high={self.high}, "
-                f"low={self.low}, close={self.close}, volume={self.volume})")
+                f"low={self.low}, close={self.close}, volume={self.volume}{pair})")
@@ -0,0 +1,183 @@
+from typing import Any, Dict, NamedTuple, Optional
+import numpy as np
+from .CandleData import CandleData
+
+class CandleWindow(NamedTuple):
+    """Read-only column views over the most recent candles of a CandleSeries."""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+class CandleSeries:
+    """Fixed-capacity rolling buffer of OHLCV columns.
+
+    Candles are stored in a float64 NumPy ring buffer that is written twice
+    (at ``i`` and ``i + capacity``), so the most recent ``n`` candles always
+    form one contiguous slice. Window accessors therefore return zero-copy
+    views in chronological order, and memory stays bounded no matter how
+    long the bot runs.
+
+    Views share memory with the buffer and are only valid until the next
+    candle is appended; copy them (``np.array(view)``) to keep the values.
+
+    Attributes:
+        capacity: Maximum number of candles retained
+    """
+
+    OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """Initialize an empty series.
+
+        Args:
+            capacity: Maximum number of candles retained
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity: int = capacity
+        self._data: np.ndarray = np.zeros((5, 2 * capacity))
+        self._next: int = 0
+        self._size: int = 0
+        self.last_timestamp: Optional[int] = None
+
+    def __len__(self) -> int:
+        """Return the number of candles currently held."""
+        return self._size
+
+    def append(self, candle: CandleData) -> None:
+        """Add a candle, evicting the oldest one once capacity is reached.
+
+        Args:
+            candle: Candle to append
+        """
+        self.append_values(candle.open, candle.high, candle.low, candle.close, candle.volume)
+        self.last_timestamp = candle.timestamp
+
+    def append_values(self, open: float, high: float, low: float, close: float, volume: float) -> None:
+        """Add one candle given as raw OHLCV values.
+
+        Args:
+            open: Opening price
+            high: Highest price
+            low: Lowest price
+            close: Closing price
+            volume: Trading volume
+        """
+        i = self._next
+        column = self._data[:, i]
+        column[0] = open
+        column[1] = high
+        column[2] = low
+        column[3] = close
+        column[4] = volume
+        self._data[:, i + self.capacity] = column
+        self._next = i + 1 if i + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend_values(self, opens: Any, highs: Any, lows: Any, closes: Any, volumes: Any) -> None:
+        """Add a block of candles given as OHLCV columns in one vectorized write.
+
+        Only the last ``capacity`` candles of the block are kept, exactly as
+        if they had been appended one by one.
+
+        Args:
+            opens: Opening prices, oldest first
+            highs: Highest prices
+            lows: Lowest prices
+            closes: Closing prices
+            volumes: Trading volumes
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        columns = np.array([opens, highs, lows, closes, volumes], dtype=np.float64)
+        columns = columns[:, columns.shape[1] - min(columns.shape[1], self.capacity):]
+        n = columns.shape[1]
+        if not n:
+            return
+        index = (self._next + np.arange(n)) % self.capacity
+        self._data[:, index] = columns
+        self._data[:, index + self.capacity] = columns
+        self._next = (self._next + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    def clear(self) -> None:
+        """Remove all candles from the series."""
+        self._next = 0
+        self._size = 0
+        self.last_timestamp = None
+
+    def _window(self, row: int, n: int) -> np.ndarray:
+        """Return a read-only view of the last ``n`` values of one column.
+
+        Args:
+            row: Column index (OPEN, HIGH, LOW, CLOSE or VOLUME)
+            n: Number of values, clipped to the current size
+
+        Returns:
+            Contiguous view in chronological order
+        """
+        n = min(max(n, 0), self._size)
+        end = self._next + self.capacity
+        view = self._data[row, end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def last(self, n: Optional[int] = None) -> CandleWindow:
+        """Get views over the most recent candles.
+
+        Args:
+            n: Number of candles (defaults to all candles held)
+
+        Returns:
+            CandleWindow of open, high, low, close and volume views
+        """
+        n = self._size if n is None else n
+        return CandleWindow(*(self._window(row, n) for row in range(5)))
+
+    @property
+    def opens(self) -> np.ndarray:
+        """Opening prices of all candles held, oldest first."""
+        return self._window(self.OPEN, self._size)
+
+    @property
+    def highs(self) -> np.ndarray:
+        """Highest prices of all candles held, oldest first."""
+        return self._window(self.HIGH, self._size)
+
+    @property
+    def lows(self) -> np.ndarray:
+        """Lowest prices of all candles held, oldest first."""
+        return self._window(self.LOW, self._size)
+
+    @property
+    def closes(self) -> np.ndarray:
+        """Closing prices of all candles held, oldest first."""
+        return self._window(self.CLOSE, self._size)
+
+    @property
+    def volumes(self) -> np.ndarray:
+        """Trading volumes of all candles held, oldest first."""
+        return self._window(self.VOLUME, self._size)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the candles held, in chronological order, not the doubled buffer."""
+        end = self._next + self.capacity
+        return {"capacity": self.capacity, "columns": np.array(self._data[:, end - self._size:end]),
+                "last_timestamp": self.last_timestamp}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the ring buffer from pickled columns."""
+        self.__init__(state["capacity"])
+        self.extend_values(*state["columns"])
+        self.last_timestamp = state["last_timestamp"]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the series."""
+        return f"CandleSeries(size={self._size}, capacity={self.capacity})"
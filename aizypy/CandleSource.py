@@ -0,0 +1,305 @@
+import csv
+import mmap
+import struct
+import tempfile
+from typing import Dict, Iterator, List, Optional
+import numpy as np
+from .CandleData import CandleData
+
+class CandleSource:
+    """Base class for sources that stream candles into the test engine.
+
+    A candle source is an iterable of CandleData in chronological order.
+    Passing one to TestEngine replays its candles through
+    ``MockWebSocket.emit_data`` instead of generating random data.
+    """
+
+    def __iter__(self) -> Iterator[CandleData]:
+        """Iterate over the candles of the source.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses
+        """
+        raise NotImplementedError("__iter__ method should be implemented by the subclass")
+
+class CSVCandleSource(CandleSource):
+    """Streams candles from a CSV file.
+
+    The file must have a header row containing the columns timestamp, open,
+    high, low, close and volume (in any order, extra columns are ignored).
+    Timestamps may be ISO 8601 strings or numeric epoch values. Rows are
+    read lazily, so the file is never loaded fully into memory.
+
+    Attributes:
+        path: Path to the CSV file
+        timestamp_unit: Unit of numeric timestamps ('s' or 'ms')
+    """
+
+    COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(self, path: str, timestamp_unit: str = "s") -> None:
+        """Initialize the CSV candle source.
+
+        Args:
+            path: Path to the CSV file
+            timestamp_unit: Unit of numeric timestamps ('s' or 'ms')
+
+        Raises:
+            ValueError: If the timestamp unit is unknown
+        """
+        if timestamp_unit not in ("s", "ms"):
+            raise ValueError(f"Unknown timestamp unit '{timestamp_unit}', expected 's' or 'ms'")
+        self.path: str = path
+        self.timestamp_unit: str = timestamp_unit
+
+    def rows(self) -> Iterator[List[str]]:
+        """Iterate over the raw OHLCV fields of each row.
+
+        Yields:
+            Lists of [timestamp, open, high, low, close, volume] strings
+
+        Raises:
+            ValueError: If a required column is missing from the header
+        """
+        with open(self.path, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = [name.strip().lower() for name in next(reader, [])]
+            missing = [name for name in self.COLUMNS if name not in header]
+            if missing:
+                raise ValueError(f"CSV file {self.path} is missing columns: {', '.join(missing)}")
+            indexes = [header.index(name) for name in self.COLUMNS]
+            for row in reader:
+                if row:
+                    yield [row[i] for i in indexes]
+
+    def parse_timestamp_ms(self, value: str) -> int:
+        """Convert a CSV timestamp field to epoch milliseconds.
+
+        Args:
+            value: ISO 8601 string or numeric epoch value
+
+        Returns:
+            Timestamp in milliseconds since the Unix epoch (UTC)
+        """
+        try:
+            number = float(value)
+        except ValueError:
+            return CandleData.to_epoch_ms(value)
+        return int(number * 1000) if self.timestamp_unit == "s" else int(number)
+
+    def __iter__(self) -> Iterator[CandleData]:
+        """Iterate over the candles stored in the CSV file.
+
+        Yields:
+            CandleData instances with epoch millisecond timestamps
+        """
+        for timestamp, open_, high, low, close, volume in self.rows():
+            yield CandleData.from_ms(
+                timestamp=self.parse_timestamp_ms(timestamp),
+                open=float(open_),
+                high=float(high),
+                low=float(low),
+                close=float(close),
+                volume=float(volume)
+            )
+
+class BinaryCandleSource(CandleSource):
+    """Streams candles from a memory-mapped binary columnar file.
+
+    The file starts with a fixed header followed by six contiguous columns
+    of ``count`` little-endian values each: timestamp (int64 epoch
+    milliseconds), then open, high, low, close and volume (float64). The
+    file is memory-mapped, so only the pages actually read are loaded and
+    multi-GB histories replay with a small resident footprint. Columns
+    are read as explicitly little-endian NumPy views, so files are
+    portable across platforms.
+
+    Attributes:
+        path: Path to the binary candle file
+        count: Number of candles stored in the file
+    """
+
+    MAGIC = b"AIZYCNDL"
+    VERSION = 1
+    HEADER = struct.Struct("<8sIIQ")
+    COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+    DTYPES = {name: np.dtype("<i8" if name == "timestamp" else "<f8") for name in COLUMNS}
+    ROW = np.dtype(list(zip(COLUMNS, DTYPES.values())))
+    ITER_CHUNK = 65_536
+
+    def __init__(self, path: str) -> None:
+        """Open and memory-map a binary candle file.
+
+        Args:
+            path: Path to the binary candle file
+
+        Raises:
+            ValueError: If the file is not a valid binary candle file
+        """
+        self.path: str = path
+        self._file = open(path, "rb")
+        try:
+            header = self._file.read(self.HEADER.size)
+            if len(header) != self.HEADER.size:
+                raise ValueError(f"{path} is too small to be a binary candle file")
+            magic, version, _, count = self.HEADER.unpack(header)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"{path} is not a version {self.VERSION} binary candle file")
+            self.count: int = count
+            self._mmap: Optional[mmap.mmap] = None
+            self._columns: Dict[str, np.ndarray] = {}
+            if count:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._columns = self._map_columns(self._mmap, count)
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def _map_columns(cls, buffer: mmap.mmap, count: int) -> Dict[str, np.ndarray]:
+        """Build little-endian column views over a mapped file.
+
+        Args:
+            buffer: Mapping of the whole file
+            count: Number of candles stored in the file
+
+        Returns:
+            Dictionary of column name to array view
+        """
+        columns = {}
+        offset = cls.HEADER.size
+        for name in cls.COLUMNS:
+            columns[name] = np.frombuffer(buffer, cls.DTYPES[name], count, offset)
+            offset += 8 * count
+        return columns
+
+    def _check_open(self) -> None:
+        """Raise if the source was closed.
+
+        Raises:
+            ValueError: If ``close`` was called
+        """
+        if self._file.closed:
+            raise ValueError("source is closed")
+
+    def __len__(self) -> int:
+        """Return the number of candles stored in the file."""
+        return self.count
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a zero-copy, read-only view of one column.
+
+        The view keeps the file mapped after ``close`` until it is released.
+
+        Args:
+            name: Column name (timestamp, open, high, low, close or volume)
+
+        Returns:
+            Little-endian array view over the mapped column
+
+        Raises:
+            ValueError: If the source is closed
+        """
+        self._check_open()
+        if not self._columns:
+            return np.empty(0, self.DTYPES[name])
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[CandleData]:
+        """Iterate over the candles stored in the file.
+
+        Columns are converted to Python numbers ``ITER_CHUNK`` candles at a
+        time.
+
+        Yields:
+            CandleData instances with epoch millisecond timestamps
+
+        Raises:
+            ValueError: If the source is closed
+        """
+        self._check_open()
+        columns = [self._columns[name] for name in self.COLUMNS] if self.count else []
+        from_ms = CandleData.from_ms
+        for start in range(0, self.count, self.ITER_CHUNK):
+            chunk = (column[start:start + self.ITER_CHUNK].tolist() for column in columns)
+            for timestamp, open_, high, low, close, volume in zip(*chunk):
+                yield from_ms(timestamp, open_, high, low, close, volume)
+
+    def close(self) -> None:
+        """Release the memory map and the underlying file.
+
+        Column views still held by the caller keep the mapping alive until
+        they are released.
+        """
+        self._columns = {}
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __getstate__(self) -> Dict[str, str]:
+        """Pickle only the path; the file is re-mapped when unpickled.
+
+        This lets a source be handed to worker processes, which then share
+        the mapped pages through the OS page cache.
+        """
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, str]) -> None:
+        """Re-open and map the file after unpickling."""
+        self.__init__(state["path"])
+
+    def __enter__(self) -> 'BinaryCandleSource':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @classmethod
+    def convert_csv(cls, csv_path: str, binary_path: str, timestamp_unit: str = "s") -> int:
+        """Convert a CSV candle file to the binary columnar format.
+
+        The CSV is parsed once: rows are appended to a temporary binary file
+        while they are counted, and then transposed into the mapped output
+        column by column, so memory use stays constant regardless of file
+        size.
+
+        Args:
+            csv_path: Path to the source CSV file
+            binary_path: Path of the binary file to write
+            timestamp_unit: Unit of numeric CSV timestamps ('s' or 'ms')
+
+        Returns:
+            Number of candles written
+        """
+        source = CSVCandleSource(csv_path, timestamp_unit)
+        pack = struct.Struct("<q5d").pack
+        parse_timestamp = source.parse_timestamp_ms
+        count = 0
+        with tempfile.TemporaryFile() as rows:
+            write = rows.write
+            for timestamp, open_, high, low, close, volume in source.rows():
+                write(pack(parse_timestamp(timestamp), float(open_), float(high), float(low), float(close),
+                           float(volume)))
+                count += 1
+            rows.flush()
+
+            with open(binary_path, "wb+") as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, count))
+                if not count:
+                    return 0
+                f.truncate(cls.HEADER.size + 8 * count * len(cls.COLUMNS))
+                f.flush()
+                with mmap.mmap(rows.fileno(), 0, access=mmap.ACCESS_READ) as rows_mapped, \
+                        mmap.mmap(f.fileno(), 0) as mapped:
+                    records = np.frombuffer(rows_mapped, cls.ROW, count)
+                    offset = cls.HEADER.size
+                    for name in cls.COLUMNS:
+                        np.frombuffer(mapped, cls.DTYPES[name], count, offset)[:] = records[name]
+                        offset += 8 * count
+                    del records
+                    mapped.flush()
+        return count
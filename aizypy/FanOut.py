@@ -0,0 +1,276 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from .IngressQueue import IngressQueue, route_key
+
+class Subscription:
+    """One subscriber of a FanOut, with its own queue, timeout and counters.
+
+    Attributes:
+        callback: Async function receiving each message
+        name: Name used in logs and stats
+        timeout: Seconds a callback may run before it is cancelled (None
+            for no limit)
+        queue: Messages published and not yet delivered
+        delivered: Messages handled without error
+        errors: Messages whose callback raised
+        timeouts: Messages whose callback was cancelled for running too long
+        task: Task delivering the queued messages (None until the first
+            publish)
+    """
+
+    def __init__(self, callback: Callable[[Any], Awaitable[None]], name: str, timeout: Optional[float],
+                 queue: IngressQueue) -> None:
+        """Initialize the subscription.
+
+        Args:
+            callback: Async function receiving each message
+            name: Name used in logs and stats
+            timeout: Seconds a callback may run (None for no limit)
+            queue: Queue of published messages
+        """
+        self.callback: Callable[[Any], Awaitable[None]] = callback
+        self.name: str = name
+        self.timeout: Optional[float] = timeout
+        self.queue: IngressQueue = queue
+        self.delivered: int = 0
+        self.errors: int = 0
+        self.timeouts: int = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the subscription."""
+        return (f"Subscription(name={self.name!r}, delivered={self.delivered}, errors={self.errors}, "
+                f"timeouts={self.timeouts}, depth={self.queue.qsize()})")
+
+class FanOut:
+    """Delivers every message of a feed to many subscribers concurrently and in isolation.
+
+    Messages can be sent two ways:
+
+    * ``publish`` queues the message for each subscriber. Every subscriber
+      has its own IngressQueue and delivery task, so the publisher only
+      waits when a 'block' queue is full, and a slow subscriber only falls
+      behind itself; its overflow policy decides what it misses.
+    * ``deliver`` runs every subscriber's callback on the message at once
+      and returns when all of them finished. This is lockstep delivery for
+      backtests, where a candle must be fully handled before the next one.
+
+    In both cases a callback running longer than its ``timeout`` is
+    cancelled, and an exception is logged and counted; neither reaches the
+    other subscribers or the publisher. With ``isolate_errors`` off, an
+    exception raised during ``deliver`` is still counted but then
+    propagates to its caller, so a backtest fails on a strategy error. Use
+    one of the two ways per feed: ``deliver`` bypasses the queues.
+
+    Attributes:
+        queue_size: Default bound of each subscriber's queue (0 for unbounded)
+        overflow: Default overflow policy of the queues
+        timeout: Default callback timeout in seconds (None for no limit)
+        isolate_errors: Whether ``deliver`` contains subscriber exceptions
+        logger: Logger receiving subscriber errors and timeouts
+    """
+
+    def __init__(self, queue_size: int = 0, overflow: str = "block", timeout: Optional[float] = None,
+                 logger: Optional[logging.Logger] = None, isolate_errors: bool = True) -> None:
+        """Initialize a fan-out without subscribers.
+
+        Args:
+            queue_size: Default bound of each subscriber's queue (0 for unbounded)
+            overflow: Default overflow policy, 'block', 'drop_oldest' or 'conflate'
+            timeout: Default callback timeout in seconds (None for no limit)
+            logger: Logger for subscriber errors (defaults to the 'AizyBot' logger)
+            isolate_errors: Whether ``deliver`` logs subscriber exceptions
+                instead of raising them; queued delivery always does
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        self._check(queue_size, overflow, timeout)
+        self.queue_size: int = queue_size
+        self.overflow: str = overflow
+        self.timeout: Optional[float] = timeout
+        self.isolate_errors: bool = isolate_errors
+        self.logger: logging.Logger = logger or logging.getLogger("AizyBot")
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._added: int = 0
+
+    @staticmethod
+    def _check(queue_size: int, overflow: str, timeout: Optional[float]) -> None:
+        """Validate subscription options.
+
+        Raises:
+            ValueError: If the queue size is negative, the overflow policy
+                unknown or the timeout not positive
+        """
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        if overflow not in IngressQueue.POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}', expected one of {IngressQueue.POLICIES}")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+    def subscribe(self, callback: Callable[[Any], Awaitable[None]], name: Optional[str] = None,
+                  queue_size: Optional[int] = None, overflow: Optional[str] = None,
+                  timeout: Optional[float] = None) -> Subscription:
+        """Add a subscriber.
+
+        Options left as None take the fan-out's defaults.
+
+        Args:
+            callback: Async function receiving each message
+            name: Name used in logs and stats (defaults to the callback's
+                qualified name and a sequence number, e.g.
+                'WebSocketHandler.on_message#1')
+            queue_size: Bound of the subscriber's queue
+            overflow: Overflow policy of the subscriber's queue
+            timeout: Seconds a callback may run before it is cancelled
+
+        Returns:
+            The new subscription
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        queue_size = self.queue_size if queue_size is None else queue_size
+        overflow = overflow or self.overflow
+        timeout = self.timeout if timeout is None else timeout
+        self._check(queue_size, overflow, timeout)
+        self._added += 1
+        if name is None:
+            name = f"{getattr(callback, '__qualname__', type(callback).__name__)}#{self._added}"
+        queue = IngressQueue(queue_size, overflow, route_key)
+        subscription = Subscription(callback, name, timeout, queue)
+        self._subscriptions += (subscription,)
+        return subscription
+
+    async def unsubscribe(self, callback: Callable[[Any], Awaitable[None]]) -> bool:
+        """Remove a subscriber after its queued messages are delivered.
+
+        Args:
+            callback: Callback passed to ``subscribe``
+
+        Returns:
+            True if the callback was subscribed
+        """
+        for subscription in self._subscriptions:
+            if subscription.callback == callback:
+                break
+        else:
+            return False
+        self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+        if subscription.task is not None:
+            await subscription.queue.join()
+            subscription.task.cancel()
+        return True
+
+    @property
+    def subscribers(self) -> List[Callable[[Any], Awaitable[None]]]:
+        """Callbacks of every subscriber, in subscription order."""
+        return [subscription.callback for subscription in self._subscriptions]
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        """Every subscription, in subscription order."""
+        return list(self._subscriptions)
+
+    async def publish(self, data: Any) -> None:
+        """Queue a message for every subscriber.
+
+        Args:
+            data: Message to send
+        """
+        for subscription in self._subscriptions:
+            if subscription.task is None:
+                subscription.task = asyncio.create_task(self._run(subscription),
+                                                        name=f"fanout-{subscription.name}")
+            await subscription.queue.put(data)
+
+    async def deliver(self, data: Any) -> None:
+        """Hand a message to every subscriber at once and wait until all handled it.
+
+        Args:
+            data: Message to send
+
+        Raises:
+            Exception: The first subscriber exception, when ``isolate_errors``
+                is off
+        """
+        subscriptions = self._subscriptions
+        raise_errors = not self.isolate_errors
+        if len(subscriptions) == 1:
+            await self._call(subscriptions[0], data, raise_errors)
+        elif subscriptions:
+            await asyncio.gather(*(self._call(subscription, data, raise_errors) for subscription in subscriptions))
+
+    async def _call(self, subscription: Subscription, data: Any, raise_errors: bool = False) -> None:
+        """Run one subscriber's callback, containing its timeout and, by default, its errors.
+
+        Args:
+            subscription: Subscriber to deliver to
+            data: Message to deliver
+            raise_errors: Whether an exception of the callback is re-raised
+                after being counted
+        """
+        try:
+            if subscription.timeout is None:
+                await subscription.callback(data)
+            else:
+                await asyncio.wait_for(subscription.callback(data), subscription.timeout)
+        except asyncio.TimeoutError:
+            subscription.timeouts += 1
+            self.logger.warning("Subscriber %s timed out after %ss", subscription.name, subscription.timeout)
+        except Exception:
+            subscription.errors += 1
+            if raise_errors:
+                raise
+            self.logger.exception("Subscriber %s failed to handle a message", subscription.name)
+        else:
+            subscription.delivered += 1
+
+    async def _run(self, subscription: Subscription) -> None:
+        """Deliver a subscriber's queued messages, one at a time and in order.
+
+        Args:
+            subscription: Subscriber whose queue is consumed
+        """
+        queue = subscription.queue
+        while True:
+            data = await queue.get()
+            try:
+                await self._call(subscription, data)
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every published message has been delivered."""
+        for subscription in self._subscriptions:
+            if subscription.task is not None:
+                await subscription.queue.join()
+
+    async def close(self) -> None:
+        """Stop every delivery task, dropping messages not yet delivered."""
+        tasks = [s.task for s in self._subscriptions if s.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for subscription in self._subscriptions:
+            subscription.task = None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the counters of each subscriber.
+
+        Returns:
+            Mapping of subscriber name to its delivered, error, timeout and
+            dropped message counts and its queue depth and high-water mark
+        """
+        return {
+            s.name: {"delivered": s.delivered, "errors": s.errors, "timeouts": s.timeouts,
+                     "dropped": s.queue.dropped, "depth": s.queue.qsize(), "high_water": s.queue.high_water}
+            for s in self._subscriptions
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the fan-out."""
+        return f"FanOut(subscribers={len(self._subscriptions)})"
+
@@ -0,0 +1,116 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any, Callable, Hashable, Optional
+
+def route_key(data: Any) -> Optional[str]:
+    """Get the pair a message belongs to, the key used to route and conflate messages.
+
+    Args:
+        data: Message data received from WebSocket
+
+    Returns:
+        The message's ``pair`` (attribute or dictionary key), or None
+    """
+    if isinstance(data, dict):
+        return data.get("pair")
+    return getattr(data, "pair", None)
+
+class IngressQueue(asyncio.Queue):
+    """Bounded message queue with a configurable overflow policy.
+
+    Sits between message receipt and strategy execution. When the queue is
+    full, the policy decides what happens to a new message:
+
+    * ``block``: the producer waits for space (backpressure upstream).
+    * ``drop_oldest``: the oldest queued message is discarded.
+    * ``conflate``: only the latest message per key is kept; a new message
+      replaces the queued one with the same key in place, so each key keeps
+      its position and the consumer always sees the freshest data. If the
+      queue is full of other keys, the oldest is discarded.
+
+    Attributes:
+        policy: Overflow policy
+        dropped: Number of messages discarded (including conflated ones)
+        conflated: Number of messages replaced by a newer one for their key
+        high_water: Largest depth reached
+    """
+
+    POLICIES = ("block", "drop_oldest", "conflate")
+
+    def __init__(self, maxsize: int = 0, policy: str = "block",
+                 key: Optional[Callable[[Any], Hashable]] = None) -> None:
+        """Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued messages (0 for unbounded)
+            policy: 'block', 'drop_oldest' or 'conflate'
+            key: Function giving the conflation key of a message, required
+                by the 'conflate' policy
+
+        Raises:
+            ValueError: If the policy is unknown or conflate has no key
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown overflow policy '{policy}', expected one of {self.POLICIES}")
+        if policy == "conflate" and key is None:
+            raise ValueError("The conflate policy requires a key function")
+        self.policy: str = policy
+        self.key: Optional[Callable[[Any], Hashable]] = key
+        self.dropped: int = 0
+        self.conflated: int = 0
+        self.high_water: int = 0
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        """Create the storage: a deque, or an ordered mapping keyed for conflation."""
+        self._queue = OrderedDict() if self.policy == "conflate" else deque()
+
+    def _put(self, item: Any) -> None:
+        """Store a message at the back of the queue."""
+        if self.policy == "conflate":
+            self._queue[self.key(item)] = item
+        else:
+            self._queue.append(item)
+
+    def _get(self) -> Any:
+        """Remove and return the oldest message."""
+        if self.policy == "conflate":
+            return self._queue.popitem(last=False)[1]
+        return self._queue.popleft()
+
+    def put_nowait(self, item: Any) -> None:
+        """Queue a message, applying the overflow policy when full.
+
+        Args:
+            item: Message to queue
+
+        Raises:
+            asyncio.QueueFull: If the queue is full and the policy is 'block'
+        """
+        if self.policy == "conflate":
+            key = self.key(item)
+            if key in self._queue:
+                # Replace in place: the depth does not change, so this never
+                # goes through the capacity check
+                self._queue[key] = item
+                self.conflated += 1
+                self.dropped += 1
+                return
+        if self.policy != "block" and self.full():
+            self._get()
+            self.dropped += 1
+            self.task_done()
+        super().put_nowait(item)
+        if self.qsize() > self.high_water:
+            self.high_water = self.qsize()
+
+    async def put(self, item: Any) -> None:
+        """Queue a message, waiting for space only under the 'block' policy.
+
+        Args:
+            item: Message to queue
+        """
+        if self.policy == "block":
+            await super().put(item)
+        else:
+            self.put_nowait(item)
@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional, Tuple
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of latencies in nanoseconds.
+
+    Values below ``2 ** precision_bits`` get one bucket each; above that,
+    every power of two is split into ``2 ** (precision_bits - 1)`` equal
+    buckets. The relative error of any reported percentile is therefore
+    bounded by ``2 ** -(precision_bits - 1)`` (about 1.6% with the default
+    of 7 bits), memory is fixed, and recording is a few integer operations
+    and one list increment.
+
+    Attributes:
+        precision_bits: Number of bits of precision kept per value
+        count: Number of recorded values
+        total: Sum of recorded values
+        min: Smallest recorded value (None when empty)
+        max: Largest recorded value (None when empty)
+    """
+
+    MAX_BITS = 48
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            precision_bits: Bits of precision per value, between 2 and 16
+
+        Raises:
+            ValueError: If precision_bits is out of range
+        """
+        if not 2 <= precision_bits <= 16:
+            raise ValueError("precision_bits must be between 2 and 16")
+        self.precision_bits: int = precision_bits
+        self._half: int = 1 << (precision_bits - 1)
+        self._counts: List[int] = [0] * ((self.MAX_BITS - precision_bits + 3) * self._half)
+        self.count: int = 0
+        self.total: int = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _bucket_value(self, index: int) -> int:
+        """Get the midpoint of a bucket.
+
+        Args:
+            index: Bucket index
+
+        Returns:
+            Representative value of the bucket in nanoseconds
+        """
+        half = self._half
+        if index < 2 * half:
+            return index
+        shift = index // half - 1
+        return ((index - shift * half) << shift) + (1 << (shift - 1))
+
+    def record(self, value: int) -> None:
+        """Record one latency.
+
+        Args:
+            value: Latency in integer nanoseconds; negative values count as
+                0 and values beyond 2**48 ns (~3 days) are clamped
+        """
+        if value < 0:
+            value = 0
+        elif value >> self.MAX_BITS:
+            value = (1 << self.MAX_BITS) - 1
+        shift = value.bit_length() - self.precision_bits
+        self._counts[value if shift <= 0 else shift * self._half + (value >> shift)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """Get the value at a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in nanoseconds, within the histogram's precision (0
+            when empty)
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    def percentiles(self, percents: Tuple[float, ...] = (50.0, 99.0, 99.9)) -> Dict[str, int]:
+        """Get several percentiles in one call.
+
+        Args:
+            percents: Percentiles to report
+
+        Returns:
+            Mapping such as ``{"p50": ..., "p99": ..., "p999": ...}`` in
+            nanoseconds
+        """
+        return {"p" + f"{p:g}".replace(".", ""): self.percentile(p) for p in percents}
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values in nanoseconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add another histogram's values to this one.
+
+        Args:
+            other: Histogram with the same precision
+
+        Raises:
+            ValueError: If the precisions differ
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, bucket in enumerate(other._counts):
+            if bucket:
+                self._counts[index] += bucket
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def reset(self) -> None:
+        """Remove all recorded values."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the histogram."""
+        return f"LatencyHistogram(count={self.count}, {self.percentiles()})"
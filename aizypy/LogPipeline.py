@@ -0,0 +1,171 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Tuple
+
+class JSONLinesFormatter(logging.Formatter):
+    """Formats each record as one compact JSON object per line.
+
+    Fields: ``ts`` (epoch seconds), ``level``, ``logger``, ``msg`` and, when
+    present, ``exc`` with the formatted traceback.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON encoded record without a trailing newline
+        """
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, separators=(",", ":"))
+
+class _PipelineQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener's formatter.
+
+    The standard ``prepare`` formats the whole record on the calling
+    thread, folding the traceback into the message and clearing the
+    exception fields, so no formatter downstream can tell them apart. This
+    one renders the message and the traceback text separately and keeps
+    the traceback in ``exc_text``, dropping only the live ``exc_info``
+    (which holds every frame of the stack).
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Render a record's message and traceback before it is queued.
+
+        Args:
+            record: Record being logged
+
+        Returns:
+            Copy of the record with ``msg`` and ``exc_text`` rendered
+        """
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class LogPipeline:
+    """Non-blocking file logging for the trading hot path.
+
+    Log calls only enqueue the record; a background thread owned by a
+    ``QueueListener`` writes it to disk, so strategies never block on file
+    I/O. Messages are still rendered on the calling thread (so they reflect
+    the state at the time of the call), but only for records whose level is
+    enabled; with lazy ``%``-style arguments nothing is formatted for
+    disabled levels.
+
+    Pipelines are shared per (file, format): bots logging to the same file
+    reuse one writer thread and one file handle.
+
+    Attributes:
+        log_file: Path of the log file
+        fmt: Output format, 'text' or 'jsonl'
+        handler: Queue handler to attach to loggers
+    """
+
+    FORMATS = ("text", "jsonl")
+    _pipelines: Dict[Tuple[str, str], 'LogPipeline'] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, log_file: str, fmt: str = "text", level: int = logging.DEBUG) -> None:
+        """Create the pipeline and start its writer thread.
+
+        Args:
+            log_file: Path of the log file
+            fmt: Output format, 'text' for plain messages or 'jsonl' for
+                structured JSON lines
+            level: Minimum level written to the file
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown log format '{fmt}', expected one of {self.FORMATS}")
+        self.log_file: str = log_file
+        self.fmt: str = fmt
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setLevel(level)
+        if fmt == "jsonl":
+            file_handler.setFormatter(JSONLinesFormatter())
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.handler: QueueHandler = _PipelineQueueHandler(self._queue)
+        self.handler.setLevel(level)
+        self._file_handler: logging.FileHandler = file_handler
+        self._listener: QueueListener = QueueListener(self._queue, file_handler, respect_handler_level=True)
+        self._loggers: List[logging.Logger] = []
+        self._listener.start()
+        self._running: bool = True
+
+    @classmethod
+    def for_file(cls, log_file: str, fmt: str = "text") -> 'LogPipeline':
+        """Get the shared pipeline for a log file, creating it if needed.
+
+        Args:
+            log_file: Path of the log file
+            fmt: Output format, 'text' or 'jsonl'
+
+        Returns:
+            The running LogPipeline for this file and format
+        """
+        with cls._lock:
+            pipeline = cls._pipelines.get((log_file, fmt))
+            if pipeline is None or not pipeline._running:
+                pipeline = cls._pipelines[(log_file, fmt)] = cls(log_file, fmt)
+            return pipeline
+
+    def attach(self, logger: logging.Logger) -> None:
+        """Route a logger's records through this pipeline.
+
+        Attaching is idempotent, so recreating a bot does not duplicate
+        output.
+
+        Args:
+            logger: Logger to attach the queue handler to
+        """
+        if self.handler not in logger.handlers:
+            logger.addHandler(self.handler)
+            self._loggers.append(logger)
+
+    def stop(self) -> None:
+        """Detach from loggers, flush queued records and close the file."""
+        if not self._running:
+            return
+        self._running = False
+        for logger in self._loggers:
+            logger.removeHandler(self.handler)
+        self._loggers.clear()
+        self._listener.stop()
+        self._file_handler.close()
+
+    @classmethod
+    def stop_all(cls) -> None:
+        """Stop every shared pipeline, flushing pending records."""
+        with cls._lock:
+            pipelines = list(cls._pipelines.values())
+            cls._pipelines.clear()
+        for pipeline in pipelines:
+            pipeline.stop()
+
+atexit.register(LogPipeline.stop_all)
@@ -0,0 +1,289 @@
+import asyncio
+import os
+import struct
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import numpy as np
+from .CandleData import CandleData
+
+class MarketDataBus:
+    """Single-writer ring buffer of candles in shared memory.
+
+    One feed process decodes incoming candles once and publishes them into
+    a ``multiprocessing.shared_memory`` block; any number of local bot
+    processes attach a MarketDataReader by name and read the candles
+    straight from the shared pages, without a connection or JSON decoding
+    of their own.
+
+    The block starts with a 64-byte header (magic, version, capacity and
+    the number of candles published so far) followed by ``capacity``
+    64-byte records: timestamp (int64 epoch milliseconds), open, high,
+    low, close and volume (float64) and the pair (16 bytes of UTF-8). A
+    record is fully written before the published count is advanced, so
+    readers never see a candle in progress. Once the ring is full the
+    oldest candles are overwritten; readers that fall more than
+    ``capacity`` candles behind skip ahead and count what they missed.
+
+    Attributes:
+        name: Name of the shared memory block, passed to readers
+        capacity: Number of candles the ring holds
+        published: Number of candles published so far
+    """
+
+    MAGIC = b"AIZYMBUS"
+    VERSION = 1
+    HEADER = struct.Struct("<8sIIQ")
+    HEADER_SIZE = 64
+    COUNT_OFFSET = 16
+    RECORD = np.dtype([("timestamp", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"),
+                       ("close", "<f8"), ("volume", "<f8"), ("pair", "S16")])
+    RECORD_STRUCT = struct.Struct("<q5d16s")
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 65536) -> None:
+        """Create the shared memory block.
+
+        Args:
+            name: Name of the block (a random one is chosen when None)
+            capacity: Number of candles the ring holds
+
+        Raises:
+            ValueError: If capacity is not positive
+            FileExistsError: If a block with this name already exists
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity: int = capacity
+        self._shm: Optional[SharedMemory] = SharedMemory(
+            name, create=True, size=self.HEADER_SIZE + capacity * self.RECORD.itemsize)
+        self.name: str = self._shm.name
+        self.HEADER.pack_into(self._shm.buf, 0, self.MAGIC, self.VERSION, capacity, 0)
+        self._count: memoryview = self._shm.buf[self.COUNT_OFFSET:self.COUNT_OFFSET + 8].cast("Q")
+        self._pairs: Dict[Optional[str], bytes] = {None: b""}
+        self.published: int = 0
+
+    def publish(self, candle: CandleData) -> int:
+        """Publish one candle to every reader.
+
+        Args:
+            candle: Decoded candle
+
+        Returns:
+            Sequence number of the candle
+
+        Raises:
+            ValueError: If the pair is longer than 16 bytes
+        """
+        return self.publish_values(candle.timestamp, candle.open, candle.high, candle.low, candle.close,
+                                   candle.volume, candle.pair)
+
+    def publish_values(self, timestamp: int, open: float, high: float, low: float, close: float,
+                       volume: float, pair: Optional[str] = None) -> int:
+        """Publish one candle given as raw values.
+
+        Args:
+            timestamp: Start of the period in epoch milliseconds
+            open: Opening price
+            high: Highest price
+            low: Lowest price
+            close: Closing price
+            volume: Trading volume
+            pair: Trading pair, if known
+
+        Returns:
+            Sequence number of the candle
+
+        Raises:
+            ValueError: If the pair is longer than 16 bytes
+        """
+        encoded = self._pairs.get(pair)
+        if encoded is None:
+            encoded = pair.encode()
+            if len(encoded) > 16:
+                raise ValueError(f"Pair {pair!r} is longer than 16 bytes")
+            self._pairs[pair] = encoded
+        sequence = self.published
+        self.RECORD_STRUCT.pack_into(self._shm.buf, self.HEADER_SIZE + (sequence % self.capacity) * 64,
+                                     timestamp, open, high, low, close, volume, encoded)
+        self.published = sequence + 1
+        self._count[0] = self.published
+        return sequence
+
+    async def on_message(self, data: Any) -> None:
+        """Publish candles received by a WebSocketHandler, for use as its callback.
+
+        Args:
+            data: Message data; anything but a CandleData is ignored
+        """
+        if isinstance(data, CandleData):
+            self.publish(data)
+
+    def close(self) -> None:
+        """Release and remove the shared memory block; attached readers keep their mapping."""
+        if self._shm is None:
+            return
+        self._count.release()
+        self._shm.close()
+        if os.name == "posix":
+            # Readers attached from this process (or forked from it) share its
+            # resource tracker and unregistered the block; register it again
+            # so that unlinking, which unregisters it, stays balanced.
+            resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> 'MarketDataBus':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the bus."""
+        return f"MarketDataBus(name={self.name!r}, capacity={self.capacity}, published={self.published})"
+
+class MarketDataReader:
+    """Reads the candles of a MarketDataBus from another process.
+
+    Each reader keeps its own position in the ring, so bots consume the
+    feed independently. ``poll_records`` copies the new records out of the
+    shared block in one vectorized step and then checks, from the
+    published count, that the writer did not overwrite any of them while
+    they were copied; records that were lapped are dropped and counted in
+    ``missed``.
+
+    Attributes:
+        name: Name of the shared memory block
+        capacity: Number of candles the ring holds
+        position: Sequence number of the next candle to read
+        missed: Candles overwritten before this reader got to them
+    """
+
+    def __init__(self, name: str, start: str = "latest") -> None:
+        """Attach to a bus.
+
+        Args:
+            name: Name of the bus's shared memory block
+            start: 'latest' to read only candles published from now on,
+                'oldest' to also read the candles still in the ring (except
+                the oldest slot, which the writer overwrites next)
+
+        Raises:
+            ValueError: If start is unknown or the block is not a bus
+            FileNotFoundError: If no block with this name exists
+        """
+        if start not in ("latest", "oldest"):
+            raise ValueError(f"Unknown start '{start}', expected 'latest' or 'oldest'")
+        self._shm: Optional[SharedMemory] = _attach(name)
+        self.name: str = name
+        magic, version, capacity, published = MarketDataBus.HEADER.unpack_from(self._shm.buf, 0)
+        if magic != MarketDataBus.MAGIC or version != MarketDataBus.VERSION:
+            self._shm.close()
+            raise ValueError(f"{name} is not a version {MarketDataBus.VERSION} market data bus")
+        self.capacity: int = capacity
+        self._count: memoryview = self._shm.buf[MarketDataBus.COUNT_OFFSET:MarketDataBus.COUNT_OFFSET + 8].cast("Q")
+        self._records: np.ndarray = np.ndarray(capacity, MarketDataBus.RECORD, self._shm.buf,
+                                               MarketDataBus.HEADER_SIZE)
+        self.position: int = published if start == "latest" else max(0, published - capacity + 1)
+        self.missed: int = 0
+
+    @property
+    def available(self) -> int:
+        """Number of candles published and not yet read."""
+        return self._count[0] - self.position
+
+    def poll_records(self, max_records: Optional[int] = None) -> np.ndarray:
+        """Read the new candles as a structured array.
+
+        Args:
+            max_records: Most candles to read (all available when None)
+
+        Returns:
+            Copy of the new records with timestamp, open, high, low, close,
+            volume and pair fields, oldest first
+        """
+        start, end = self.position, self._count[0]
+        if end - start > self.capacity:
+            self.missed += end - self.capacity - start
+            start = end - self.capacity
+        if max_records is not None:
+            end = min(end, start + max_records)
+        if start >= end:
+            return self._records[:0].copy()
+        first, last = start % self.capacity, (end - 1) % self.capacity
+        if first <= last:
+            block = self._records[first:last + 1].copy()
+        else:
+            block = np.concatenate((self._records[first:], self._records[:last + 1]))
+        self.position = end
+        # The writer may be overwriting the slot of sequence (published - capacity)
+        intact = self._count[0] - self.capacity + 1
+        if start < intact:
+            lapped = min(intact, end) - start
+            self.missed += lapped
+            block = block[lapped:]
+        return block
+
+    def poll(self, max_records: Optional[int] = None) -> List[CandleData]:
+        """Read the new candles.
+
+        Args:
+            max_records: Most candles to read (all available when None)
+
+        Returns:
+            New candles, oldest first
+        """
+        block = self.poll_records(max_records)
+        return [CandleData.from_ms(timestamp, open_, high, low, close, volume, pair.decode() or None)
+                for timestamp, open_, high, low, close, volume, pair in block.tolist()]
+
+    async def run(self, callback: Callable[[CandleData], Awaitable[None]], poll_interval: float = 0.001) -> None:
+        """Hand every new candle to a callback until cancelled.
+
+        Pass ``bot.websocket_handler.on_message`` to feed a bot, which then
+        routes the candles as if they came from its own connection.
+
+        Args:
+            callback: Async function receiving each candle
+            poll_interval: Seconds to sleep when no candle is available
+        """
+        while True:
+            candles = self.poll()
+            for candle in candles:
+                await callback(candle)
+            if not candles:
+                await asyncio.sleep(poll_interval)
+
+    def close(self) -> None:
+        """Detach from the bus."""
+        if self._shm is None:
+            return
+        self._records = None
+        self._count.release()
+        self._shm.close()
+        self._shm = None
+
+    def __enter__(self) -> 'MarketDataReader':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the reader."""
+        return f"MarketDataReader(name={self.name!r}, position={self.position}, missed={self.missed})"
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing shared memory block without taking ownership of it.
+
+    Before Python 3.13, attaching registers the block with the resource
+    tracker, which would remove it when the reader process exits.
+    """
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        shm = SharedMemory(name)
+        if os.name == "posix":
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
@@ -0,0 +1,342 @@
+import math
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .CandleData import CandleData
+from .CandleSource import CandleSource
+
+MINUTES_PER_YEAR = 365 * 24 * 60
+
+class MarketGenerator(CandleSource):
+    """Base class for seeded synthetic market data generators.
+
+    Generators produce candles in NumPy blocks of ``block_size`` rows, so the
+    per-candle generation cost is a handful of vectorized operations spread
+    over the whole block. Subclasses only describe the close-price path;
+    opens, wicks and volume are derived here. Two generators built with the
+    same parameters and seed yield identical candles.
+
+    Attributes:
+        start_price: Price the first candle opens at
+        start: Timestamp of the first candle in epoch milliseconds
+        interval: Time between candles in minutes
+        count: Number of candles to generate (None for an endless stream)
+        seed: Seed for the random number generator
+        block_size: Number of candles generated per NumPy block
+        wick: Relative standard deviation of high/low wick extensions
+        volume: Median candle volume
+    """
+
+    def __init__(self, start_price: float = 1500.0, start: Union[int, datetime] = datetime(2024, 1, 1),
+                 interval: int = 1, count: Optional[int] = None, seed: Optional[int] = None,
+                 block_size: int = 65536, wick: float = 0.001, volume: float = 50.0) -> None:
+        """Initialize the generator.
+
+        Args:
+            start_price: Price the first candle opens at
+            start: Timestamp of the first candle (epoch milliseconds or datetime)
+            interval: Time between candles in minutes
+            count: Number of candles to generate (None for an endless stream)
+            seed: Seed for the random number generator
+            block_size: Number of candles generated per NumPy block
+            wick: Relative standard deviation of high/low wick extensions
+            volume: Median candle volume
+
+        Raises:
+            ValueError: If start_price or block_size is not positive
+        """
+        if start_price <= 0:
+            raise ValueError("start_price must be positive")
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.start_price: float = start_price
+        self.start: int = start if isinstance(start, int) else CandleData.to_epoch_ms(start)
+        self.interval: int = interval
+        self.count: Optional[int] = count
+        self.seed: Optional[int] = seed
+        self.block_size: int = block_size
+        self.wick: float = wick
+        self.volume: float = volume
+
+    def generate_closes(self, rng: np.random.Generator, size: int, last_close: float) -> np.ndarray:
+        """Generate the next block of close prices.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of closes to generate
+            last_close: Close of the previous candle (or the start price)
+
+        Returns:
+            Array of ``size`` positive close prices
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses
+        """
+        raise NotImplementedError("generate_closes method should be implemented by the subclass")
+
+    def generate_block(self, rng: np.random.Generator, size: int, last_close: float) -> Dict[str, np.ndarray]:
+        """Generate one block of OHLCV columns.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of candles in the block
+            last_close: Close of the previous candle (or the start price)
+
+        Returns:
+            Dictionary with open, high, low, close and volume arrays
+        """
+        closes = self.generate_closes(rng, size, last_close)
+        opens = np.empty(size)
+        opens[0] = last_close
+        opens[1:] = closes[:-1]
+        body_high = np.maximum(opens, closes)
+        body_low = np.minimum(opens, closes)
+        highs = body_high * (1.0 + np.abs(rng.normal(0.0, self.wick, size)))
+        lows = body_low * (1.0 - np.minimum(np.abs(rng.normal(0.0, self.wick, size)), 0.5))
+        volumes = self.volume * rng.lognormal(0.0, 0.5, size)
+        return {"open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes}
+
+    def blocks(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Iterate over the generated data one block at a time.
+
+        This is the vectorized entry point for consumers that work on whole
+        arrays instead of individual candles.
+
+        Yields:
+            Dictionaries of OHLCV arrays of at most ``block_size`` rows
+        """
+        rng = np.random.default_rng(self.seed)
+        remaining = self.count
+        last_close = self.start_price
+        while remaining is None or remaining > 0:
+            size = self.block_size if remaining is None else min(self.block_size, remaining)
+            block = self.generate_block(rng, size, last_close)
+            last_close = float(block["close"][-1])
+            if remaining is not None:
+                remaining -= size
+            yield block
+
+    def __iter__(self) -> Iterator[CandleData]:
+        """Iterate over the generated candles.
+
+        Yields:
+            CandleData instances spaced one interval apart
+        """
+        timestamp = self.start
+        step = self.interval * 60_000
+        for block in self.blocks():
+            rows = zip(block["open"].tolist(), block["high"].tolist(), block["low"].tolist(),
+                       block["close"].tolist(), block["volume"].tolist())
+            for open_, high, low, close, volume in rows:
+                yield CandleData.from_ms(timestamp, open_, high, low, close, volume)
+                timestamp += step
+
+class UniformGenerator(MarketGenerator):
+    """Independent random candles, matching the legacy TestEngine data.
+
+    Every candle opens uniformly in [low_price, high_price] and closes within
+    +/-5% of its open, with no continuity between candles.
+    """
+
+    def __init__(self, low_price: float = 1000.0, high_price: float = 2000.0, **kwargs) -> None:
+        """Initialize the uniform generator.
+
+        Args:
+            low_price: Lower bound of the opening price
+            high_price: Upper bound of the opening price
+            **kwargs: Additional keyword arguments for MarketGenerator
+        """
+        kwargs.setdefault("start_price", low_price)
+        super().__init__(**kwargs)
+        self.low_price: float = low_price
+        self.high_price: float = high_price
+
+    def generate_block(self, rng: np.random.Generator, size: int, last_close: float) -> Dict[str, np.ndarray]:
+        """Generate one block of independent uniform candles.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of candles in the block
+            last_close: Unused, candles are independent
+
+        Returns:
+            Dictionary with open, high, low, close and volume arrays
+        """
+        opens = rng.uniform(self.low_price, self.high_price, size)
+        closes = opens * rng.uniform(0.95, 1.05, size)
+        highs = np.maximum(opens, closes) * rng.uniform(1.0, 1.02, size)
+        lows = np.minimum(opens, closes) * rng.uniform(0.98, 1.0, size)
+        volumes = rng.uniform(10, 100, size)
+        return {"open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes}
+
+class RandomWalkGenerator(MarketGenerator):
+    """Arithmetic random walk with normally distributed price steps.
+
+    Attributes:
+        drift: Mean price change per candle
+        step: Standard deviation of the price change per candle
+        floor: Minimum price the walk is clipped to
+    """
+
+    def __init__(self, drift: float = 0.0, step: float = 1.0, floor: float = 0.01, **kwargs) -> None:
+        """Initialize the random walk generator.
+
+        Args:
+            drift: Mean price change per candle
+            step: Standard deviation of the price change per candle
+            floor: Minimum price the walk is clipped to
+            **kwargs: Additional keyword arguments for MarketGenerator
+        """
+        super().__init__(**kwargs)
+        self.drift: float = drift
+        self.step: float = step
+        self.floor: float = floor
+
+    def generate_closes(self, rng: np.random.Generator, size: int, last_close: float) -> np.ndarray:
+        """Generate the next block of close prices.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of closes to generate
+            last_close: Close of the previous candle
+
+        Returns:
+            Array of close prices clipped to ``floor``
+        """
+        closes = last_close + np.cumsum(rng.normal(self.drift, self.step, size))
+        return np.maximum(closes, self.floor)
+
+class GBMGenerator(MarketGenerator):
+    """Geometric Brownian motion with annualized drift and volatility.
+
+    Attributes:
+        drift: Annualized drift (e.g. 0.05 for 5% per year)
+        volatility: Annualized volatility (e.g. 0.8 for 80% per year)
+    """
+
+    def __init__(self, drift: float = 0.0, volatility: float = 0.8, **kwargs) -> None:
+        """Initialize the GBM generator.
+
+        Args:
+            drift: Annualized drift
+            volatility: Annualized volatility
+            **kwargs: Additional keyword arguments for MarketGenerator
+        """
+        super().__init__(**kwargs)
+        self.drift: float = drift
+        self.volatility: float = volatility
+
+    def log_returns(self, rng: np.random.Generator, size: int, drift: float, volatility: float) -> np.ndarray:
+        """Draw per-candle log returns for the given annualized parameters.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of returns to draw
+            drift: Annualized drift
+            volatility: Annualized volatility
+
+        Returns:
+            Array of log returns
+        """
+        dt = self.interval / MINUTES_PER_YEAR
+        return rng.normal((drift - 0.5 * volatility ** 2) * dt, volatility * math.sqrt(dt), size)
+
+    def generate_closes(self, rng: np.random.Generator, size: int, last_close: float) -> np.ndarray:
+        """Generate the next block of close prices.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of closes to generate
+            last_close: Close of the previous candle
+
+        Returns:
+            Array of close prices
+        """
+        return last_close * np.exp(np.cumsum(self.log_returns(rng, size, self.drift, self.volatility)))
+
+class RegimeSwitchingGenerator(GBMGenerator):
+    """GBM whose drift and volatility switch between market regimes.
+
+    The active regime persists for a geometrically distributed number of
+    candles, then switches to one of the other regimes at random.
+
+    Attributes:
+        regimes: List of (annualized drift, annualized volatility) pairs
+        switch_probability: Per-candle probability of leaving the regime
+        regime: Index of the regime active at the end of the last block
+    """
+
+    DEFAULT_REGIMES: List[Tuple[float, float]] = [(0.5, 0.5), (-0.5, 1.0), (0.0, 0.3)]
+
+    def __init__(self, regimes: Optional[Sequence[Tuple[float, float]]] = None,
+                 switch_probability: float = 0.001, **kwargs) -> None:
+        """Initialize the regime-switching generator.
+
+        Args:
+            regimes: List of (annualized drift, annualized volatility) pairs,
+                defaults to bull, bear and calm regimes
+            switch_probability: Per-candle probability of leaving the regime
+            **kwargs: Additional keyword arguments for MarketGenerator
+
+        Raises:
+            ValueError: If no regimes are given or the probability is invalid
+        """
+        super().__init__(**kwargs)
+        self.regimes: List[Tuple[float, float]] = list(regimes or self.DEFAULT_REGIMES)
+        if not self.regimes:
+            raise ValueError("At least one regime is required")
+        if not 0 < switch_probability <= 1:
+            raise ValueError("switch_probability must be in (0, 1]")
+        self.switch_probability: float = switch_probability
+        self.regime: int = 0
+        self._regime_left: Optional[int] = None
+
+    def blocks(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Iterate over the generated data one block at a time.
+
+        Yields:
+            Dictionaries of OHLCV arrays of at most ``block_size`` rows
+        """
+        self.regime = 0
+        self._regime_left = None
+        yield from super().blocks()
+
+    def regime_path(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Draw the regime index of each candle in a block.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of candles in the block
+
+        Returns:
+            Integer array of regime indexes
+        """
+        path = np.empty(size, dtype=np.int64)
+        filled = 0
+        while filled < size:
+            if not self._regime_left:
+                if self._regime_left == 0 and len(self.regimes) > 1:
+                    self.regime = (self.regime + int(rng.integers(1, len(self.regimes)))) % len(self.regimes)
+                self._regime_left = int(rng.geometric(self.switch_probability))
+            run = min(self._regime_left, size - filled)
+            path[filled:filled + run] = self.regime
+            filled += run
+            self._regime_left -= run
+        return path
+
+    def generate_closes(self, rng: np.random.Generator, size: int, last_close: float) -> np.ndarray:
+        """Generate the next block of close prices.
+
+        Args:
+            rng: Random number generator seeded for this run
+            size: Number of closes to generate
+            last_close: Close of the previous candle
+
+        Returns:
+            Array of close prices
+        """
+        params = np.asarray(self.regimes, dtype=float)[self.regime_path(rng, size)]
+        dt = self.interval / MINUTES_PER_YEAR
+        drifts, volatilities = params[:, 0], params[:, 1]
+        returns = (drifts - 0.5 * volatilities ** 2) * dt + volatilities * math.sqrt(dt) * rng.standard_normal(size)
+        return last_close * np.exp(np.cumsum(returns))
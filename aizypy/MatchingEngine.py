@@ -0,0 +1,126 @@
+import heapq
+import itertools
+from typing import Dict, List, Tuple
+from .OrderManager import Order, OrderStatus
+
+class MatchingEngine:
+    """Simulated limit-order book used by the test harness.
+
+    Resting buy orders are kept in a max-heap by price and sell orders in a
+    min-heap, so matching a candle only touches the orders its range
+    crosses: a buy fills once the low reaches its price and a sell once the
+    high does, at the order's limit price. Matching costs O(k log n) for k
+    fills out of n resting orders, and cancels are O(1) amortized:
+    cancelled entries are skipped when they reach the top of a heap, and
+    both heaps are rebuilt without them once they make up most of the
+    entries. Orders that are no longer pending (e.g. cancelled through the
+    OrderManager without reaching the engine) are never filled.
+
+    Attributes:
+        fills: Number of orders filled so far
+    """
+
+    COMPACT_SLACK = 64
+
+    def __init__(self) -> None:
+        """Initialize an empty book."""
+        self._bids: List[Tuple[float, int, Order]] = []
+        self._asks: List[Tuple[float, int, Order]] = []
+        self._resting: Dict[str, Order] = {}
+        self._sequence = itertools.count()
+        self.fills: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of resting orders."""
+        return len(self._resting)
+
+    def __contains__(self, order: Order) -> bool:
+        """Return whether an order is resting in the book."""
+        return order.order_id in self._resting
+
+    def add(self, order: Order) -> None:
+        """Rest a limit order in the book.
+
+        Args:
+            order: Limit order to add
+
+        Raises:
+            ValueError: If the side is neither 'buy' nor 'sell'
+        """
+        if order.side == "buy":
+            heapq.heappush(self._bids, (-order.price, next(self._sequence), order))
+        elif order.side == "sell":
+            heapq.heappush(self._asks, (order.price, next(self._sequence), order))
+        else:
+            raise ValueError(f"Unknown order side '{order.side}'")
+        self._resting[order.order_id] = order
+
+    def cancel(self, order: Order) -> bool:
+        """Remove an order from the book.
+
+        Args:
+            order: Order to remove
+
+        Returns:
+            True if the order was resting in the book, False otherwise
+        """
+        if self._resting.pop(order.order_id, None) is None:
+            return False
+        if len(self._bids) + len(self._asks) > 2 * len(self._resting) + self.COMPACT_SLACK:
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """Rebuild both heaps without the entries of cancelled orders."""
+        resting = self._resting
+        for order_id in [order_id for order_id, order in resting.items() if order.status is not OrderStatus.PENDING]:
+            del resting[order_id]
+        self._bids = [entry for entry in self._bids if entry[2].order_id in resting]
+        self._asks = [entry for entry in self._asks if entry[2].order_id in resting]
+        heapq.heapify(self._bids)
+        heapq.heapify(self._asks)
+
+    def match(self, high: float, low: float) -> List[Order]:
+        """Fill every resting order crossed by a candle's price range.
+
+        Args:
+            high: Highest price of the candle
+            low: Lowest price of the candle
+
+        Returns:
+            Filled orders, buys from the highest price down then sells from
+            the lowest price up (price-time priority within each side)
+        """
+        filled = []
+        resting = self._resting
+        bids = self._bids
+        while bids and -bids[0][0] >= low:
+            order = heapq.heappop(bids)[2]
+            if resting.pop(order.order_id, None) is not None and order.status is OrderStatus.PENDING:
+                filled.append(order)
+        asks = self._asks
+        while asks and asks[0][0] <= high:
+            order = heapq.heappop(asks)[2]
+            if resting.pop(order.order_id, None) is not None and order.status is OrderStatus.PENDING:
+                filled.append(order)
+        self.fills += len(filled)
+        return filled
+
+    def best_bid(self) -> float:
+        """Highest resting buy price, or -inf if there is none."""
+        self._discard_cancelled(self._bids)
+        return -self._bids[0][0] if self._bids else float("-inf")
+
+    def best_ask(self) -> float:
+        """Lowest resting sell price, or +inf if there is none."""
+        self._discard_cancelled(self._asks)
+        return self._asks[0][0] if self._asks else float("inf")
+
+    def _discard_cancelled(self, heap: List[Tuple[float, int, Order]]) -> None:
+        """Pop cancelled entries off the top of a heap.
+
+        Args:
+            heap: Bid or ask heap
+        """
+        while heap and heap[0][2].order_id not in self._resting:
+            heapq.heappop(heap)
@@ -1,10 +1,15 @@
-import uuid
-from datetime import datetime
+import functools
+import json
+import os
+import secrets
+import time
+import weakref
+from collections import deque
+from datetime import datetime, tzinfo
 from enum import Enum
 import logging
-from dataclasses import dataclass, field
-import pytz
-from typing import List, Optional
+from dataclasses import InitVar, dataclass, field
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Union
 
 class OrderStatus(Enum):
     """Enumeration of possible order statuses in the trading system.
@@ -26,6 +31,99 @@ class OrderStatus(Enum):
     FAILED = "Failed"
     CLOSED = "Closed"
 
+class OrderIdGenerator:
+    """Snowflake-style generator of unique, increasing order ids.
+
+    Each id is a 63-bit integer made of the milliseconds since 2024-01-01
+    (41 bits), a worker id (10 bits) and a sequence number (12 bits) for
+    ids made in the same millisecond. The default worker id is the process
+    id offset by a random salt drawn when the generator is created:
+    unrelated processes whose ids match modulo 1024 do not systematically
+    collide, while workers forked from one parent keep its salt, and so
+    distinct worker ids, once the module's generator takes the child's
+    process id after the fork. Pass explicit, distinct worker ids to rule
+    out collisions across a fleet of hosts or processes. Generating one costs a clock read and a few
+    integer operations, with no entropy source, and ids sort by creation
+    time. If more than 4096 ids are needed in one millisecond, or the
+    clock goes back, the generator borrows from the next millisecond so
+    ids stay strictly increasing.
+
+    Attributes:
+        worker_id: Worker id embedded in every id
+    """
+
+    EPOCH_MS = 1_704_067_200_000
+    SEQUENCE_BITS = 12
+    WORKER_BITS = 10
+
+    def __init__(self, worker_id: Optional[int] = None) -> None:
+        """Initialize the generator.
+
+        Args:
+            worker_id: Worker id, 0 to 1023 (defaults to the salted process
+                id modulo 1024)
+        """
+        self._salt: int = secrets.randbits(self.WORKER_BITS)
+        self.set_worker(worker_id)
+        self._ms: int = -1
+        self._sequence: int = 0
+
+    def set_worker(self, worker_id: Optional[int] = None) -> None:
+        """Change the worker id embedded in the following ids.
+
+        Args:
+            worker_id: Worker id, 0 to 1023 (defaults to the current process
+                id plus the generator's salt, modulo 1024)
+        """
+        if worker_id is None:
+            worker_id = os.getpid() + self._salt
+        self.worker_id: int = worker_id & ((1 << self.WORKER_BITS) - 1)
+        self._worker_bits: int = self.worker_id << self.SEQUENCE_BITS
+
+    def next_id(self) -> int:
+        """Generate the next id.
+
+        Returns:
+            A unique integer id, greater than every id generated before
+        """
+        ms = time.time_ns() // 1_000_000 - self.EPOCH_MS
+        if ms > self._ms:
+            self._ms = ms
+            self._sequence = 0
+        else:
+            self._sequence += 1
+            if self._sequence >> self.SEQUENCE_BITS:
+                self._ms += 1
+                self._sequence = 0
+        return (self._ms << (self.WORKER_BITS + self.SEQUENCE_BITS)) | self._worker_bits | self._sequence
+
+    def __call__(self) -> str:
+        """Generate the next id as a string, the form used for ``Order.order_id``."""
+        return str(self.next_id())
+
+    @classmethod
+    def created_at_ms(cls, order_id: Union[int, str]) -> int:
+        """Get the creation time embedded in an id.
+
+        Args:
+            order_id: Id made by a generator
+
+        Returns:
+            Creation time in epoch milliseconds
+        """
+        return (int(order_id) >> (cls.WORKER_BITS + cls.SEQUENCE_BITS)) + cls.EPOCH_MS
+
+_order_ids = OrderIdGenerator()
+if hasattr(os, "register_at_fork"):
+    # Forked workers (e.g. a ProcessPoolExecutor sweep) inherit the parent's generator
+    os.register_at_fork(after_in_child=_order_ids.set_worker)
+
+@functools.lru_cache(maxsize=None)
+def _order_timezone() -> tzinfo:
+    """Load the timezone of order timestamps, on first use only."""
+    import pytz
+    return pytz.timezone('America/New_York')
+
 @dataclass
 class Order:
     """Represents a trading order with its parameters and current status.
@@ -36,46 +134,332 @@ class Order:
         price: Target price for the trade
         pair: Trading pair symbol (e.g., 'BTC/USD')
         order_type: Type of order ('market' or 'limit')
-        order_id: Unique identifier for the order
+        order_id: Unique identifier for the order (a Snowflake-style id
+            from OrderIdGenerator, increasing with creation time)
         status: Current status of the order
-        timestamp: Time when the order was created
+        created_ns: Creation time in epoch nanoseconds
+        timestamp: Creation time as a New York datetime, built on access;
+            also accepted by the constructor, which then sets created_ns
     """
     side: str
     amount: float
     price: float
     pair: str
     order_type: str = "market"
-    order_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    order_id: str = field(default_factory=_order_ids)
     status: OrderStatus = OrderStatus.CREATED
-    timestamp: datetime = field(default_factory=lambda: datetime.now(pytz.timezone('America/New_York')))
+    timestamp: InitVar[Optional[datetime]] = None
+    created_ns: int = field(default_factory=time.time_ns)
+
+    def __post_init__(self, timestamp: Optional[datetime]) -> None:
+        """Take the creation time from a timestamp given to the constructor.
+
+        Args:
+            timestamp: Creation time (naive datetimes are local time, as in
+                ``datetime.timestamp``), or None to keep created_ns
+        """
+        if timestamp is not None:
+            self.created_ns = round(timestamp.timestamp() * 1_000_000) * 1000
+
+    def _creation_datetime(self) -> datetime:
+        """Creation time as a timezone-aware datetime in New York time."""
+        seconds, nanoseconds = divmod(self.created_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, _order_timezone()).replace(microsecond=nanoseconds // 1000)
 
     def __repr__(self) -> str:
         """Return a string representation of the order."""
         return (f"Order(id={self.order_id}, pair={self.pair}, side={self.side}, amount={self.amount}, "
                 f"price={self.price}, type={self.order_type}, status={self.status})")
 
+# Set once the dataclass __init__ is built, so ``timestamp`` stays an init argument
+Order.timestamp = property(Order._creation_datetime)
+
+class OrderArchive:
+    """Append-only file of orders that reached a terminal status.
+
+    OrderManager moves closed, cancelled and failed orders here once its
+    retention limit is reached, so its live indexes only hold recent and
+    open orders. Each order is one JSON array per line
+    (``[order_id, pair, side, amount, price, order_type, status,
+    created_ns]``). Writes are buffered and nothing is indexed in memory:
+    lookups scan the file, and only happen when a caller asks for
+    archived orders explicitly.
+
+    Attributes:
+        path: Path of the archive file
+        count: Number of orders written by this instance
+    """
+
+    _encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def __init__(self, path: str) -> None:
+        """Open an archive for appending, creating the file if needed.
+
+        Args:
+            path: Path of the archive file; existing content is kept
+        """
+        self.path: str = path
+        self.count: int = 0
+        self._file: IO[str] = open(path, "a", encoding="utf-8")
+        self._finalizer = weakref.finalize(self, self._file.close)
+
+    def append(self, order: Order) -> None:
+        """Write one order to the archive.
+
+        Args:
+            order: Order in a terminal status
+        """
+        self._file.write(self._encode([order.order_id, order.pair, order.side, order.amount, order.price,
+                                       order.order_type, order.status.value, order.created_ns]) + "\n")
+        self.count += 1
+
+    def __iter__(self) -> Iterator[Order]:
+        """Iterate over every archived order, oldest first.
+
+        Yields:
+            Orders rebuilt from the archive file
+        """
+        self.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield self._decode(line)
+
+    @staticmethod
+    def _decode(line: str) -> Order:
+        """Rebuild an order from one archive line.
+
+        Args:
+            line: JSON array written by ``append``
+
+        Returns:
+            The archived order
+        """
+        order_id, pair, side, amount, price, order_type, status, created_ns = json.loads(line)
+        return Order(side=side, amount=amount, price=price, pair=pair, order_type=order_type, order_id=order_id,
+                     status=OrderStatus(status), created_ns=created_ns)
+
+    def get(self, order_id: str) -> Optional[Order]:
+        """Find an archived order by id by scanning the file.
+
+        Args:
+            order_id: Identifier of the order
+
+        Returns:
+            The archived order, or None if it is not in the archive
+        """
+        prefix = json.dumps([order_id])[:-1] + ","
+        self.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(prefix):
+                    return self._decode(line)
+        return None
+
+    def list_orders(self, status: Optional[OrderStatus] = None, pair: Optional[str] = None) -> List[Order]:
+        """Get archived orders filtered by status and/or pair.
+
+        Args:
+            status: Only return orders with this status (any if None)
+            pair: Only return orders for this trading pair (any if None)
+
+        Returns:
+            Matching orders, oldest first
+        """
+        return [order for order in self
+                if (status is None or order.status is status) and (pair is None or order.pair == pair)]
+
+    def flush(self) -> None:
+        """Write buffered orders to disk."""
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the archive file."""
+        self._finalizer()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the archive."""
+        return f"OrderArchive(path={self.path!r}, count={self.count})"
+
 class OrderManager:
     """Manages the lifecycle of trading orders including creation, execution, and tracking.
     
     This class handles all aspects of order management including validation,
-    execution, cancellation, and status tracking. It maintains lists of both
-    active trades and pending orders.
+    execution, cancellation, and status tracking. Orders are indexed by id,
+    by status and by pair, so lookups, listings and closes cost O(1) or
+    O(result) instead of scanning every order ever created. All status
+    changes go through ``update_status`` to keep the indexes consistent.
+    
+    With a retention limit, only the most recent ``retain_terminal``
+    closed, cancelled and failed orders stay in the indexes; older ones are
+    written to the archive (or dropped without one), so memory stays
+    proportional to the open and pending orders of a long-running bot.
+    Archived orders are only read back when a lookup asks for them with
+    ``include_archived``.
     
     Attributes:
         logger: Logger instance for recording order events
-        orders: List of all orders ever created
+        orders: Orders held in memory (every order without a retention limit)
         active_trades: List of currently active market orders
+        retain_terminal: Terminal orders kept in memory (None keeps all)
+        archive: Where terminal orders beyond the limit are written
+        evicted: Number of terminal orders moved out of memory
     """
     
-    def __init__(self, logger: logging.Logger) -> None:
+    TERMINAL_STATUSES = frozenset((OrderStatus.CLOSED, OrderStatus.CANCELLED, OrderStatus.FAILED))
+
+    def __init__(self, logger: logging.Logger, retain_terminal: Optional[int] = None,
+                 archive: Optional[OrderArchive] = None) -> None:
         """Initialize the OrderManager.
         
         Args:
             logger: Logger instance for recording order events
+            retain_terminal: Number of closed, cancelled or failed orders kept
+                in memory, most recent first (None keeps every order)
+            archive: Archive receiving the terminal orders moved out of
+                memory; without one they are dropped
+            
+        Raises:
+            ValueError: If retain_terminal is negative
         """
+        if retain_terminal is not None and retain_terminal < 0:
+            raise ValueError("retain_terminal must not be negative")
         self.logger: logging.Logger = logger
-        self.orders: List[Order] = []
-        self.active_trades: List[Order] = []  # List to hold active market orders
+        self.retain_terminal: Optional[int] = retain_terminal
+        self.archive: Optional[OrderArchive] = archive
+        self.evicted: int = 0
+        self._orders_by_id: Dict[str, Order] = {}
+        self._orders_by_status: Dict[OrderStatus, Dict[str, Order]] = {status: {} for status in OrderStatus}
+        self._orders_by_pair: Dict[str, Dict[OrderStatus, Dict[str, Order]]] = {}
+        self._terminal: Deque[Order] = deque()
+
+    @property
+    def orders(self) -> List[Order]:
+        """Orders held in memory, in creation order."""
+        return list(self._orders_by_id.values())
+
+    @property
+    def active_trades(self) -> List[Order]:
+        """Currently active market orders."""
+        return list(self._orders_by_status[OrderStatus.ACTIVE].values())
+
+    def _index(self, order: Order) -> None:
+        """Add an order to the id, status and pair indexes.
+        
+        Args:
+            order: The Order instance to index
+        """
+        self._orders_by_id[order.order_id] = order
+        self._orders_by_status[order.status][order.order_id] = order
+        pair_index = self._orders_by_pair.get(order.pair)
+        if pair_index is None:
+            pair_index = self._orders_by_pair[order.pair] = {status: {} for status in OrderStatus}
+        pair_index[order.status][order.order_id] = order
+
+    def update_status(self, order: Order, status: OrderStatus) -> None:
+        """Change an order's status and move it between the status indexes.
+        
+        Args:
+            order: The Order instance to update
+            status: New status of the order
+        """
+        previous = order.status
+        if previous is status:
+            return
+        order_id = order.order_id
+        indexed = order_id in self._orders_by_id
+        if indexed:
+            self._orders_by_status[previous].pop(order_id, None)
+            self._orders_by_status[status][order_id] = order
+            pair_index = self._orders_by_pair[order.pair]
+            pair_index[previous].pop(order_id, None)
+            pair_index[status][order_id] = order
+        order.status = status
+        if indexed and self.retain_terminal is not None and status in self.TERMINAL_STATUSES:
+            self._terminal.append(order)
+            if len(self._terminal) > self.retain_terminal:
+                self._evict(self._terminal.popleft())
+
+    def _evict(self, order: Order) -> None:
+        """Move a terminal order out of the indexes and into the archive.
+        
+        Args:
+            order: Closed, cancelled or failed order to move
+        """
+        order_id = order.order_id
+        del self._orders_by_id[order_id]
+        del self._orders_by_status[order.status][order_id]
+        del self._orders_by_pair[order.pair][order.status][order_id]
+        if self.archive is not None:
+            self.archive.append(order)
+        self.evicted += 1
+
+    def compact(self, retain: int = 0) -> int:
+        """Move terminal orders out of memory now, keeping the most recent.
+        
+        Without a retention limit the terminal orders are not tracked in
+        order of completion, so they are moved by status (failed, then
+        cancelled, then closed), each in creation order.
+        
+        Args:
+            retain: Number of terminal orders to keep in memory
+            
+        Returns:
+            Number of orders moved out
+        """
+        if self.retain_terminal is None:
+            terminal = [order for status in (OrderStatus.FAILED, OrderStatus.CANCELLED, OrderStatus.CLOSED)
+                        for order in self._orders_by_status[status].values()]
+        else:
+            terminal = list(self._terminal)
+        split = max(0, len(terminal) - retain)
+        moved = terminal[:split]
+        if self.retain_terminal is not None:
+            self._terminal = deque(terminal[split:])
+        for order in moved:
+            self._evict(order)
+        if moved:
+            self.logger.info("Compacted %d terminal orders", len(moved))
+        return len(moved)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Capture the orders held in memory for a snapshot.
+        
+        Returns:
+            Picklable state: the orders in creation order, the ids of the
+            retained terminal orders in completion order and the eviction
+            count
+        """
+        return {"orders": list(self._orders_by_id.values()),
+                "terminal": [order.order_id for order in self._terminal],
+                "evicted": self.evicted}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Replace the orders held in memory with a captured state.
+        
+        The indexes are rebuilt from the orders. When this manager has a
+        retention limit, terminal orders beyond it are evicted as usual.
+        
+        Args:
+            state: State returned by ``get_state``
+        """
+        self._orders_by_id = {}
+        self._orders_by_status = {status: {} for status in OrderStatus}
+        self._orders_by_pair = {}
+        for order in state["orders"]:
+            self._index(order)
+        self.evicted = state["evicted"]
+        self._terminal = deque()
+        if self.retain_terminal is not None:
+            listed = set(state["terminal"])
+            self._terminal.extend(order for order in self._orders_by_id.values()
+                                  if order.status in self.TERMINAL_STATUSES and order.order_id not in listed)
+            self._terminal.extend(self._orders_by_id[order_id] for order_id in state["terminal"]
+                                  if order_id in self._orders_by_id)
+            while len(self._terminal) > self.retain_terminal:
+                self._evict(self._terminal.popleft())
+        self.logger.info("Restored %d orders", len(self._orders_by_id))
 
     def create_order(self, side: str, amount: float, price: float, pair: str, order_type: str = "market") -> Order:
         """Create a new order and add it to the order list.
@@ -91,10 +475,42 @@ class OrderManager:
             The newly created Order instance
         """
         order = Order(side=side, amount=amount, price=price, pair=pair, order_type=order_type)
-        self.orders.append(order)
-        self.logger.info(f"Order created: {order}")
+        self._index(order)
+        self.logger.debug("Order created: %s", order)
         return order
 
+    def _validate(self, order: Order) -> Optional[str]:
+        """Apply the validation rules, marking the order VALIDATED or FAILED.
+        
+        Args:
+            order: The Order instance to validate
+            
+        Returns:
+            Why the order was rejected, or None if it is valid
+        """
+        if order.amount <= 0:
+            self.update_status(order, OrderStatus.FAILED)
+            return "amount must be positive"
+        self.update_status(order, OrderStatus.VALIDATED)
+        return None
+
+    def _execute(self, order: Order) -> bool:
+        """Start a validated order: market orders become active, limit orders pending.
+        
+        Args:
+            order: The Order instance to execute
+            
+        Returns:
+            True if the order was validated, False otherwise
+        """
+        if order.status != OrderStatus.VALIDATED:
+            return False
+        if order.order_type == "market":
+            self.update_status(order, OrderStatus.ACTIVE)
+        elif order.order_type == "limit":
+            self.update_status(order, OrderStatus.PENDING)
+        return True
+
     def validate_order(self, order: Order) -> bool:
         """Validate an order based on predefined criteria.
         
@@ -104,12 +520,11 @@ class OrderManager:
         Returns:
             True if validation passes, False otherwise
         """
-        if order.amount <= 0:
-            order.status = OrderStatus.FAILED
-            self.logger.error(f"Order validation failed for {order.order_id}: amount must be positive.")
+        reason = self._validate(order)
+        if reason is not None:
+            self.logger.error("Order validation failed for %s: %s.", order.order_id, reason)
             return False
-        order.status = OrderStatus.VALIDATED
-        self.logger.info(f"Order validated: {order.order_id}")
+        self.logger.debug("Order validated: %s", order.order_id)
         return True
 
     def execute_order(self, order: Order) -> bool:
@@ -121,18 +536,30 @@ class OrderManager:
         Returns:
             True if execution starts successfully, False otherwise
         """
-        if order.status == OrderStatus.VALIDATED:
-            if order.order_type == "market":
-                order.status = OrderStatus.ACTIVE
-                self.active_trades.append(order)
-                self.logger.info(f"Market order activated: {order}")
-            elif order.order_type == "limit":
-                order.status = OrderStatus.PENDING
-                self.logger.info(f"Limit order pending execution: {order}")
-            return True
-        else:
-            self.logger.error(f"Order not validated and cannot be executed: {order}")
+        if not self._execute(order):
+            self.logger.error("Order not validated and cannot be executed: %s", order)
             return False
+        if order.status == OrderStatus.ACTIVE:
+            self.logger.info("Market order activated: %s", order)
+        elif order.status == OrderStatus.PENDING:
+            self.logger.info("Limit order pending execution: %s", order)
+        return True
+
+    def fill_order(self, order: Order) -> bool:
+        """Activate a pending limit order once it has been filled.
+        
+        Args:
+            order: The Order instance that was filled
+            
+        Returns:
+            True if the order was pending and is now active, False otherwise
+        """
+        if order.status == OrderStatus.PENDING:
+            self.update_status(order, OrderStatus.ACTIVE)
+            self.logger.info("Limit order filled: %s", order)
+            return True
+        self.logger.warning("Cannot fill order not in pending status: %s", order)
+        return False
 
     def close_order(self, order: Order) -> bool:
         """Close an active order.
@@ -144,12 +571,11 @@ class OrderManager:
             True if order was closed successfully, False otherwise
         """
         if order.status == OrderStatus.ACTIVE:
-            order.status = OrderStatus.CLOSED
-            self.active_trades = [o for o in self.active_trades if o.order_id != order.order_id]
-            self.logger.info(f"Order closed: {order}")
+            self.update_status(order, OrderStatus.CLOSED)
+            self.logger.info("Order closed: %s", order)
             return True
         else:
-            self.logger.warning(f"Cannot close order not in active status: {order}")
+            self.logger.warning("Cannot close order not in active status: %s", order)
             return False
 
     def cancel_order(self, order: Order) -> bool:
@@ -162,20 +588,115 @@ class OrderManager:
             True if order was cancelled successfully, False otherwise
         """
         if order.status in [OrderStatus.CREATED, OrderStatus.VALIDATED, OrderStatus.PENDING]:
-            order.status = OrderStatus.CANCELLED
-            self.logger.info(f"Order cancelled: {order}")
+            self.update_status(order, OrderStatus.CANCELLED)
+            self.logger.info("Order cancelled: %s", order)
             return True
-        self.logger.warning(f"Order cannot be cancelled (already active, executed, or failed): {order}")
+        self.logger.warning("Order cannot be cancelled (already active, executed, or failed): %s", order)
         return False
 
+    def place_orders(self, requests: Iterable[Dict[str, Any]]) -> List[Order]:
+        """Create, validate and execute a batch of orders in one pass.
+        
+        Each request holds the ``create_order`` arguments (side, amount,
+        price, pair and optionally order_type). Orders go through the same
+        rules as ``validate_order`` and ``execute_order`` and rejected ones
+        are marked FAILED, but only summary lines are logged for the batch.
+        
+        Args:
+            requests: Order parameters, one dictionary per order
+            
+        Returns:
+            The orders that passed validation and were executed
+        """
+        placed = []
+        rejected: Dict[str, int] = {}
+        for request in requests:
+            order = Order(side=request["side"], amount=request["amount"], price=request["price"],
+                          pair=request["pair"], order_type=request.get("order_type", "market"))
+            self._index(order)
+            reason = self._validate(order)
+            if reason is not None:
+                rejected[reason] = rejected.get(reason, 0) + 1
+                continue
+            self._execute(order)
+            placed.append(order)
+        for reason, count in rejected.items():
+            self.logger.error("Order batch: %d orders failed validation (%s).", count, reason)
+        self.logger.info("Order batch placed: %d orders", len(placed))
+        return placed
+
+    def cancel_orders(self, predicate: Optional[Callable[[Order], bool]] = None,
+                      pair: Optional[str] = None) -> List[Order]:
+        """Cancel every cancellable order matching a predicate.
+        
+        Only created, validated and pending orders are considered, using the
+        status indexes rather than scanning all orders.
+        
+        Args:
+            predicate: Function selecting the orders to cancel (all if None)
+            pair: Only consider orders for this trading pair
+            
+        Returns:
+            The cancelled orders
+        """
+        candidates = [order for status in (OrderStatus.CREATED, OrderStatus.VALIDATED, OrderStatus.PENDING)
+                      for order in self.list_orders(status, pair)]
+        cancelled = [order for order in candidates if predicate is None or predicate(order)]
+        for order in cancelled:
+            self.update_status(order, OrderStatus.CANCELLED)
+        self.logger.info("Order batch cancelled: %d orders", len(cancelled))
+        return cancelled
+
+    def close_all(self, pair: Optional[str] = None, side: Optional[str] = None) -> List[Order]:
+        """Close every active order, optionally filtered by pair and side.
+        
+        Args:
+            pair: Only close orders for this trading pair
+            side: Only close orders on this side ('buy' or 'sell')
+            
+        Returns:
+            The closed orders
+        """
+        closed = [order for order in self.list_orders(OrderStatus.ACTIVE, pair) if side is None or order.side == side]
+        for order in closed:
+            self.update_status(order, OrderStatus.CLOSED)
+        self.logger.info("Order batch closed: %d orders", len(closed))
+        return closed
+
+    def list_orders(self, status: Optional[OrderStatus] = None, pair: Optional[str] = None,
+                    include_archived: bool = False) -> List[Order]:
+        """Get orders filtered by status and/or pair.
+        
+        Args:
+            status: Only return orders with this status (any status if None)
+            pair: Only return orders for this trading pair (any pair if None)
+            include_archived: Also scan the archive, whose matching orders
+                come first
+            
+        Returns:
+            List of matching Order instances
+        """
+        archived = (self.archive.list_orders(status, pair)
+                    if include_archived and self.archive is not None else [])
+        if pair is None:
+            if status is None:
+                return archived + self.orders
+            return archived + list(self._orders_by_status[status].values())
+        pair_index = self._orders_by_pair.get(pair)
+        if pair_index is None:
+            return archived
+        if status is None:
+            return archived + [order for bucket in pair_index.values() for order in bucket.values()]
+        return archived + list(pair_index[status].values())
+
     def list_active_trades(self) -> List[Order]:
         """Get all currently active trades.
         
         Returns:
             List of Order instances with ACTIVE status
         """
-        active_trades = [order for order in self.orders if order.status == OrderStatus.ACTIVE]
-        self.logger.info(f"Listing active trades: {active_trades}")
+        active_trades = self.list_orders(OrderStatus.ACTIVE)
+        self.logger.debug("Listing %d active trades", len(active_trades))
         return active_trades
 
     def list_pending_orders(self) -> List[Order]:
@@ -184,24 +705,28 @@ class OrderManager:
         Returns:
             List of Order instances with PENDING status
         """
-        pending_orders = [order for order in self.orders if order.status == OrderStatus.PENDING]
-        self.logger.info(f"Listing pending orders: {pending_orders}")
+        pending_orders = self.list_orders(OrderStatus.PENDING)
+        self.logger.debug("Listing %d pending orders", len(pending_orders))
         return pending_orders
 
-    def get_order_by_id(self, order_id: str) -> Optional[Order]:
+    def get_order_by_id(self, order_id: str, include_archived: bool = False) -> Optional[Order]:
         """Find an order by its unique identifier.
         
         Args:
             order_id: The unique identifier of the order to find
+            include_archived: Also search the archive (a file scan) when the
+                order is not in memory
             
         Returns:
-            The Order instance if found, None otherwise
+            The Order instance if found, None otherwise; archived orders are
+            rebuilt from the archive
         """
-        for order in self.orders:
-            if order.order_id == order_id:
-                return order
-        self.logger.warning(f"Order ID {order_id} not found.")
-        return None
+        order = self._orders_by_id.get(order_id)
+        if order is None and include_archived and self.archive is not None:
+            order = self.archive.get(order_id)
+        if order is None:
+            self.logger.warning("Order ID %s not found.", order_id)
+        return order
     
     def __repr__(self) -> str:
         """Return a string representation of the OrderManager."""
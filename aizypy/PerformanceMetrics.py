@@ -0,0 +1,303 @@
+import math
+from array import array
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+class PerformanceMetrics:
+    """Streaming performance analytics of a trading run.
+
+    Every statistic is updated in O(1) as events happen, so it can be read
+    at any point of a run without rescanning the trade history:
+
+    * ``open_position`` and ``close_position`` track open trades and
+      realized profit/loss, wins, losses and profit factor.
+    * ``update`` marks open positions to a new price and samples the
+      equity (realized plus unrealized profit/loss) once per candle, for
+      the equity curve, drawdown, Sharpe/Sortino ratios and exposure.
+
+    Unrealized profit/loss is kept per pair as a net position and a signed
+    sum of entry prices (``net * price - entry_sum``), so marking to a new
+    price costs the same however many trades are open. Like the rest of
+    the framework, profit/loss is measured in price units per trade.
+
+    Attributes:
+        periods_per_year: Candles per year used to annualize Sharpe and
+            Sortino (None to report them per candle)
+        realized: Profit/loss of closed trades
+        unrealized: Profit/loss of open trades at the latest prices
+        trades: Number of closed trades
+        wins: Closed trades with a positive profit/loss
+        losses: Closed trades with a negative profit/loss
+        gross_profit: Sum of the profits of winning trades
+        gross_loss: Sum of the losses of losing trades (negative)
+        open_positions: Number of open trades
+        candles: Number of equity samples taken
+        peak: Highest equity seen
+        max_drawdown: Largest fall of equity from a previous peak
+        equity_curve: Equity after each candle (empty unless kept)
+    """
+
+    def __init__(self, periods_per_year: Optional[float] = None, keep_equity_curve: bool = True) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            periods_per_year: Candles per year, e.g. ``525_600 / interval``
+                for candles of ``interval`` minutes
+            keep_equity_curve: Whether to store the equity of every candle
+                (8 bytes each)
+        """
+        self.periods_per_year: Optional[float] = periods_per_year
+        self.keep_equity_curve: bool = keep_equity_curve
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every trade, position and sample."""
+        self.realized: float = 0.0
+        self.unrealized: float = 0.0
+        self.trades: int = 0
+        self.wins: int = 0
+        self.losses: int = 0
+        self.gross_profit: float = 0.0
+        self.gross_loss: float = 0.0
+        self.open_positions: int = 0
+        self.candles: int = 0
+        self.peak: float = 0.0
+        self.max_drawdown: float = 0.0
+        self.equity_curve: array = array("d")
+        # Per pair: [net position, signed sum of entry prices, last price]
+        self._books: Dict[Optional[Hashable], List[float]] = {}
+        self._exposed: int = 0
+        self._last_equity: float = 0.0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._downside: float = 0.0
+
+    @classmethod
+    def from_arrays(cls, equity: 'np.ndarray', open_positions: 'np.ndarray', profit_loss: 'np.ndarray',
+                    periods_per_year: Optional[float] = None,
+                    keep_equity_curve: bool = True) -> 'PerformanceMetrics':
+        """Build the metrics of a finished run computed in bulk.
+
+        The accumulators are set from whole arrays, so the result reports
+        what streaming ``update``, ``open_position`` and ``close_position``
+        calls would have for a run whose trades are all closed, up to
+        floating point rounding.
+
+        Args:
+            equity: Equity sampled at each candle
+            open_positions: Number of open trades at each candle's sample
+            profit_loss: Profit/loss of every closed trade
+            periods_per_year: Candles per year used to annualize ratios
+            keep_equity_curve: Whether to store ``equity`` as the curve
+
+        Returns:
+            Metrics as at the end of the run
+        """
+        import numpy as np  # Only bulk runs need NumPy; live bots never load it
+        metrics = cls(periods_per_year, keep_equity_curve)
+        equity = np.asarray(equity, dtype=float)
+        profit_loss = np.asarray(profit_loss, dtype=float)
+        metrics.realized = float(profit_loss.sum())
+        metrics.trades = len(profit_loss)
+        wins, losses = profit_loss[profit_loss > 0], profit_loss[profit_loss < 0]
+        metrics.wins, metrics.losses = len(wins), len(losses)
+        metrics.gross_profit, metrics.gross_loss = float(wins.sum()), float(losses.sum())
+        metrics.candles = len(equity)
+        if metrics.candles:
+            # The peak starts at zero, the equity before the first candle
+            peaks = np.maximum.accumulate(np.maximum(equity, 0.0))
+            metrics.peak = float(peaks[-1])
+            metrics.max_drawdown = float((peaks - equity).max())
+            changes = np.diff(equity, prepend=0.0)
+            metrics._mean = float(changes.mean())
+            metrics._m2 = float(np.square(changes - metrics._mean).sum())
+            metrics._downside = float(np.square(changes[changes < 0]).sum())
+            metrics._exposed = int(np.count_nonzero(open_positions))
+            metrics._last_equity = float(equity[-1])
+        if keep_equity_curve:
+            metrics.equity_curve = array("d", equity.tobytes())
+        return metrics
+
+    @property
+    def equity(self) -> float:
+        """Realized plus unrealized profit/loss."""
+        return self.realized + self.unrealized
+
+    def _book(self, pair: Optional[Hashable], price: float) -> List[float]:
+        """Get the position book of a pair, creating it at a price.
+
+        Args:
+            pair: Trading pair (None for single-instrument runs)
+            price: Price to mark a new book at
+
+        Returns:
+            The mutable [net, entry_sum, price] book
+        """
+        book = self._books.get(pair)
+        if book is None:
+            book = self._books[pair] = [0, 0.0, price]
+        return book
+
+    def open_position(self, side: str, entry_price: float, pair: Optional[Hashable] = None) -> None:
+        """Record a trade being opened.
+
+        Args:
+            side: 'buy' for a long trade, 'sell' for a short one
+            entry_price: Price the trade was opened at
+            pair: Trading pair, matching the one passed to ``update``
+        """
+        sign = 1 if side == "buy" else -1
+        book = self._book(pair, entry_price)
+        book[0] += sign
+        book[1] += sign * entry_price
+        self.unrealized += sign * (book[2] - entry_price)
+        self.open_positions += 1
+
+    def close_position(self, side: str, entry_price: float, exit_price: Optional[float] = None,
+                       pair: Optional[Hashable] = None) -> float:
+        """Record a trade being closed.
+
+        Args:
+            side: Side the trade was opened with
+            entry_price: Price the trade was opened at
+            exit_price: Price the trade was closed at (defaults to the
+                latest price of the pair)
+            pair: Trading pair, matching the one passed to ``open_position``
+
+        Returns:
+            Profit/loss of the trade
+        """
+        sign = 1 if side == "buy" else -1
+        book = self._book(pair, entry_price if exit_price is None else exit_price)
+        if exit_price is None:
+            exit_price = book[2]
+        book[0] -= sign
+        book[1] -= sign * entry_price
+        self.unrealized -= sign * (book[2] - entry_price)
+        if self.open_positions:
+            self.open_positions -= 1
+        profit_loss = sign * (exit_price - entry_price)
+        self.realized += profit_loss
+        self.trades += 1
+        if profit_loss > 0:
+            self.wins += 1
+            self.gross_profit += profit_loss
+        elif profit_loss < 0:
+            self.losses += 1
+            self.gross_loss += profit_loss
+        return profit_loss
+
+    def update(self, price: float, pair: Optional[Hashable] = None) -> None:
+        """Mark open positions to a new price and sample the equity.
+
+        Call once per candle, with its close price.
+
+        Args:
+            price: Latest price of the pair
+            pair: Trading pair (None for single-instrument runs)
+        """
+        book = self._books.get(pair)
+        if book is None:
+            self._books[pair] = [0, 0.0, price]
+        else:
+            self.unrealized += book[0] * (price - book[2])
+            book[2] = price
+
+        equity = self.realized + self.unrealized
+        change = equity - self._last_equity
+        self._last_equity = equity
+        self.candles += 1
+        # Welford's online mean and variance of per-candle equity changes
+        delta = change - self._mean
+        self._mean += delta / self.candles
+        self._m2 += delta * (change - self._mean)
+        if change < 0:
+            self._downside += change * change
+        if self.open_positions:
+            self._exposed += 1
+        if equity > self.peak:
+            self.peak = equity
+        elif self.peak - equity > self.max_drawdown:
+            self.max_drawdown = self.peak - equity
+        if self.keep_equity_curve:
+            self.equity_curve.append(equity)
+
+    def _annualize(self, ratio: float) -> float:
+        """Scale a per-candle ratio to a yearly one when the period is known."""
+        return ratio * math.sqrt(self.periods_per_year) if self.periods_per_year else ratio
+
+    @property
+    def sharpe(self) -> float:
+        """Mean over standard deviation of per-candle equity changes."""
+        if self.candles < 2 or self._m2 <= 0:
+            return 0.0
+        return self._annualize(self._mean / math.sqrt(self._m2 / (self.candles - 1)))
+
+    @property
+    def sortino(self) -> float:
+        """Mean over downside deviation of per-candle equity changes."""
+        if not self.candles or self._downside <= 0:
+            return 0.0
+        return self._annualize(self._mean / math.sqrt(self._downside / self.candles))
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of closed trades with a profit."""
+        return self.wins / self.trades if self.trades else 0.0
+
+    @property
+    def profit_factor(self) -> float:
+        """Gross profit over gross loss (inf when there is no loss)."""
+        if self.gross_loss:
+            return self.gross_profit / -self.gross_loss
+        return math.inf if self.gross_profit else 0.0
+
+    @property
+    def exposure(self) -> float:
+        """Fraction of candles with at least one open trade."""
+        return self._exposed / self.candles if self.candles else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get every metric at this point of the run.
+
+        Returns:
+            Dictionary of equity, profit/loss, drawdown, ratios, trade
+            statistics and exposure
+        """
+        return {
+            "equity": self.equity,
+            "realized": self.realized,
+            "unrealized": self.unrealized,
+            "max_drawdown": self.max_drawdown,
+            "sharpe": self.sharpe,
+            "sortino": self.sortino,
+            "trades": self.trades,
+            "win_rate": self.win_rate,
+            "profit_factor": self.profit_factor,
+            "exposure": self.exposure,
+            "open_positions": self.open_positions,
+        }
+
+    def format(self) -> str:
+        """Render the snapshot as plain-text lines.
+
+        Returns:
+            One 'Name: value' line per metric
+        """
+        ratio = "annualized" if self.periods_per_year else "per candle"
+        return "\n".join([
+            f"Equity: {self.equity:.2f} (realized {self.realized:.2f}, unrealized {self.unrealized:.2f})",
+            f"Max Drawdown: {self.max_drawdown:.2f}",
+            f"Sharpe Ratio ({ratio}): {self.sharpe:.2f}",
+            f"Sortino Ratio ({ratio}): {self.sortino:.2f}",
+            f"Win Rate: {self.win_rate:.1%} of {self.trades} trades",
+            f"Profit Factor: {self.profit_factor:.2f}",
+            f"Exposure: {self.exposure:.1%} of {self.candles} candles",
+        ])
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        return (f"PerformanceMetrics(equity={self.equity:.2f}, max_drawdown={self.max_drawdown:.2f}, "
+                f"sharpe={self.sharpe:.2f}, trades={self.trades})")
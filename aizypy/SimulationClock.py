@@ -0,0 +1,111 @@
+import asyncio
+import heapq
+import itertools
+from typing import Any, Awaitable, Callable, List, Tuple
+
+class SimulatedClock:
+    """Virtual clock used to drive discrete-event backtests.
+
+    In ``fast`` mode time jumps straight to the next event without any real
+    waiting, so throughput is bounded only by the work done per event. In
+    ``paced`` mode the clock sleeps for the simulated gap divided by
+    ``speed``, replaying the session at N times real time.
+
+    Times are integer epoch milliseconds, matching CandleData timestamps.
+
+    Attributes:
+        now: Current simulated time
+        mode: Either 'fast' or 'paced'
+        speed: Replay multiplier used in paced mode
+    """
+
+    MODES = ("fast", "paced")
+
+    def __init__(self, start: int, mode: str = "fast", speed: float = 1.0) -> None:
+        """Initialize the simulated clock.
+
+        Args:
+            start: Simulated time at which the clock starts
+            mode: Either 'fast' (no real sleeping) or 'paced' (N x real time)
+            speed: Replay multiplier for paced mode (e.g. 60.0 replays one
+                simulated minute per real second)
+
+        Raises:
+            ValueError: If the mode is unknown or speed is not positive
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown clock mode '{mode}', expected one of {self.MODES}")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.now: int = start
+        self.mode: str = mode
+        self.speed: float = speed
+
+    def reset(self, start: int) -> None:
+        """Move the clock to a new starting time.
+
+        Args:
+            start: Simulated time to restart from
+        """
+        self.now = start
+
+    async def advance_to(self, when: int) -> None:
+        """Move the clock forward to the given simulated time.
+
+        Args:
+            when: Simulated time to advance to; earlier times are ignored
+        """
+        if when <= self.now:
+            return
+        if self.mode == "paced":
+            await asyncio.sleep((when - self.now) / 1000 / self.speed)
+        self.now = when
+
+class EventQueue:
+    """Time-ordered queue of simulation events.
+
+    Events are async callables scheduled at a simulated time. Running the
+    queue pops events in time order (ties keep scheduling order), advances
+    the clock to each event and awaits it. Events may schedule further
+    events, which lets a data feed enqueue only its next candle instead of
+    the whole session.
+
+    Attributes:
+        clock: Clock advanced as events are processed
+        processed: Number of events executed so far
+    """
+
+    def __init__(self, clock: SimulatedClock) -> None:
+        """Initialize an empty event queue.
+
+        Args:
+            clock: Clock to advance while processing events
+        """
+        self.clock: SimulatedClock = clock
+        self.processed: int = 0
+        self._heap: List[Tuple[int, int, Callable[..., Awaitable[None]], Tuple[Any, ...]]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Return the number of events still waiting to run."""
+        return len(self._heap)
+
+    def schedule(self, when: int, callback: Callable[..., Awaitable[None]], *args: Any) -> None:
+        """Schedule an async callback at a simulated time.
+
+        Args:
+            when: Simulated time at which the callback fires
+            callback: Async function to await when the event fires
+            *args: Positional arguments passed to the callback
+        """
+        heapq.heappush(self._heap, (when, next(self._sequence), callback, args))
+
+    async def run(self) -> None:
+        """Process events in time order until the queue is empty."""
+        heap = self._heap
+        clock = self.clock
+        while heap:
+            when, _, callback, args = heapq.heappop(heap)
+            await clock.advance_to(when)
+            await callback(*args)
+            self.processed += 1
@@ -1,33 +1,69 @@
-from typing import Type, List, Dict, Union, Optional, Callable, Any
-import random
+from typing import Type, List, Dict, Union, Optional, Callable, Any, Iterable, Iterator, Sequence
 import asyncio
-from datetime import datetime, timedelta
+import contextlib
+import functools
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from .AizyBot import AizyBot
 from .CandleData import CandleData
-from .OrderManager import Order
+from .FanOut import FanOut
+from .MarketGenerator import UniformGenerator
+from .MatchingEngine import MatchingEngine
+from .OrderManager import Order, OrderStatus
+from .PerformanceMetrics import PerformanceMetrics
+from .SimulationClock import SimulatedClock, EventQueue
+from .TradeLog import TradeLog
 
 class MockWebSocket:
     """Mock WebSocket implementation for testing trading bots.
     
     Simulates WebSocket functionality for testing purposes, including
-    connection management, data emission, and order tracking.
+    connection management, data emission, and order tracking. Data is
+    emitted through a FanOut, so several subscribers are handed each
+    candle concurrently and a timeout in one of them does not affect the
+    others. An exception raised by a subscriber propagates out of
+    ``emit_data`` and fails the backtest.
     
     Attributes:
         connected: Connection status
+        fanout: Dispatcher delivering emitted data to the subscribers
         subscribers: List of callback functions for data updates
         orders: List of active orders
         closed_orders: List of closed orders
         on_order: Callback for new order events
         on_close_order: Callback for order closure events
+        on_cancel_order: Callback for order cancellation events
+        verbose: Whether every order received is printed
     """
     
-    def __init__(self) -> None:
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """Initialize the mock WebSocket.
+        
+        Args:
+            timeout: Seconds a subscriber may take to handle one candle
+                before it is cancelled (None for no limit)
+        """
+        self.verbose: bool = True
         self.connected: bool = False
-        self.subscribers: List[Callable] = []
-        self.orders: List[Order] = []
+        self.fanout: FanOut = FanOut(timeout=timeout, isolate_errors=False)
+        self._open_orders: Dict[str, Order] = {}
         self.closed_orders: List[Order] = []
         self.on_order: Optional[Callable[[Order], None]] = None
         self.on_close_order: Optional[Callable[[Order], None]] = None
+        self.on_cancel_order: Optional[Callable[[Order], None]] = None
+
+    @property
+    def subscribers(self) -> List[Callable]:
+        """Callbacks subscribed to data updates."""
+        return self.fanout.subscribers
+
+    @property
+    def orders(self) -> List[Order]:
+        """Orders sent and not yet closed or cancelled, in sending order."""
+        return list(self._open_orders.values())
 
     async def connect(self) -> bool:
         """Simulate WebSocket connection."""
@@ -45,16 +81,15 @@ class MockWebSocket:
         Args:
             callback: Function to be called when new data arrives
         """
-        self.subscribers.append(callback)
+        self.fanout.subscribe(callback)
 
     async def emit_data(self, data: Any) -> None:
-        """Emit data to all subscribers.
+        """Emit data to all subscribers concurrently and wait until they handled it.
         
         Args:
             data: Data to be sent to subscribers
         """
-        for subscriber in self.subscribers:
-            await subscriber(data)
+        await self.fanout.deliver(data)
 
     async def send_order(self, order: Order) -> None:
         """Record and process new orders.
@@ -62,8 +97,9 @@ class MockWebSocket:
         Args:
             order: New order to be processed
         """
-        self.orders.append(order)
-        print(f"WebSocket received new order: {order}")
+        self._open_orders[order.order_id] = order
+        if self.verbose:
+            print(f"WebSocket received new order: {order}")
         if self.on_order:
             self.on_order(order)
 
@@ -73,13 +109,56 @@ class MockWebSocket:
         Args:
             order: Order to be closed
         """
-        if order in self.orders:
-            self.orders.remove(order)
+        if self._open_orders.pop(order.order_id, None) is not None:
             self.closed_orders.append(order)
-            print(f"WebSocket received close order: {order}")
+            if self.verbose:
+                print(f"WebSocket received close order: {order}")
             if self.on_close_order:
                 self.on_close_order(order)
 
+    async def send_orders(self, orders: List[Order]) -> None:
+        """Record and process a batch of new orders sent in one message.
+        
+        Args:
+            orders: New orders to be processed
+        """
+        for order in orders:
+            self._open_orders[order.order_id] = order
+        if self.verbose:
+            print(f"WebSocket received batch of {len(orders)} new orders")
+        if self.on_order:
+            for order in orders:
+                self.on_order(order)
+
+    async def send_close_orders(self, orders: List[Order]) -> None:
+        """Record and process a batch of order closures sent in one message.
+        
+        Args:
+            orders: Orders to be closed
+        """
+        open_orders = self._open_orders
+        orders = [order for order in orders if open_orders.pop(order.order_id, None) is not None]
+        self.closed_orders.extend(orders)
+        if self.verbose:
+            print(f"WebSocket received batch of {len(orders)} close orders")
+        if self.on_close_order:
+            for order in orders:
+                self.on_close_order(order)
+
+    async def send_cancel_orders(self, orders: List[Order]) -> None:
+        """Record and process a batch of order cancellations sent in one message.
+        
+        Args:
+            orders: Orders to be cancelled
+        """
+        for order in orders:
+            self._open_orders.pop(order.order_id, None)
+        if self.verbose:
+            print(f"WebSocket received batch of {len(orders)} cancel orders")
+        if self.on_cancel_order:
+            for order in orders:
+                self.on_cancel_order(order)
+
 class TestEngine:
     """Engine for testing trading bot implementations.
     
@@ -89,34 +168,80 @@ class TestEngine:
     Attributes:
         duration: Test duration in intervals
         interval: Time between market updates in minutes
-        trade_log: Record of completed trades
+        trade_log: Columnar record of completed trades (see TradeLog)
         forced_trade_log: Record of trades forcibly closed at test end
+        metrics: Streaming performance metrics (equity, drawdown, ratios),
+            updated as trades open and close and at each candle
+        report: 'trades' to print every trade, 'aggregate' to print
+            totals only
         profit_loss: Cumulative profit/loss
         mock_ws: Mock WebSocket instance for communication
         bot_instance: Instance of the bot being tested
         current_price: Current simulated market price
-        current_timestamp: Current simulated time
+        current_timestamp: Current simulated time in epoch milliseconds
         open_trade_times: Dictionary tracking trade opening times
+        clock: Simulated clock driving the backtest
+        event_queue: Discrete-event queue feeding candles to the bot
+        matching_engine: Book of resting limit orders, filled as each
+            candle's range crosses them
+        data_source: Optional iterable of historical candles to replay
+        seed: Seed for the default random market data
     """
     
-    def __init__(self, bot_class: Type[AizyBot], duration: int = 60, interval: int = 1) -> None:
+    REPORT_MODES = ("trades", "aggregate")
+
+    def __init__(self, bot_class: Type[AizyBot], duration: Optional[int] = None, interval: int = 1,
+                 mode: str = "fast", speed: float = 1.0,
+                 data_source: Optional[Iterable[CandleData]] = None, seed: Optional[int] = None,
+                 report: str = "trades", spill_threshold: int = 100_000) -> None:
         """Initialize the test engine.
         
         Args:
             bot_class: Class of the trading bot to test
-            duration: Test duration in intervals
+            duration: Test duration in intervals. Defaults to 60 for random
+                data and to the whole source when replaying ``data_source``
             interval: Time between market updates in minutes
+            mode: Clock mode, 'fast' to run with no real sleeping or 'paced'
+                to replay at ``speed`` times real time
+            speed: Replay multiplier used in paced mode
+            data_source: Iterable of CandleData in chronological order (e.g. a
+                CSVCandleSource or BinaryCandleSource) replayed instead of
+                random data (see MarketGenerator for seeded synthetic markets)
+            seed: Seed for the default random data, making runs reproducible
+            report: 'trades' to print every order and trade as it happens
+                and in the summary, 'aggregate' to print only totals (use it
+                for runs with many trades)
+            spill_threshold: Trades kept in memory per log before older ones
+                are written to a temporary CSV file (0 to keep all in memory)
+            
+        Raises:
+            ValueError: If the report mode is unknown
         """
-        self.duration: int = duration
+        if report not in self.REPORT_MODES:
+            raise ValueError(f"Unknown report mode '{report}', expected one of {self.REPORT_MODES}")
+        if duration is None and data_source is None:
+            duration = 60
+        self.duration: Optional[int] = duration
+        self.data_source: Optional[Iterable[CandleData]] = data_source
+        self.seed: Optional[int] = seed
         self.interval: int = interval
-        self.trade_log: List[Dict[str, Union[str, float, int]]] = []
-        self.forced_trade_log: List[Dict[str, Union[str, float, int]]] = []
+        self.report: str = report
+        self.trade_log: TradeLog = TradeLog(spill_threshold)
+        self.forced_trade_log: TradeLog = TradeLog(spill_threshold)
+        self._closing_log: TradeLog = self.trade_log
         self.profit_loss: float = 0.0
+        self.metrics: PerformanceMetrics = PerformanceMetrics(periods_per_year=525_600 / interval)
         self.mock_ws: MockWebSocket = MockWebSocket()
+        self.mock_ws.verbose = report == "trades"
         self.bot_instance: AizyBot = bot_class(websocket=self.mock_ws)
         self.current_price: float = 0.0
-        self.current_timestamp: datetime = datetime(2024, 1, 1)
-        self.open_trade_times: Dict[str, datetime] = {}
+        self.start_timestamp: int = CandleData.to_epoch_ms(datetime(2024, 1, 1))
+        self.current_timestamp: int = self.start_timestamp
+        self.open_trade_times: Dict[str, int] = {}
+        self.clock: SimulatedClock = SimulatedClock(self.start_timestamp, mode, speed)
+        self.event_queue: EventQueue = EventQueue(self.clock)
+        self.matching_engine: MatchingEngine = MatchingEngine()
+        self._candles: Iterator[CandleData] = iter(())
 
     async def run(self) -> None:
         """Execute the test sequence.
@@ -125,51 +250,89 @@ class TestEngine:
         """
         self.mock_ws.on_order = self.handle_new_order
         self.mock_ws.on_close_order = self.handle_close_order
+        self.mock_ws.on_cancel_order = self.handle_cancel_order
         
         await self.bot_instance.bot_setup()
         await self.mock_ws.connect()
         await self.simulate_market_data()
+        await self.bot_instance.websocket_handler.drain()
         await self.close_all_trades()
         await self.mock_ws.disconnect()
+        await self.bot_instance.websocket_handler.close()
         
         self.display_summary()
         self.check_for_active_trade_alerts()
+        if self.bot_instance.tracer:
+            print("\n=== Latency (sampled) ===")
+            print(self.bot_instance.tracer.format_report())
 
     async def simulate_market_data(self) -> None:
-        """Generate and emit simulated market data.
+        """Emit market data to the bot.
         
-        Creates random price movements and candle data for testing.
+        Candles come from ``data_source`` when one is given, otherwise they
+        are generated randomly. They are fed through the discrete-event
+        queue: each emitted candle schedules the next one at its timestamp on
+        the simulated clock, so no real time passes between candles unless
+        the clock is paced.
         """
-        for _ in range(self.duration):
-            open_price = random.uniform(1000, 2000)
-            close_price = open_price * random.uniform(0.95, 1.05)
-            high_price = max(open_price, close_price) * random.uniform(1.0, 1.02)
-            low_price = min(open_price, close_price) * random.uniform(0.98, 1.0)
-            volume = random.uniform(10, 100)
-
-            candle_data = CandleData(
-                timestamp=self.current_timestamp,
-                open=open_price,
-                high=high_price,
-                low=low_price,
-                close=close_price,
-                volume=volume
-            )
-
-            self.current_price = close_price
-            await self.mock_ws.emit_data(candle_data)
-            self.current_timestamp += timedelta(minutes=self.interval)
-            await asyncio.sleep(0.1)
+        source = self.data_source if self.data_source is not None else self.generate_candles()
+        self._candles = iter(source) if self.duration is None else itertools.islice(source, self.duration)
+
+        first = next(self._candles, None)
+        if first is not None:
+            if self.data_source is not None:
+                self.start_timestamp = first.timestamp
+                self.clock.reset(first.timestamp)
+            self.event_queue.schedule(first.timestamp, self._emit_candle, first)
+        await self.event_queue.run()
+
+    def generate_candles(self) -> Iterator[CandleData]:
+        """Generate random candles for runs without a data source.
+        
+        Returns:
+            Iterator over independent uniform candles spaced one interval
+            apart, reproducible when a seed is set
+        """
+        return iter(UniformGenerator(start=self.start_timestamp, interval=self.interval,
+                                     count=self.duration, seed=self.seed,
+                                     block_size=min(self.duration or 65536, 65536)))
+
+    async def _emit_candle(self, candle_data: CandleData) -> None:
+        """Emit one candle and schedule the next one on the event queue.
+        
+        Args:
+            candle_data: Candle to send to the bot
+        """
+        self.current_timestamp = self.clock.now
+        if self.matching_engine:
+            for order in self.matching_engine.match(candle_data.high, candle_data.low):
+                # The bot's fill succeeds exactly when the order is still pending;
+                # opening the trade here first lets on_order_filled close it at once
+                if order.status is OrderStatus.PENDING:
+                    self.handle_fill(order)
+                    await self.bot_instance.fill_order(order)
+        self.current_price = candle_data.close
+        self.metrics.update(candle_data.close)
+        await self.mock_ws.emit_data(candle_data)
+
+        next_candle = next(self._candles, None)
+        if next_candle is not None:
+            self.event_queue.schedule(next_candle.timestamp, self._emit_candle, next_candle)
+        else:
+            self.current_timestamp += self.interval * 60_000
 
     async def close_all_trades(self) -> None:
         """Close all remaining trades at test end.
         
-        Forcibly closes any trades still open when the test completes.
+        Forcibly closes any trades still open when the test completes and
+        records them in ``forced_trade_log``.
         """
-        active_trades = self.bot_instance.list_active_trades()
-        for trade in active_trades:
-            await self.bot_instance.close_trade(trade)
-            self.forced_trade_log.append(self.trade_log.pop())
+        self._closing_log = self.forced_trade_log
+        try:
+            for trade in self.bot_instance.list_active_trades():
+                await self.bot_instance.close_trade(trade)
+        finally:
+            self._closing_log = self.trade_log
 
     def record_trade(self, trade: Order, exit_price: float) -> None:
         """Record trade details and update performance metrics.
@@ -188,57 +351,104 @@ class TestEngine:
         }
         self.profit_loss += profit_loss
         self.trade_log.append(trade_data)
-        print("Recorded trade:", trade_data)
+        if self.report == "trades":
+            print("Recorded trade:", trade_data)
+
+    def summary(self) -> Dict[str, Union[int, float]]:
+        """Compute the aggregate statistics reported by display_summary.
+        
+        Returns:
+            Dictionary with trade counts, profit/loss, average duration and
+            the performance metrics (max drawdown, Sharpe, Sortino, win
+            rate, profit factor and exposure)
+        """
+        natural_pl = self.trade_log.profit_loss
+        forced_pl = self.forced_trade_log.profit_loss
+        natural_trades = len(self.trade_log)
+        return {
+            "natural_trades": natural_trades,
+            "natural_profit_loss": natural_pl,
+            "average_duration": self.trade_log.total_duration / natural_trades if natural_trades else 0.0,
+            "forced_closes": len(self.forced_trade_log),
+            "forced_profit_loss": forced_pl,
+            "total_trades": natural_trades + len(self.forced_trade_log),
+            "total_profit_loss": natural_pl + forced_pl,
+            "max_drawdown": self.metrics.max_drawdown,
+            "sharpe": self.metrics.sharpe,
+            "sortino": self.metrics.sortino,
+            "win_rate": self.metrics.win_rate,
+            "profit_factor": self.metrics.profit_factor,
+            "exposure": self.metrics.exposure,
+        }
 
     def display_summary(self) -> None:
-        """Display comprehensive test results and statistics."""
+        """Display comprehensive test results and statistics.
+        
+        Every trade is listed in 'trades' report mode; in 'aggregate' mode
+        only the totals, win rate and best and worst trades are printed.
+        """
         natural_trades = self.trade_log
-        natural_pl = sum(t['profit_loss'] for t in natural_trades)
-        avg_duration = sum(t['duration_intervals'] for t in natural_trades) / len(natural_trades) if natural_trades else 0
+        natural_pl = natural_trades.profit_loss
+        avg_duration = natural_trades.total_duration / len(natural_trades) if natural_trades else 0
+        detailed = self.report == "trades"
 
         print("\n=== Natural Trading Performance (excluding forced closes) ===")
         print(f"Total Trades: {len(natural_trades)}")
         print(f"Total Profit/Loss: {natural_pl:.2f}")
         print(f"Average Trade Duration: {avg_duration:.1f} intervals")
+        if not detailed and natural_trades:
+            stats = natural_trades.summary()
+            print(f"Win Rate: {stats['win_rate']:.1%}")
+            print(f"Average Profit/Loss: {stats['average_profit_loss']:.2f}")
+            print(f"Best Trade: {stats['best']:.2f}, Worst Trade: {stats['worst']:.2f}")
         
-        print("\nDetailed Natural Trades:")
-        for trade in natural_trades:
-            print(f"Trade {trade['trade_id'][:8]}... - "
-                  f"{trade['side'].upper()} - "
-                  f"Entry: {trade['entry_price']:.2f}, "
-                  f"Exit: {trade['exit_price']:.2f}, "
-                  f"P/L: {trade['profit_loss']:.2f}, "
-                  f"Duration: {trade['duration_intervals']:.0f} intervals "
-                  f"(from {trade['open_interval']} to {trade['close_interval']})")
+        if detailed:
+            print("\nDetailed Natural Trades:")
+            for trade in natural_trades:
+                print(f"Trade {trade['trade_id']} - "
+                      f"{trade['side'].upper()} - "
+                      f"Entry: {trade['entry_price']:.2f}, "
+                      f"Exit: {trade['exit_price']:.2f}, "
+                      f"P/L: {trade['profit_loss']:.2f}, "
+                      f"Duration: {trade['duration_intervals']:.0f} intervals "
+                      f"(from {trade['open_interval']} to {trade['close_interval']})")
 
         if self.forced_trade_log:
-            forced_pl = sum(t['profit_loss'] for t in self.forced_trade_log)
+            forced_pl = self.forced_trade_log.profit_loss
             print("\n=== Forced Closes at Test End ===")
             print(f"Forced Closes: {len(self.forced_trade_log)}")
             print(f"Forced Close P/L: {forced_pl:.2f}")
             
-            print("\nDetailed Forced Closes:")
-            for trade in self.forced_trade_log:
-                print(f"Trade {trade['trade_id'][:8]}... - "
-                      f"{trade['side'].upper()} - "
-                      f"Entry: {trade['entry_price']:.2f}, "
-                      f"Exit: {trade['exit_price']:.2f}, "
-                      f"P/L: {trade['profit_loss']:.2f}, "
-                      f"Duration: {trade['duration_intervals']:.0f} intervals")
+            if detailed:
+                print("\nDetailed Forced Closes:")
+                for trade in self.forced_trade_log:
+                    print(f"Trade {trade['trade_id']} - "
+                          f"{trade['side'].upper()} - "
+                          f"Entry: {trade['entry_price']:.2f}, "
+                          f"Exit: {trade['exit_price']:.2f}, "
+                          f"P/L: {trade['profit_loss']:.2f}, "
+                          f"Duration: {trade['duration_intervals']:.0f} intervals")
 
         print("\n=== Overall Statistics (including forced closes) ===")
         total_trades = len(natural_trades) + len(self.forced_trade_log)
-        total_pl = natural_pl + sum(t['profit_loss'] for t in self.forced_trade_log)
+        total_pl = natural_pl + self.forced_trade_log.profit_loss
         print(f"Total Trades: {total_trades}")
         print(f"Total Profit/Loss: {total_pl:.2f}")
         print(f"Orders still open on WebSocket: {len(self.mock_ws.orders)}")
         print(f"Orders closed on WebSocket: {len(self.mock_ws.closed_orders)}")
 
+        print("\n=== Performance Metrics (including forced closes) ===")
+        print(self.metrics.format())
+
     def check_for_active_trade_alerts(self) -> None:
-        """Check and report any trades still active at test end."""
+        """Report trades still active at test end and candles the bot timed out on."""
         active_trades = self.bot_instance.list_active_trades()
         websocket_orders = len(self.mock_ws.orders)
         
+        for name, stats in self.mock_ws.fanout.stats().items():
+            if stats["timeouts"]:
+                print(f"\n[ALERT] {name} timed out on {stats['timeouts']} candles (see the log).")
+        
         if active_trades:
             print("\n[ALERT] There are still active trades remaining at the end of the test.")
             print(f"Active Trades Count: {len(active_trades)}")
@@ -248,26 +458,135 @@ class TestEngine:
                 print("[WARNING] Mismatch between active trades and WebSocket orders!")
 
     @classmethod
-    async def test(cls, bot_class: Type[AizyBot], duration: int = 60, interval: int = 1) -> None:
+    async def test(cls, bot_class: Type[AizyBot], duration: Optional[int] = None, interval: int = 1,
+                   mode: str = "fast", speed: float = 1.0,
+                   data_source: Optional[Iterable[CandleData]] = None, seed: Optional[int] = None,
+                   report: str = "trades") -> None:
         """Class method to create and run a test instance.
         
         Args:
             bot_class: Class of the trading bot to test
-            duration: Test duration in intervals
+            duration: Test duration in intervals (defaults to 60 for random
+                data and to the whole source when replaying ``data_source``)
             interval: Time between market updates in minutes
+            mode: Clock mode, 'fast' (no real sleeping) or 'paced'
+            speed: Replay multiplier used in paced mode
+            data_source: Iterable of historical or synthetic CandleData to replay
+            seed: Seed for the default random data
+            report: 'trades' to print every trade, 'aggregate' for totals only
         """
-        engine = cls(bot_class, duration, interval)
+        engine = cls(bot_class, duration, interval, mode, speed, data_source, seed, report)
         await engine.run()
 
+    @classmethod
+    async def sweep(cls, bot_factory: Callable[..., AizyBot], param_grid: Dict[str, Sequence[Any]],
+                    data_source: Optional[Iterable[CandleData]] = None, workers: Optional[int] = None,
+                    duration: Optional[int] = None, interval: int = 1, seed: Optional[int] = None,
+                    include_trades: bool = False) -> List[Dict[str, Any]]:
+        """Backtest every parameter combination in parallel over a process pool.
+        
+        Each combination of ``param_grid`` is passed as keyword arguments to
+        ``bot_factory`` and run as an independent fast-mode backtest in a
+        worker process, with its console output suppressed. Only the summary
+        statistics are sent back to the parent unless ``include_trades`` is
+        set.
+        
+        ``bot_factory``, ``data_source`` and the parameter values must be
+        picklable: use a module-level bot class or ``functools.partial``
+        rather than a lambda. Without a data source every run uses the same
+        seeded random data so results are comparable.
+        
+        Args:
+            bot_factory: Bot class or factory accepting the swept parameters
+                and a ``websocket`` keyword argument
+            param_grid: Mapping of parameter name to the values to try
+            data_source: Candles replayed by every run (see CandleSource)
+            workers: Number of worker processes (defaults to every core)
+            duration: Number of candles per run
+            interval: Time between candles in minutes
+            seed: Seed for the default random data (defaults to 0)
+            include_trades: Also return each run's trade logs
+            
+        Returns:
+            One result dictionary per combination, in grid order, holding
+            the parameters, the summary statistics, the candle count and the
+            wall time of the run
+        """
+        names = list(param_grid)
+        combinations = [dict(zip(names, values)) for values in itertools.product(*(param_grid[n] for n in names))]
+        seed = 0 if seed is None and data_source is None else seed
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = [
+                loop.run_in_executor(pool, _run_sweep_case, cls, bot_factory, params, data_source,
+                                     duration, interval, seed, include_trades)
+                for params in combinations
+            ]
+            return list(await asyncio.gather(*futures))
+
+    @staticmethod
+    def format_sweep_table(results: List[Dict[str, Any]], sort_by: str = "total_profit_loss") -> str:
+        """Render sweep results as a plain-text table.
+        
+        Args:
+            results: Results returned by sweep
+            sort_by: Column to sort by, in descending order
+            
+        Returns:
+            The formatted table
+        """
+        if not results:
+            return ""
+        columns = [name for name in results[0]["params"]] + [
+            "total_trades", "total_profit_loss", "natural_profit_loss", "average_duration", "max_drawdown", "sharpe",
+            "candles", "seconds"
+        ]
+        rows = sorted(results, key=lambda r: r.get(sort_by, r["params"].get(sort_by, 0)), reverse=True)
+        cells = [[_format_cell(row["params"][c] if c in row["params"] else row[c]) for c in columns] for row in rows]
+        widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+        lines = ["  ".join(c.rjust(w) for c, w in zip(columns, widths))]
+        lines.append("  ".join("-" * w for w in widths))
+        lines.extend("  ".join(v.rjust(w) for v, w in zip(r, widths)) for r in cells)
+        return "\n".join(lines)
+
     def handle_new_order(self, order: Order) -> None:
         """Process new order events.
         
+        Limit orders rest in the matching engine until a candle crosses
+        their price; other orders open at the current price.
+        
         Args:
             order: New order being opened
         """
+        if order.order_type == "limit":
+            self.matching_engine.add(order)
+            return
         order.entry_price = self.current_price
         self.open_trade_times[order.order_id] = self.current_timestamp
-        print(f"New trade opened at interval {self.get_interval_number()} - Price: {order.entry_price:.2f}")
+        self.metrics.open_position(order.side, order.entry_price)
+        if self.report == "trades":
+            print(f"New trade opened at interval {self.get_interval_number()} - Price: {order.entry_price:.2f}")
+
+    def handle_fill(self, order: Order) -> None:
+        """Open the trade of a limit order filled by the matching engine.
+        
+        Args:
+            order: Limit order filled at its price
+        """
+        order.entry_price = order.price
+        self.open_trade_times[order.order_id] = self.current_timestamp
+        self.metrics.open_position(order.side, order.entry_price)
+        if self.report == "trades":
+            print(f"Limit order filled at interval {self.get_interval_number()} - Price: {order.entry_price:.2f}")
+
+    def handle_cancel_order(self, order: Order) -> None:
+        """Process order cancellation events.
+        
+        Args:
+            order: Order being cancelled
+        """
+        self.matching_engine.cancel(order)
+        self.open_trade_times.pop(order.order_id, None)
 
     def handle_close_order(self, order: Order) -> None:
         """Process order closure events.
@@ -280,9 +599,8 @@ class TestEngine:
         
         open_time = self.open_trade_times.get(order.order_id)
         duration_intervals = 0
-        if open_time:
-            duration = self.current_timestamp - open_time
-            duration_intervals = duration.total_seconds() / (60 * self.interval)
+        if open_time is not None:
+            duration_intervals = (self.current_timestamp - open_time) / (60_000 * self.interval)
             del self.open_trade_times[order.order_id]
         
         trade_data = {
@@ -292,24 +610,64 @@ class TestEngine:
             "exit_price": exit_price,
             "profit_loss": profit_loss,
             "duration_intervals": duration_intervals,
-            "open_interval": self.get_interval_number(open_time) if open_time else 0,
+            "open_interval": self.get_interval_number(open_time) if open_time is not None else 0,
             "close_interval": self.get_interval_number()
         }
         
         self.profit_loss += profit_loss
-        self.trade_log.append(trade_data)
-        print(f"Trade closed at interval {self.get_interval_number()} - "
-              f"Entry: {order.entry_price:.2f}, Exit: {exit_price:.2f}, "
-              f"P/L: {profit_loss:.2f}, Duration: {duration_intervals:.0f} intervals")
+        self.metrics.close_position(order.side, order.entry_price, exit_price)
+        self._closing_log.append(trade_data)
+        if self.report == "trades":
+            print(f"Trade closed at interval {self.get_interval_number()} - "
+                  f"Entry: {order.entry_price:.2f}, Exit: {exit_price:.2f}, "
+                  f"P/L: {profit_loss:.2f}, Duration: {duration_intervals:.0f} intervals")
 
-    def get_interval_number(self, timestamp: Optional[datetime] = None) -> int:
+    def get_interval_number(self, timestamp: Optional[int] = None) -> int:
         """Convert timestamp to interval number.
         
         Args:
-            timestamp: Time to convert (defaults to current timestamp)
+            timestamp: Time to convert in epoch milliseconds (defaults to
+                current timestamp)
             
         Returns:
             Zero-based interval number
         """
-        ts = timestamp or self.current_timestamp
-        return int((ts - datetime(2024, 1, 1)).total_seconds() / (60 * self.interval))
+        ts = self.current_timestamp if timestamp is None else timestamp
+        return int((ts - self.start_timestamp) / (60_000 * self.interval))
+
+
+def _format_cell(value: Any) -> str:
+    """Format one sweep table cell."""
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+def _run_sweep_case(engine_class: Type[TestEngine], bot_factory: Callable[..., AizyBot], params: Dict[str, Any],
+                    data_source: Optional[Iterable[CandleData]], duration: Optional[int], interval: int,
+                    seed: Optional[int], include_trades: bool) -> Dict[str, Any]:
+    """Run one sweep combination inside a worker process.
+    
+    Args:
+        engine_class: TestEngine class (or subclass) to run
+        bot_factory: Bot class or factory accepting the parameters
+        params: Parameter values for this run
+        data_source: Candles to replay, or None for seeded random data
+        duration: Number of candles
+        interval: Time between candles in minutes
+        seed: Seed for the default random data
+        include_trades: Whether to return the trade logs
+        
+    Returns:
+        Result dictionary for this combination
+    """
+    started = time.perf_counter()
+    engine = engine_class(functools.partial(bot_factory, **params), duration, interval,
+                          data_source=data_source, seed=seed, report="aggregate")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        asyncio.run(engine.run())
+    result: Dict[str, Any] = {"params": params}
+    result.update(engine.summary())
+    result["candles"] = engine.event_queue.processed
+    result["seconds"] = time.perf_counter() - started
+    if include_trades:
+        result["trade_log"] = list(engine.trade_log)
+        result["forced_trade_log"] = list(engine.forced_trade_log)
+    return result
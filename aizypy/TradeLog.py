@@ -0,0 +1,253 @@
+import contextlib
+import csv
+import itertools
+import os
+import tempfile
+import weakref
+from array import array
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+import numpy as np
+
+TradeRecord = Dict[str, Union[str, float, int]]
+
+class TradeLog:
+    """Columnar record of completed trades.
+
+    Each field is kept in its own typed array (``array('d')`` for prices,
+    profit/loss and durations, ``array('q')`` for trade ids and intervals,
+    one byte for the side) instead of one dict per trade, which takes about a quarter
+    of the memory. Running totals are updated on every append, so counts,
+    profit/loss and averages never scan the trades.
+
+    Once ``spill_threshold`` trades are held in memory they are appended to
+    a CSV file and the arrays are cleared, so a log of any length uses
+    bounded memory. Iterating the log reads the spilled trades back from
+    disk followed by the ones in memory, yielding the same dicts as before.
+
+    Trade ids must be numeric strings, like the ids of OrderIdGenerator;
+    they are stored as 64-bit integers and given back as strings.
+
+    Attributes:
+        spill_threshold: Trades held in memory before spilling to disk
+        spill_path: CSV file holding the spilled trades (None until the
+            first spill unless given)
+        spilled: Number of trades written to the spill file
+        profit_loss: Sum of the profit/loss of every trade
+        wins: Number of trades with a positive profit/loss
+        total_duration: Sum of the durations of every trade, in intervals
+        best: Largest profit/loss (None when empty)
+        worst: Smallest profit/loss (None when empty)
+    """
+
+    COLUMNS = ("trade_id", "side", "entry_price", "exit_price", "profit_loss",
+               "duration_intervals", "open_interval", "close_interval")
+    DTYPES = {"trade_id": np.int64, "side": np.int8, "open_interval": np.int64, "close_interval": np.int64}
+    READ_CHUNK = 65_536
+
+    def __init__(self, spill_threshold: int = 100_000, spill_path: Optional[str] = None) -> None:
+        """Initialize an empty trade log.
+
+        Args:
+            spill_threshold: Trades held in memory before they are written to
+                disk (0 to never spill)
+            spill_path: CSV file to spill to; a temporary file, removed with
+                the log, is used when None
+
+        Raises:
+            ValueError: If spill_threshold is negative
+        """
+        if spill_threshold < 0:
+            raise ValueError("spill_threshold must not be negative")
+        self.spill_threshold: int = spill_threshold
+        self.spill_path: Optional[str] = spill_path
+        self.spilled: int = 0
+        self.profit_loss: float = 0.0
+        self.wins: int = 0
+        self.total_duration: float = 0.0
+        self.best: Optional[float] = None
+        self.worst: Optional[float] = None
+        self._trade_ids: array = array("q")
+        self._sides: array = array("b")
+        self._entry_prices: array = array("d")
+        self._exit_prices: array = array("d")
+        self._profit_losses: array = array("d")
+        self._durations: array = array("d")
+        self._open_intervals: array = array("q")
+        self._close_intervals: array = array("q")
+
+    def __len__(self) -> int:
+        """Return the number of recorded trades."""
+        return self.spilled + len(self._trade_ids)
+
+    def __bool__(self) -> bool:
+        """Return whether any trade was recorded."""
+        return len(self) > 0
+
+    def append(self, trade: Mapping[str, Any]) -> None:
+        """Record one completed trade.
+
+        Args:
+            trade: Trade fields keyed by column name; missing durations and
+                intervals count as 0
+        """
+        if self.spill_threshold and len(self._trade_ids) >= self.spill_threshold:
+            self.spill()
+        profit_loss = trade["profit_loss"]
+        duration = trade.get("duration_intervals", 0)
+        self._trade_ids.append(int(trade["trade_id"]))
+        self._sides.append(1 if trade["side"] == "buy" else -1)
+        self._entry_prices.append(trade["entry_price"])
+        self._exit_prices.append(trade["exit_price"])
+        self._profit_losses.append(profit_loss)
+        self._durations.append(duration)
+        self._open_intervals.append(trade.get("open_interval", 0))
+        self._close_intervals.append(trade.get("close_interval", 0))
+        self.profit_loss += profit_loss
+        self.total_duration += duration
+        if profit_loss > 0:
+            self.wins += 1
+        if self.best is None or profit_loss > self.best:
+            self.best = profit_loss
+        if self.worst is None or profit_loss < self.worst:
+            self.worst = profit_loss
+
+    def spill(self) -> None:
+        """Append the trades held in memory to the spill file and clear them."""
+        if not self._trade_ids:
+            return
+        if self.spill_path is None:
+            fd, self.spill_path = tempfile.mkstemp(prefix="aizypy-trades-", suffix=".csv")
+            os.close(fd)
+            weakref.finalize(self, _remove_file, self.spill_path)
+        write_header = self.spilled == 0
+        with open(self.spill_path, "w" if write_header else "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(self.COLUMNS)
+            writer.writerows(zip(self._trade_ids, ("buy" if s > 0 else "sell" for s in self._sides),
+                                 self._entry_prices, self._exit_prices, self._profit_losses,
+                                 self._durations, self._open_intervals, self._close_intervals))
+        self.spilled += len(self._trade_ids)
+        for column in (self._trade_ids, self._sides, self._entry_prices, self._exit_prices, self._profit_losses,
+                       self._durations, self._open_intervals, self._close_intervals):
+            del column[:]
+
+    def __iter__(self) -> Iterator[TradeRecord]:
+        """Iterate over every trade in recording order.
+
+        Yields:
+            One dict per trade, keyed by column name
+        """
+        if self.spilled:
+            with open(self.spill_path, "r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader)
+                for trade_id, side, entry, exit_, pl, duration, opened, closed in reader:
+                    yield {"trade_id": trade_id, "side": side, "entry_price": float(entry),
+                           "exit_price": float(exit_), "profit_loss": float(pl),
+                           "duration_intervals": float(duration), "open_interval": int(opened),
+                           "close_interval": int(closed)}
+        for i in range(len(self._trade_ids)):
+            yield self._row(i)
+
+    def __getitem__(self, index: int) -> TradeRecord:
+        """Get one trade; spilled trades are read back from disk.
+
+        No index of the spill file is kept, so looking up a spilled trade
+        reads the file up to it (O(n)); iterate or use ``columns`` to
+        access many trades.
+
+        Args:
+            index: Position of the trade, negative values count from the end
+
+        Returns:
+            The trade as a dict keyed by column name
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trade log index out of range")
+        if index >= self.spilled:
+            return self._row(index - self.spilled)
+        for position, trade in enumerate(self):
+            if position == index:
+                return trade
+        raise IndexError("trade log index out of range")
+
+    def _row(self, i: int) -> TradeRecord:
+        """Build the dict of a trade held in memory.
+
+        Args:
+            i: Position in the in-memory arrays
+
+        Returns:
+            The trade as a dict keyed by column name
+        """
+        return {"trade_id": str(self._trade_ids[i]), "side": "buy" if self._sides[i] > 0 else "sell",
+                "entry_price": self._entry_prices[i], "exit_price": self._exit_prices[i],
+                "profit_loss": self._profit_losses[i], "duration_intervals": self._durations[i],
+                "open_interval": self._open_intervals[i], "close_interval": self._close_intervals[i]}
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Load every trade as one array per column.
+
+        Spilled trades are read from the spill file in chunks of
+        ``READ_CHUNK`` rows straight into the result arrays, followed by the
+        trades in memory; the log itself is not changed.
+
+        Returns:
+            Mapping of column name to a numpy array; ``side`` holds +1 for
+            buys and -1 for sells
+        """
+        result = {name: np.empty(len(self), dtype=self.DTYPES.get(name, np.float64)) for name in self.COLUMNS}
+        start = 0
+        if self.spilled:
+            with open(self.spill_path, "r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader)
+                while start < self.spilled:
+                    chunk = list(itertools.islice(reader, self.READ_CHUNK))
+                    if not chunk:
+                        break
+                    end = start + len(chunk)
+                    for name, values in zip(self.COLUMNS, zip(*chunk)):
+                        if name == "side":
+                            values = [1 if side == "buy" else -1 for side in values]
+                        result[name][start:end] = values
+                    start = end
+        for name, column in zip(self.COLUMNS, (self._trade_ids, self._sides, self._entry_prices,
+                                               self._exit_prices, self._profit_losses, self._durations,
+                                               self._open_intervals, self._close_intervals)):
+            result[name][start:] = column
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        """Get the running totals of the log.
+
+        Returns:
+            Trade count, total and average profit/loss, win rate, best and
+            worst trade and average duration in intervals
+        """
+        count = len(self)
+        return {
+            "trades": count,
+            "profit_loss": self.profit_loss,
+            "average_profit_loss": self.profit_loss / count if count else 0.0,
+            "win_rate": self.wins / count if count else 0.0,
+            "best": self.best or 0.0,
+            "worst": self.worst or 0.0,
+            "average_duration": self.total_duration / count if count else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the log."""
+        return f"TradeLog(trades={len(self)}, spilled={self.spilled}, profit_loss={self.profit_loss:.2f})"
+
+
+def _remove_file(path: str) -> None:
+    """Delete a temporary spill file if it still exists."""
+    with contextlib.suppress(OSError):
+        os.remove(path)
@@ -0,0 +1,370 @@
+import asyncio
+import contextlib
+import itertools
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+import numpy as np
+from .AizyBot import AizyBot
+from .CandleData import CandleData
+from .CandleSeries import CandleWindow
+from .CandleSource import BinaryCandleSource
+from .MarketGenerator import MarketGenerator, UniformGenerator
+from .PerformanceMetrics import PerformanceMetrics
+from .TestEngine import TestEngine
+
+class VectorTestEngine:
+    """Vectorized backtester for strategies expressible over whole arrays.
+
+    Instead of awaiting ``bot_action`` once per candle, the strategy is a
+    signal function that maps the full OHLCV columns to one order signal
+    per candle: +1 opens a buy, -1 opens a sell and 0 does nothing. Trades
+    are accounted exactly as in TestEngine: each order opens a unit trade
+    at that candle's close, trades held for ``holding`` candles close at
+    the close of their exit candle, and trades still open at the end are
+    force-closed at the final close one interval after the last candle.
+    Entries, exits, profit/loss and the summary statistics are computed
+    with NumPy in a few passes over the arrays.
+
+    Strategies that trade on state changes (such as "buy when price moves
+    above the average unless already long") can build their signal with
+    ``changes``. ``cross_check`` replays the same data through the
+    event-driven TestEngine with an equivalent bot and compares the trades.
+
+    Attributes:
+        signal: Function mapping a CandleWindow to per-candle order signals
+        params: Keyword arguments passed to the signal function
+        duration: Number of candles
+        interval: Time between candles in minutes
+        holding: Candles each trade is held for (None to hold to the end)
+        data_source: Candles to test on (see TestEngine)
+        seed: Seed for the default random market data
+        candles: OHLCV columns of the test data, loaded by ``load``
+        timestamps: Candle timestamps in epoch milliseconds
+        signals: Order signal of each candle, set by ``run``
+        trades: Columnar trade log, set by ``run``
+        metrics: Performance metrics of the run, set by ``run`` and
+            computed like TestEngine's (equity sampled at each candle's
+            close before the strategy acts on it)
+    """
+
+    def __init__(self, signal: Callable[..., np.ndarray], duration: Optional[int] = None, interval: int = 1,
+                 data_source: Optional[Iterable[CandleData]] = None, seed: Optional[int] = None,
+                 holding: Optional[int] = None, **params: Any) -> None:
+        """Initialize the vectorized test engine.
+
+        Args:
+            signal: Function taking a CandleWindow (plus ``params``) and
+                returning one order signal per candle (+1, -1 or 0)
+            duration: Number of candles. Defaults to 60 for random data and
+                to the whole source when ``data_source`` is given
+            interval: Time between candles in minutes
+            data_source: Iterable of CandleData in chronological order;
+                BinaryCandleSource and MarketGenerator sources are read as
+                arrays without creating CandleData objects
+            seed: Seed for the default random data
+            holding: Number of candles each trade is held before closing
+                (None holds every trade until the end of the test)
+            **params: Keyword arguments for the signal function
+
+        Raises:
+            ValueError: If holding is not positive
+        """
+        if duration is None and data_source is None:
+            duration = 60
+        if holding is not None and holding <= 0:
+            raise ValueError("holding must be positive")
+        self.signal: Callable[..., np.ndarray] = signal
+        self.params: Dict[str, Any] = params
+        self.duration: Optional[int] = duration
+        self.interval: int = interval
+        self.holding: Optional[int] = holding
+        self.data_source: Optional[Iterable[CandleData]] = data_source
+        self.seed: Optional[int] = seed
+        self.start_timestamp: int = CandleData.to_epoch_ms(datetime(2024, 1, 1))
+        self.candles: Optional[CandleWindow] = None
+        self.timestamps: np.ndarray = np.empty(0, dtype=np.int64)
+        self.signals: np.ndarray = np.empty(0, dtype=np.int8)
+        self.trades: Dict[str, np.ndarray] = {}
+        self.metrics: PerformanceMetrics = PerformanceMetrics(periods_per_year=525_600 / interval)
+
+    def load(self) -> CandleWindow:
+        """Load the test data as NumPy columns.
+
+        Returns:
+            CandleWindow of open, high, low, close and volume arrays
+        """
+        source = self.data_source
+        if source is None:
+            source = UniformGenerator(start=self.start_timestamp, interval=self.interval, count=self.duration,
+                                      seed=self.seed, block_size=min(self.duration or 65536, 65536))
+        limit = self.duration
+        if isinstance(source, BinaryCandleSource):
+            n = len(source) if limit is None else min(limit, len(source))
+            columns = {name: np.array(source.column(name)[:n])
+                       for name in ("timestamp", "open", "high", "low", "close", "volume")}
+        elif isinstance(source, MarketGenerator):
+            blocks, n = [], 0
+            for block in source.blocks():
+                blocks.append(block)
+                n += len(block["close"])
+                if limit is not None and n >= limit:
+                    break
+            n = n if limit is None else min(n, limit)
+            columns = {name: np.concatenate([b[name] for b in blocks])[:n] if blocks else np.empty(0)
+                       for name in ("open", "high", "low", "close", "volume")}
+            columns["timestamp"] = source.start + np.arange(n, dtype=np.int64) * (source.interval * 60_000)
+        else:
+            rows = iter(source) if limit is None else itertools.islice(source, limit)
+            rows = np.array([candle.to_row() for candle in rows], dtype=float).reshape(-1, 6)
+            columns = {name: np.ascontiguousarray(rows[:, i])
+                       for i, name in enumerate(("timestamp", "open", "high", "low", "close", "volume"))}
+            columns["timestamp"] = columns["timestamp"].astype(np.int64)
+        self.timestamps = columns["timestamp"]
+        if len(self.timestamps):
+            self.start_timestamp = int(self.timestamps[0])
+        self.candles = CandleWindow(columns["open"], columns["high"], columns["low"],
+                                    columns["close"], columns["volume"])
+        return self.candles
+
+    @staticmethod
+    def changes(state: np.ndarray) -> np.ndarray:
+        """Turn a desired-direction series into order signals.
+
+        An order is emitted wherever the sign of ``state`` differs from the
+        last non-zero sign before it, mirroring a bot that tracks its
+        ``last_position`` and only trades when the direction changes. Zero
+        and NaN entries mean "no opinion" and never trade.
+
+        Args:
+            state: Desired direction of each candle (sign is used)
+
+        Returns:
+            Int8 array of order signals (+1, -1 or 0)
+        """
+        direction = np.sign(np.nan_to_num(np.asarray(state, dtype=float))).astype(np.int8)
+        positions = np.flatnonzero(direction)
+        values = direction[positions]
+        keep = np.ones(len(values), dtype=bool)
+        keep[1:] = values[1:] != values[:-1]
+        signals = np.zeros(len(direction), dtype=np.int8)
+        signals[positions[keep]] = values[keep]
+        return signals
+
+    def run(self) -> Dict[str, Union[int, float]]:
+        """Run the backtest.
+
+        Returns:
+            Summary statistics, with the same keys as TestEngine.summary
+
+        Raises:
+            ValueError: If the signal function returns the wrong shape
+        """
+        candles = self.load() if self.candles is None else self.candles
+        closes = candles.close
+        n = len(closes)
+        # NaN (e.g. indicator warm-up from compute) means no order; casting it to int8 is undefined
+        signals = np.nan_to_num(np.asarray(self.signal(candles, **self.params), dtype=float))
+        self.signals = np.sign(signals).astype(np.int8)
+        if self.signals.shape != (n,):
+            raise ValueError(f"Signal function returned shape {self.signals.shape}, expected ({n},)")
+
+        entries = np.flatnonzero(self.signals)
+        sides = self.signals[entries]
+        step = 60_000 * self.interval
+        end_timestamp = int(self.timestamps[-1]) + step if n else self.start_timestamp
+        if self.holding is None:
+            exits = np.full(len(entries), n)
+        else:
+            exits = np.minimum(entries + self.holding, n)
+        forced = exits >= n
+        natural_exits = np.minimum(exits, n - 1)
+        exit_prices = np.where(forced, closes[-1] if n else 0.0, closes[natural_exits])
+        exit_timestamps = np.where(forced, end_timestamp, self.timestamps[natural_exits])
+        entry_prices = closes[entries]
+        self.trades = {
+            "entry_index": entries,
+            "exit_index": exits,
+            "side": sides,
+            "entry_price": entry_prices,
+            "exit_price": exit_prices,
+            "profit_loss": np.where(sides > 0, exit_prices - entry_prices, entry_prices - exit_prices),
+            "duration_intervals": (exit_timestamps - self.timestamps[entries]) / step,
+            "forced": forced,
+        }
+        self.metrics = self._metrics(closes, entries, exits, sides, entry_prices, self.trades["profit_loss"])
+        if not forced.all():
+            # Natural closes are logged in close order, like TestEngine
+            order = np.argsort(exits, kind="stable")
+            self.trades = {name: column[order] for name, column in self.trades.items()}
+        return self.summary()
+
+    def _metrics(self, closes: np.ndarray, entries: np.ndarray, exits: np.ndarray, sides: np.ndarray,
+                 entry_prices: np.ndarray, profit_loss: np.ndarray) -> PerformanceMetrics:
+        """Compute the performance metrics of the trades in bulk.
+
+        TestEngine samples the equity at each candle before the bot acts on
+        it, so a trade counts as open at the candles after its entry up to
+        and including its exit candle, and its profit/loss is realized from
+        the candle after. Forced closes happen after the last sample.
+
+        Args:
+            closes: Close price of each candle
+            entries: Entry candle of each trade
+            exits: Exit candle of each trade (the candle count if forced)
+            sides: +1 for buys, -1 for sells
+            entry_prices: Entry price of each trade
+            profit_loss: Profit/loss of each trade
+
+        Returns:
+            Metrics as at the end of the test
+        """
+        n = len(closes)
+        starts, ends = entries + 1, exits + 1
+
+        def opened(weights: Optional[np.ndarray] = None) -> np.ndarray:
+            """Sum of the weights of the trades open at each sample."""
+            return np.cumsum(np.bincount(starts, weights, n + 2) - np.bincount(ends, weights, n + 2))[:n]
+
+        natural = exits < n
+        realized = np.cumsum(np.bincount(ends[natural], profit_loss[natural], n + 2))[:n]
+        equity = realized + opened(sides.astype(float)) * closes - opened(sides * entry_prices)
+        return PerformanceMetrics.from_arrays(equity, opened(), profit_loss,
+                                              periods_per_year=525_600 / self.interval)
+
+    def summary(self) -> Dict[str, Union[int, float]]:
+        """Compute the statistics reported by display_summary.
+
+        Returns:
+            Dictionary with trade counts, profit/loss, average duration and
+            the performance metrics (max drawdown, Sharpe, Sortino, win
+            rate, profit factor and exposure)
+        """
+        forced = self.trades.get("forced", np.empty(0, dtype=bool))
+        profit_loss = self.trades.get("profit_loss", np.empty(0))
+        durations = self.trades.get("duration_intervals", np.empty(0))
+        natural = ~forced
+        natural_trades = int(natural.sum())
+        natural_pl = float(profit_loss[natural].sum())
+        forced_pl = float(profit_loss[forced].sum())
+        return {
+            "natural_trades": natural_trades,
+            "natural_profit_loss": natural_pl,
+            "average_duration": float(durations[natural].mean()) if natural_trades else 0.0,
+            "forced_closes": int(forced.sum()),
+            "forced_profit_loss": forced_pl,
+            "total_trades": len(forced),
+            "total_profit_loss": natural_pl + forced_pl,
+            "max_drawdown": self.metrics.max_drawdown,
+            "sharpe": self.metrics.sharpe,
+            "sortino": self.metrics.sortino,
+            "win_rate": self.metrics.win_rate,
+            "profit_factor": self.metrics.profit_factor,
+            "exposure": self.metrics.exposure,
+        }
+
+    def display_summary(self) -> None:
+        """Display the aggregate test results."""
+        stats = self.summary()
+        print("\n=== Natural Trading Performance (excluding forced closes) ===")
+        print(f"Total Trades: {stats['natural_trades']}")
+        print(f"Total Profit/Loss: {stats['natural_profit_loss']:.2f}")
+        print(f"Average Trade Duration: {stats['average_duration']:.1f} intervals")
+        if stats["forced_closes"]:
+            print("\n=== Forced Closes at Test End ===")
+            print(f"Forced Closes: {stats['forced_closes']}")
+            print(f"Forced Close P/L: {stats['forced_profit_loss']:.2f}")
+        print("\n=== Overall Statistics (including forced closes) ===")
+        print(f"Total Trades: {stats['total_trades']}")
+        print(f"Total Profit/Loss: {stats['total_profit_loss']:.2f}")
+        print("\n=== Performance Metrics (including forced closes) ===")
+        print(self.metrics.format())
+
+    def cross_check(self, bot_factory: Callable[..., AizyBot], tolerance: float = 1e-6) -> Dict[str, Any]:
+        """Compare this engine's trades with the event-driven TestEngine.
+
+        Runs ``cross_check_async`` with ``asyncio.run``, so it cannot be
+        called while an event loop is running (in Jupyter or async tests,
+        ``await engine.cross_check_async(...)`` instead).
+
+        Args:
+            bot_factory: Bot class or factory equivalent to the signal function
+            tolerance: Absolute tolerance for prices, P/L and durations
+
+        Returns:
+            The comparison report of ``cross_check_async``
+        """
+        return asyncio.run(self.cross_check_async(bot_factory, tolerance))
+
+    async def cross_check_async(self, bot_factory: Callable[..., AizyBot], tolerance: float = 1e-6) -> Dict[str, Any]:
+        """Compare this engine's trades with the event-driven TestEngine.
+
+        The loaded candles are replayed through TestEngine with a bot that
+        should implement the same strategy (console output is suppressed),
+        and the two trade logs are compared trade by trade.
+
+        Args:
+            bot_factory: Bot class or factory equivalent to the signal function
+            tolerance: Absolute tolerance for prices, P/L and durations
+
+        Returns:
+            Dictionary with ``match`` (bool), both summaries under
+            ``vector`` and ``event``, and a list of ``mismatches`` describing
+            the first differing trades
+        """
+        if not self.trades:
+            self.run()
+        candles = self.candles
+        data = [CandleData.from_ms(ts, o, h, l, c, v) for ts, o, h, l, c, v in zip(
+            self.timestamps.tolist(), candles.open.tolist(), candles.high.tolist(), candles.low.tolist(),
+            candles.close.tolist(), candles.volume.tolist())]
+        engine = TestEngine(bot_factory, interval=self.interval, data_source=data, report="aggregate")
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            await engine.run()
+
+        event_trades = list(engine.trade_log) + list(engine.forced_trade_log)
+        forced = self.trades["forced"]
+        vector_order = np.concatenate((np.flatnonzero(~forced), np.flatnonzero(forced)))
+        fields = ("entry_price", "exit_price", "profit_loss", "duration_intervals")
+        mismatches: List[str] = []
+        if len(event_trades) != len(vector_order):
+            mismatches.append(f"trade count: vector {len(vector_order)}, event {len(event_trades)}")
+        for number, (i, trade) in enumerate(zip(vector_order.tolist(), event_trades)):
+            side = "buy" if self.trades["side"][i] > 0 else "sell"
+            if trade["side"] != side:
+                mismatches.append(f"trade {number} side: vector {side}, event {trade['side']}")
+            for name in fields:
+                expected = float(self.trades[name][i])
+                if abs(trade[name] - expected) > tolerance:
+                    mismatches.append(f"trade {number} {name}: vector {expected}, event {trade[name]}")
+            if len(mismatches) >= 10:
+                break
+        return {
+            "match": not mismatches,
+            "vector": self.summary(),
+            "event": engine.summary(),
+            "mismatches": mismatches,
+        }
+
+    @classmethod
+    def test(cls, signal: Callable[..., np.ndarray], duration: Optional[int] = None, interval: int = 1,
+             data_source: Optional[Iterable[CandleData]] = None, seed: Optional[int] = None,
+             holding: Optional[int] = None, **params: Any) -> 'VectorTestEngine':
+        """Class method to create, run and summarize a vectorized test.
+
+        Args:
+            signal: Function returning per-candle order signals
+            duration: Number of candles (see __init__)
+            interval: Time between candles in minutes
+            data_source: Candles to test on
+            seed: Seed for the default random data
+            holding: Candles each trade is held (None to hold to the end)
+            **params: Keyword arguments for the signal function
+
+        Returns:
+            The finished engine, for inspecting ``trades`` and ``signals``
+        """
+        engine = cls(signal, duration, interval, data_source, seed, holding, **params)
+        engine.run()
+        engine.display_summary()
+        return engine
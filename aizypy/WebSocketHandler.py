@@ -1,21 +1,66 @@
+import asyncio
 import logging
-from typing import Optional, Any, Callable, Awaitable, List, Union
+from typing import Optional, Any, Callable, Awaitable, Dict, List, Union
+from .IngressQueue import IngressQueue, route_key
+from .Tracer import Tracer
 
 class WebSocketHandler:
     """Handles WebSocket connections and message routing for the trading bot.
     
+    Messages for a subscribed pair are routed through a table keyed by the
+    pair symbol to that pair's own queue and dispatch task, so a slow
+    handler on one symbol never delays the others and any number of pairs
+    can share one connection. Messages without a subscribed pair go to
+    ``callback`` and are handled inline, in arrival order.
+    
+    With ``queue_size`` set, every stream (including the main callback's)
+    is decoupled from message receipt by a bounded IngressQueue whose
+    ``overflow`` policy decides what happens when the strategy falls behind:
+    'block' applies backpressure to the feed, 'drop_oldest' discards the
+    oldest message and 'conflate' keeps only the latest message per pair, so
+    the strategy always sees the freshest candle at bounded memory.
+    
     Attributes:
         logger: Logger instance for recording events
         connected: Boolean indicating connection status
         ws: WebSocket connection instance
         callback: Callback function for handling incoming messages
+        routes: Callback of each subscribed pair
+        queue_size: Bound of each stream's queue (None for inline main
+            callback and unbounded pair queues)
+        overflow: Overflow policy of bounded queues
+        tracer: Optional latency tracer; each message handled by a callback
+            starts a tick and its handling time is recorded as 'bot.callback'
     """
     
-    def __init__(self, logger: logging.Logger) -> None:
+    def __init__(self, logger: logging.Logger, queue_size: Optional[int] = None, overflow: str = "block",
+                 tracer: Optional[Tracer] = None) -> None:
+        """Initialize the handler.
+        
+        Args:
+            logger: Logger instance for recording events
+            queue_size: Bound of each stream's queue; None handles the main
+                callback inline and leaves pair queues unbounded
+            overflow: 'block', 'drop_oldest' or 'conflate'
+            tracer: Optional latency tracer
+            
+        Raises:
+            ValueError: If the overflow policy is unknown or queue_size is not positive
+        """
+        if overflow not in IngressQueue.POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}', expected one of {IngressQueue.POLICIES}")
+        if queue_size is not None and queue_size <= 0:
+            raise ValueError("queue_size must be positive")
         self.logger: logging.Logger = logger
+        self.queue_size: Optional[int] = queue_size
+        self.overflow: str = overflow
+        self.tracer: Optional[Tracer] = tracer
         self.connected: bool = False
         self.ws: Optional[Any] = None
         self.callback: Optional[Callable[[Any], Awaitable[None]]] = None
+        self.routes: Dict[str, Callable[[Any], Awaitable[None]]] = {}
+        self._queues: Dict[Optional[str], IngressQueue] = {}
+        self._tasks: Dict[Optional[str], asyncio.Task] = {}
 
     async def connect(self) -> None:
         """Establish WebSocket connection."""
@@ -33,14 +78,73 @@ class WebSocketHandler:
             ws.subscribe(self.on_message)
         self.logger.info("WebSocket handler initialized")
 
+    # Pair of a message, shared with FanOut and IngressQueue conflation
+    route_key = staticmethod(route_key)
+
+    def subscribe(self, pair: str, callback: Optional[Callable[[Any], Awaitable[None]]] = None) -> None:
+        """Route a pair's messages to a dedicated dispatch task.
+        
+        Args:
+            pair: Trading pair symbol, e.g. 'BTC/USD'
+            callback: Async function handling the pair's messages (defaults
+                to the main callback)
+                
+        Raises:
+            ValueError: If no callback is given and none is set
+        """
+        callback = callback or self.callback
+        if callback is None:
+            raise ValueError(f"No callback to route {pair} messages to")
+        self.routes[pair] = callback
+        self.logger.info("Subscribed to %s", pair)
+
+    async def unsubscribe(self, pair: str) -> None:
+        """Stop routing a pair, after its queued messages are handled.
+        
+        Args:
+            pair: Trading pair symbol
+        """
+        self.routes.pop(pair, None)
+        queue = self._queues.pop(pair, None)
+        task = self._tasks.pop(pair, None)
+        if queue is not None:
+            await queue.join()
+        if task is not None:
+            task.cancel()
+        self.logger.info("Unsubscribed from %s", pair)
+
     async def on_message(self, data: Any) -> None:
         """Handle incoming WebSocket messages.
         
+        Messages for a subscribed pair are queued for that pair's dispatch
+        task, as are all other messages when ``queue_size`` is set; this
+        only waits when a queue is full under the 'block' policy. Otherwise
+        messages are handled inline.
+        
         Args:
             data: Message data received from WebSocket
         """
-        if self.callback:
-            await self.callback(data)
+        if self.routes:
+            pair = self.route_key(data)
+            if pair in self.routes:
+                queue = self._queues.get(pair)
+                if queue is None:
+                    queue = self._start_dispatch(pair)
+                await queue.put(data)
+                return
+        if self.queue_size is not None and self.callback:
+            queue = self._queues.get(None)
+            if queue is None:
+                queue = self._start_dispatch(None)
+            await queue.put(data)
+        elif self.callback:
+            tracer = self.tracer
+            if tracer is None:
+                await self.callback(data)
+            else:
+                with tracer.tick() as started:
+                    await self.callback(data)
+                    tracer.finish("bot.callback", started)
         else:
             self.logger.warning("Received message but no callback is set")
 
@@ -52,3 +156,85 @@ class WebSocketHandler:
         """
         self.callback = callback
         self.logger.info("Callback set for WebSocket messages")
+
+    def _start_dispatch(self, pair: Optional[str]) -> IngressQueue:
+        """Create the queue and dispatch task of a stream.
+        
+        Args:
+            pair: Trading pair symbol, or None for the main callback
+            
+        Returns:
+            The stream's message queue
+        """
+        queue = IngressQueue(self.queue_size or 0, self.overflow, self.route_key)
+        self._queues[pair] = queue
+        self._tasks[pair] = asyncio.create_task(self._dispatch(pair, queue, self.routes.get(pair)),
+                                                name=f"dispatch-{pair}")
+        return queue
+
+    async def _dispatch(self, pair: Optional[str], queue: IngressQueue,
+                        route: Optional[Callable[[Any], Awaitable[None]]] = None) -> None:
+        """Deliver a stream's queued messages to its callback, one at a time.
+        
+        Errors raised by the callback are logged so that one bad message
+        does not stop the stream.
+        
+        Args:
+            pair: Trading pair symbol, or None for the main callback
+            queue: The stream's message queue
+            route: Callback the pair was routed to when the task started,
+                used for the messages still queued once it is unsubscribed
+        """
+        while True:
+            data = await queue.get()
+            try:
+                callback = self.callback if pair is None else self.routes.get(pair, route)
+                if callback is not None:
+                    tracer = self.tracer
+                    if tracer is None:
+                        await callback(data)
+                    else:
+                        with tracer.tick() as started:
+                            await callback(data)
+                            tracer.finish("bot.callback", started, pair=pair, queue_depth=queue.qsize())
+            except Exception:
+                self.logger.exception("Error handling %s message", pair)
+            finally:
+                queue.task_done()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting across all queues."""
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    @property
+    def dropped_messages(self) -> int:
+        """Number of messages discarded by overflow policies across all queues."""
+        return sum(queue.dropped for queue in self._queues.values())
+
+    def queue_stats(self) -> Dict[Optional[str], Dict[str, int]]:
+        """Get the counters of each stream's queue.
+        
+        Returns:
+            Mapping of pair (None for the main callback) to its depth,
+            high-water mark, dropped and conflated message counts
+        """
+        return {
+            pair: {"depth": queue.qsize(), "high_water": queue.high_water,
+                   "dropped": queue.dropped, "conflated": queue.conflated}
+            for pair, queue in self._queues.items()
+        }
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been handled."""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self) -> None:
+        """Stop all dispatch tasks, dropping messages not yet handled."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._queues.clear()
@@ -1,22 +1,140 @@
 """
 AIZYClientPy - A Python framework for creating and testing trading bots
+
+The exports below are imported on first access (PEP 562), so a live bot
+doing ``from aizypy import AizyBot`` loads only the modules AizyBot needs,
+never the backtesting machinery (TestEngine, VectorTestEngine, the market
+generators and their process pool).
 """
 
-from .AizyBot import AizyBot
-from .CandleData import CandleData
-from .OrderManager import OrderManager, OrderStatus, Order
-from .TestEngine import TestEngine
-from .Trade import Trade
-from .WebSocketHandler import WebSocketHandler
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .AizyBot import AizyBot
+    from .CandleData import CandleData
+    from .FanOut import FanOut, Subscription
+    from .CandleSeries import CandleSeries, CandleWindow
+    from .IngressQueue import IngressQueue
+    from .LatencyHistogram import LatencyHistogram
+    from .LogPipeline import LogPipeline, JSONLinesFormatter
+    from .CandleSource import CandleSource, CSVCandleSource, BinaryCandleSource
+    from .MarketGenerator import (
+        MarketGenerator,
+        UniformGenerator,
+        RandomWalkGenerator,
+        GBMGenerator,
+        RegimeSwitchingGenerator,
+    )
+    from .MarketDataBus import MarketDataBus, MarketDataReader
+    from .MatchingEngine import MatchingEngine
+    from .OrderManager import OrderManager, OrderStatus, Order, OrderArchive, OrderIdGenerator
+    from .PerformanceMetrics import PerformanceMetrics
+    from .TestEngine import TestEngine
+    from .VectorTestEngine import VectorTestEngine
+    from .Trade import Trade
+    from .TradeLog import TradeLog
+    from .Tracer import Tracer, Span
+    from .WebSocketHandler import WebSocketHandler
 
 __version__ = "0.2.2"
 __all__ = [
     "AizyBot",
     "CandleData",
+    "CandleSeries",
+    "CandleWindow",
+    "FanOut",
+    "Subscription",
+    "IngressQueue",
+    "LatencyHistogram",
+    "LogPipeline",
+    "JSONLinesFormatter",
+    "CandleSource",
+    "CSVCandleSource",
+    "BinaryCandleSource",
+    "MarketGenerator",
+    "UniformGenerator",
+    "RandomWalkGenerator",
+    "GBMGenerator",
+    "RegimeSwitchingGenerator",
+    "MarketDataBus",
+    "MarketDataReader",
+    "MatchingEngine",
     "OrderManager",
     "OrderStatus",
     "Order",
+    "OrderArchive",
+    "OrderIdGenerator",
+    "PerformanceMetrics",
     "TestEngine",
+    "VectorTestEngine",
     "Trade",
+    "TradeLog",
+    "Tracer",
+    "Span",
     "WebSocketHandler",
-] 
\ No newline at end of file
+]
+
+# Module defining each export, for exports not named after their module
+_MODULES: Dict[str, str] = {
+    "CandleWindow": "CandleSeries",
+    "Subscription": "FanOut",
+    "JSONLinesFormatter": "LogPipeline",
+    "CSVCandleSource": "CandleSource",
+    "BinaryCandleSource": "CandleSource",
+    "UniformGenerator": "MarketGenerator",
+    "RandomWalkGenerator": "MarketGenerator",
+    "GBMGenerator": "MarketGenerator",
+    "RegimeSwitchingGenerator": "MarketGenerator",
+    "MarketDataReader": "MarketDataBus",
+    "OrderStatus": "OrderManager",
+    "Order": "OrderManager",
+    "OrderArchive": "OrderManager",
+    "OrderIdGenerator": "OrderManager",
+    "Span": "Tracer",
+}
+
+def __getattr__(name: str) -> Any:
+    """Import an export on first access and cache it in the package namespace.
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The exported class
+
+    Raises:
+        AttributeError: If the name is not exported by the package
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_MODULES.get(name, name)}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List the package attributes, including exports not imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+class _Package(types.ModuleType):
+    """Package module type that keeps exports from being shadowed by their modules."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a package attribute, except submodules bound over an export.
+
+        Importing ``aizypy.AizyBot`` (even indirectly, from another module)
+        makes the import system bind the submodule as the package's
+        ``AizyBot`` attribute. Skipping that binding leaves the name to
+        ``__getattr__``, which returns the class.
+
+        Args:
+            name: Attribute name
+            value: Attribute value
+        """
+        if name in __all__ and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,126 @@
+from typing import Iterable, Optional
+import numpy as np
+from ..CandleData import CandleData
+from .Indicator import Indicator
+
+class ATR(Indicator):
+    """Average True Range with Wilder smoothing.
+
+    Unlike the single-input indicators, ATR consumes high, low and close
+    prices; ``update_candle`` feeds it straight from a CandleData.
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        """Initialize the ATR.
+
+        Args:
+            period: Number of true ranges in the smoothing window
+        """
+        super().__init__(period)
+        self._previous_close: Optional[float] = None
+        self._seed_sum: float = 0.0
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self._previous_close = None
+        self._seed_sum = 0.0
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """Consume one candle's prices and return the updated ATR.
+
+        Args:
+            high: Highest price of the candle
+            low: Lowest price of the candle
+            close: Closing price of the candle
+
+        Returns:
+            The ATR, or None until ``period`` candles were seen
+        """
+        previous = self._previous_close
+        if previous is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - previous), abs(low - previous))
+        self._previous_close = close
+        self.count += 1
+        if self.value is not None:
+            self.value += (true_range - self.value) / self.period
+        else:
+            self._seed_sum += true_range
+            if self.count == self.period:
+                self.value = self._seed_sum / self.period
+        return self.value
+
+    def update_candle(self, candle: CandleData) -> Optional[float]:
+        """Consume one candle and return the updated ATR.
+
+        Args:
+            candle: New candle
+
+        Returns:
+            The ATR, or None until ``period`` candles were seen
+        """
+        return self.update(candle.high, candle.low, candle.close)
+
+    def true_range(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+        """Compute the true range of every candle.
+
+        Args:
+            highs: Highest prices, oldest first
+            lows: Lowest prices, oldest first
+            closes: Closing prices, oldest first
+
+        Returns:
+            Array of true ranges (the first one is simply high - low)
+        """
+        ranges = highs - lows
+        if len(closes) > 1:
+            previous = closes[:-1]
+            ranges[1:] = np.maximum.reduce([ranges[1:], np.abs(highs[1:] - previous), np.abs(lows[1:] - previous)])
+        return ranges
+
+    def compute(self, highs: Iterable[float], lows: Iterable[float], closes: Iterable[float]) -> np.ndarray:
+        """Compute the ATR over whole arrays of candle prices.
+
+        Args:
+            highs: Highest prices, oldest first
+            lows: Lowest prices, oldest first
+            closes: Closing prices, oldest first
+
+        Returns:
+            Array of ATR values, NaN for the first ``period - 1`` positions
+        """
+        ranges = self.true_range(np.asarray(highs, dtype=float), np.asarray(lows, dtype=float),
+                                 np.asarray(closes, dtype=float))
+        out = np.full(len(ranges), np.nan)
+        if len(ranges) >= self.period:
+            seed = float(ranges[:self.period].mean())
+            out[self.period - 1] = seed
+            out[self.period:] = self.exponential_smoothing(ranges[self.period:], 1.0 / self.period, seed)
+        return out
+
+    def warm_up(self, highs: Iterable[float], lows: Iterable[float], closes: Iterable[float]) -> np.ndarray:
+        """Prime the streaming state from blocks of candle prices.
+
+        Args:
+            highs: Highest prices, oldest first
+            lows: Lowest prices, oldest first
+            closes: Closing prices, oldest first
+
+        Returns:
+            The batch ATR over the history
+        """
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        closes = np.asarray(closes, dtype=float)
+        self.reset()
+        result = self.compute(highs, lows, closes)
+        self.count = len(closes)
+        if len(closes):
+            self._previous_close = float(closes[-1])
+        if len(closes) >= self.period:
+            self.value = float(result[-1])
+        else:
+            self._seed_sum = float(self.true_range(highs, lows, closes).sum())
+        return result
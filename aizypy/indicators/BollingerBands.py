@@ -0,0 +1,64 @@
+from typing import Iterable, NamedTuple, Optional
+import numpy as np
+from .Indicator import Indicator
+from .RollingStd import RollingStd
+from .SMA import SMA
+
+class Bands(NamedTuple):
+    """Middle, upper and lower Bollinger band values."""
+    middle: float
+    upper: float
+    lower: float
+
+class BollingerBands(Indicator):
+    """Bollinger Bands: SMA plus and minus a multiple of the rolling std.
+
+    Attributes:
+        width: Number of standard deviations between middle and outer bands
+    """
+
+    def __init__(self, period: int = 20, width: float = 2.0) -> None:
+        """Initialize the Bollinger Bands.
+
+        Args:
+            period: Number of values in the window
+            width: Number of standard deviations for the outer bands
+        """
+        super().__init__(period)
+        self.width: float = width
+        self._std: RollingStd = RollingStd(period)
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self._std.reset()
+
+    def update(self, value: float) -> Optional[Bands]:
+        """Consume one value and return the updated bands.
+
+        Args:
+            value: New input value
+
+        Returns:
+            Bands, or None until ``period`` values were seen
+        """
+        self.count += 1
+        std = self._std.update(value)
+        if std is not None:
+            middle = self._std.mean
+            self.value = Bands(middle, middle + self.width * std, middle - self.width * std)
+        return self.value
+
+    def compute(self, values: Iterable[float]) -> Bands:
+        """Compute the bands over a whole array.
+
+        Args:
+            values: Input values, oldest first
+
+        Returns:
+            Bands of arrays, NaN for the first ``period - 1`` positions
+        """
+        values = np.asarray(values, dtype=float)
+        middle = SMA(self.period).compute(values)
+        std = self._std.compute(values)
+        return Bands(middle, middle + self.width * std, middle - self.width * std)
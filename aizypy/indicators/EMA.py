@@ -0,0 +1,73 @@
+from typing import Iterable, Optional
+import numpy as np
+from .Indicator import Indicator
+
+class EMA(Indicator):
+    """Exponential moving average seeded with the SMA of the first period.
+
+    Attributes:
+        alpha: Smoothing factor, ``2 / (period + 1)``
+    """
+
+    def __init__(self, period: int = 20) -> None:
+        """Initialize the EMA.
+
+        Args:
+            period: Number of values in the smoothing span
+        """
+        super().__init__(period)
+        self.alpha: float = 2.0 / (period + 1)
+        self._seed_sum: float = 0.0
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self._seed_sum = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        """Consume one value and return the updated average.
+
+        Args:
+            value: New input value
+
+        Returns:
+            The moving average, or None until ``period`` values were seen
+        """
+        self.count += 1
+        if self.value is not None:
+            self.value += self.alpha * (value - self.value)
+        else:
+            self._seed_sum += value
+            if self.count == self.period:
+                self.value = self._seed_sum / self.period
+        return self.value
+
+    def compute(self, values: Iterable[float]) -> np.ndarray:
+        """Compute the moving average over a whole array.
+
+        Args:
+            values: Input values, oldest first
+
+        Returns:
+            Array of averages, NaN for the first ``period - 1`` positions
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(len(values), np.nan)
+        if len(values) >= self.period:
+            seed = float(values[:self.period].mean())
+            out[self.period - 1] = seed
+            out[self.period:] = self.exponential_smoothing(values[self.period:], self.alpha, seed)
+        return out
+
+    def _prime(self, values: np.ndarray, result: np.ndarray) -> None:
+        """Set the streaming state after a batch computation.
+
+        Args:
+            values: Historical input values, oldest first
+            result: Batch result over ``values``
+        """
+        self.count = len(values)
+        if len(values) >= self.period:
+            self.value = float(result[-1])
+        else:
+            self._seed_sum = float(values.sum())
@@ -0,0 +1,146 @@
+import math
+from typing import Any, Iterable, Optional
+import numpy as np
+from ..CandleData import CandleData
+
+class Indicator:
+    """Base class for streaming technical indicators.
+
+    Every indicator has two paths that produce the same numbers:
+
+    - ``update`` consumes one value and costs O(1), for live trading.
+    - ``compute`` is a stateless batch path over a whole NumPy array, for
+      backtests. Positions still in the warm-up period are NaN.
+
+    ``warm_up`` runs the batch path over a block of history and primes the
+    streaming state with the result, so the next ``update`` continues from
+    where the history ended.
+
+    Attributes:
+        period: Number of values the indicator looks back over
+        value: Latest indicator value (None until enough data was seen)
+        count: Number of values consumed so far
+    """
+
+    def __init__(self, period: int) -> None:
+        """Initialize the indicator.
+
+        Args:
+            period: Number of values the indicator looks back over
+
+        Raises:
+            ValueError: If period is not positive
+        """
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period: int = period
+        self.value: Optional[Any] = None
+        self.count: int = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough data has been seen to produce a value."""
+        return self.value is not None
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        self.value = None
+        self.count = 0
+
+    def update(self, value: float) -> Optional[Any]:
+        """Consume one value and return the updated indicator value.
+
+        Args:
+            value: New input value (usually a closing price)
+
+        Returns:
+            The indicator value, or None while warming up
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses
+        """
+        raise NotImplementedError("update method should be implemented by the subclass")
+
+    def update_candle(self, candle: CandleData) -> Optional[Any]:
+        """Consume one candle, using its closing price by default.
+
+        Args:
+            candle: New candle
+
+        Returns:
+            The indicator value, or None while warming up
+        """
+        return self.update(candle.close)
+
+    def compute(self, values: Iterable[float]) -> Any:
+        """Compute the indicator over a whole array without touching state.
+
+        Args:
+            values: Input values, oldest first
+
+        Returns:
+            Array of indicator values aligned with the input
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses
+        """
+        raise NotImplementedError("compute method should be implemented by the subclass")
+
+    def warm_up(self, values: Iterable[float]) -> Any:
+        """Prime the streaming state from a block of history in one call.
+
+        Args:
+            values: Historical input values, oldest first
+
+        Returns:
+            The batch result over the history, as returned by compute
+        """
+        values = np.asarray(values, dtype=float)
+        self.reset()
+        result = self.compute(values)
+        self._prime(values, result)
+        return result
+
+    def _prime(self, values: np.ndarray, result: Any) -> None:
+        """Set the streaming state after a batch computation.
+
+        The default replays the last ``period`` values through ``update``,
+        which is exact for indicators whose state is a fixed-size window.
+
+        Args:
+            values: Historical input values, oldest first
+            result: Batch result over ``values``
+        """
+        for value in values[-self.period:].tolist():
+            self.update(value)
+        self.count = len(values)
+
+    @staticmethod
+    def exponential_smoothing(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+        """Vectorized recurrence ``y[t] = y[t-1] + alpha * (x[t] - y[t-1])``.
+
+        The recurrence is solved in closed form over chunks short enough for
+        the decay weights to stay within floating-point range.
+
+        Args:
+            values: Input values x
+            alpha: Smoothing factor in (0, 1]
+            initial: Value of y before the first input
+
+        Returns:
+            Array of smoothed values, same length as the input
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.empty_like(values)
+        decay = 1.0 - alpha
+        if decay <= 0.0:
+            out[:] = values
+            return out
+        chunk = max(1, int(250 / -math.log10(decay)))
+        last = initial
+        for start in range(0, len(values), chunk):
+            block = values[start:start + chunk]
+            weights = decay ** np.arange(1, len(block) + 1)
+            out[start:start + len(block)] = weights * (last + alpha * np.cumsum(block / weights))
+            last = out[start + len(block) - 1]
+        return out
@@ -0,0 +1,101 @@
+from typing import Iterable, NamedTuple, Optional
+import numpy as np
+from .EMA import EMA
+from .Indicator import Indicator
+
+class MACDValue(NamedTuple):
+    """MACD line, signal line and histogram values."""
+    macd: float
+    signal: float
+    histogram: float
+
+class MACD(Indicator):
+    """Moving Average Convergence Divergence.
+
+    The MACD line is the fast EMA minus the slow EMA; the signal line is an
+    EMA of the MACD line. A value is produced once the signal line is ready.
+
+    Attributes:
+        fast: Fast EMA of the input
+        slow: Slow EMA of the input
+        signal: EMA of the MACD line
+    """
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> None:
+        """Initialize the MACD.
+
+        Args:
+            fast_period: Period of the fast EMA
+            slow_period: Period of the slow EMA
+            signal_period: Period of the signal EMA
+
+        Raises:
+            ValueError: If the fast period is not shorter than the slow one
+        """
+        if fast_period >= slow_period:
+            raise ValueError("fast_period must be shorter than slow_period")
+        super().__init__(slow_period + signal_period - 1)
+        self.fast: EMA = EMA(fast_period)
+        self.slow: EMA = EMA(slow_period)
+        self.signal: EMA = EMA(signal_period)
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self.fast.reset()
+        self.slow.reset()
+        self.signal.reset()
+
+    def update(self, value: float) -> Optional[MACDValue]:
+        """Consume one value and return the updated MACD.
+
+        Args:
+            value: New input value
+
+        Returns:
+            MACDValue, or None until the signal line is ready
+        """
+        self.count += 1
+        fast = self.fast.update(value)
+        slow = self.slow.update(value)
+        if slow is None:
+            return None
+        macd = fast - slow
+        signal = self.signal.update(macd)
+        if signal is not None:
+            self.value = MACDValue(macd, signal, macd - signal)
+        return self.value
+
+    def compute(self, values: Iterable[float]) -> MACDValue:
+        """Compute the MACD over a whole array.
+
+        Args:
+            values: Input values, oldest first
+
+        Returns:
+            MACDValue of arrays; the MACD line is NaN for the first
+            ``slow_period - 1`` positions and the signal line and histogram
+            for the first ``period - 1`` positions
+        """
+        values = np.asarray(values, dtype=float)
+        macd = self.fast.compute(values) - self.slow.compute(values)
+        signal = np.full(len(values), np.nan)
+        start = self.slow.period - 1
+        if len(values) > start:
+            signal[start:] = self.signal.compute(macd[start:])
+        return MACDValue(macd, signal, macd - signal)
+
+    def _prime(self, values: np.ndarray, result: MACDValue) -> None:
+        """Set the streaming state after a batch computation.
+
+        Args:
+            values: Historical input values, oldest first
+            result: Batch result over ``values``
+        """
+        self.fast.warm_up(values)
+        self.slow.warm_up(values)
+        start = self.slow.period - 1
+        self.signal.warm_up(result.macd[start:] if len(values) > start else [])
+        self.count = len(values)
+        if self.signal.ready:
+            self.value = MACDValue(float(result.macd[-1]), float(result.signal[-1]), float(result.histogram[-1]))
@@ -0,0 +1,157 @@
+from typing import Iterable, Optional, Tuple
+import numpy as np
+from .Indicator import Indicator
+from .SMA import SMA
+
+class RSI(Indicator):
+    """Relative Strength Index with Wilder or simple smoothing.
+
+    With Wilder smoothing (the default) the first average gain and loss
+    are simple means over ``period`` changes; afterwards they are smoothed
+    with ``alpha = 1 / period``. With simple smoothing (Cutler's RSI) they
+    are always the means of the last ``period`` changes. A value is
+    produced once ``period + 1`` prices were seen.
+
+    Attributes:
+        smoothing: 'wilder' or 'simple'
+        avg_gain: Current smoothed average gain
+        avg_loss: Current smoothed average loss
+    """
+
+    SMOOTHINGS = ("wilder", "simple")
+
+    def __init__(self, period: int = 14, smoothing: str = "wilder") -> None:
+        """Initialize the RSI.
+
+        Args:
+            period: Number of price changes in the smoothing window
+            smoothing: 'wilder' for Wilder's exponential smoothing or
+                'simple' for moving averages of the gains and losses
+
+        Raises:
+            ValueError: If period is not positive or smoothing is unknown
+        """
+        if smoothing not in self.SMOOTHINGS:
+            raise ValueError(f"Unknown smoothing '{smoothing}', expected one of {self.SMOOTHINGS}")
+        super().__init__(period)
+        self.smoothing: str = smoothing
+        self.avg_gain: float = 0.0
+        self.avg_loss: float = 0.0
+        self._previous: Optional[float] = None
+        self._gains: Optional[SMA] = SMA(period) if smoothing == "simple" else None
+        self._losses: Optional[SMA] = SMA(period) if smoothing == "simple" else None
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self._previous = None
+        if self._gains is not None:
+            self._gains.reset()
+            self._losses.reset()
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        """Convert average gain and loss to an RSI value."""
+        if avg_loss == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def update(self, value: float) -> Optional[float]:
+        """Consume one price and return the updated RSI.
+
+        Args:
+            value: New price
+
+        Returns:
+            The RSI in [0, 100], or None until ``period + 1`` prices were seen
+        """
+        self.count += 1
+        previous, self._previous = self._previous, value
+        if previous is None:
+            return self.value
+        change = value - previous
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if self._gains is not None:
+            avg_gain, avg_loss = self._gains.update(gain), self._losses.update(loss)
+            if avg_gain is None:
+                return None
+            self.avg_gain, self.avg_loss = avg_gain, avg_loss
+        elif self.value is None:
+            self.avg_gain += gain
+            self.avg_loss += loss
+            if self.count == self.period + 1:
+                self.avg_gain /= self.period
+                self.avg_loss /= self.period
+            else:
+                return None
+        else:
+            self.avg_gain += (gain - self.avg_gain) / self.period
+            self.avg_loss += (loss - self.avg_loss) / self.period
+        self.value = self._rsi(self.avg_gain, self.avg_loss)
+        return self.value
+
+    def _compute(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute RSI and the smoothed gain and loss series.
+
+        Args:
+            values: Prices, oldest first
+
+        Returns:
+            Tuple of (rsi, average gain, average loss) arrays aligned with
+            the changes starting at index ``period``
+        """
+        changes = np.diff(values)
+        gains = np.where(changes > 0, changes, 0.0)
+        losses = np.where(changes < 0, -changes, 0.0)
+        p = self.period
+        if self._gains is not None:
+            avg_gain = SMA(p).compute(gains)[p - 1:]
+            avg_loss = SMA(p).compute(losses)[p - 1:]
+        else:
+            avg_gain = np.empty(len(changes) - p + 1)
+            avg_loss = np.empty_like(avg_gain)
+            avg_gain[0] = gains[:p].mean()
+            avg_loss[0] = losses[:p].mean()
+            avg_gain[1:] = self.exponential_smoothing(gains[p:], 1.0 / p, avg_gain[0])
+            avg_loss[1:] = self.exponential_smoothing(losses[p:], 1.0 / p, avg_loss[0])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+        return rsi, avg_gain, avg_loss
+
+    def compute(self, values: Iterable[float]) -> np.ndarray:
+        """Compute the RSI over a whole array of prices.
+
+        Args:
+            values: Prices, oldest first
+
+        Returns:
+            Array of RSI values, NaN for the first ``period`` positions
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(len(values), np.nan)
+        if len(values) > self.period:
+            out[self.period:] = self._compute(values)[0]
+        return out
+
+    def _prime(self, values: np.ndarray, result: np.ndarray) -> None:
+        """Set the streaming state after a batch computation.
+
+        Args:
+            values: Historical prices, oldest first
+            result: Batch result over ``values``
+        """
+        if len(values) <= self.period or self._gains is not None:
+            # Simple smoothing only depends on the last period + 1 prices
+            for value in values[-(self.period + 1):].tolist():
+                self.update(value)
+            self.count = len(values)
+            return
+        _, avg_gain, avg_loss = self._compute(values)
+        self.avg_gain = float(avg_gain[-1])
+        self.avg_loss = float(avg_loss[-1])
+        self.value = float(result[-1])
+        self._previous = float(values[-1])
+        self.count = len(values)
@@ -0,0 +1,86 @@
+import math
+from typing import Iterable, List, Optional
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .Indicator import Indicator
+
+class RollingStd(Indicator):
+    """Standard deviation over a sliding window.
+
+    Uses a sliding-window form of Welford's algorithm, which is O(1) per
+    update and avoids the cancellation of the sum-of-squares formula at
+    large price levels.
+
+    Attributes:
+        ddof: Delta degrees of freedom (0 for population, 1 for sample)
+        mean: Mean of the current window
+    """
+
+    def __init__(self, period: int = 20, ddof: int = 0) -> None:
+        """Initialize the rolling standard deviation.
+
+        Args:
+            period: Number of values in the window
+            ddof: Delta degrees of freedom (0 for population, 1 for sample)
+
+        Raises:
+            ValueError: If the window is too small for ddof
+        """
+        super().__init__(period)
+        if period <= ddof:
+            raise ValueError("period must be greater than ddof")
+        self.ddof: int = ddof
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+        self._window: List[float] = [0.0] * period
+        self._index: int = 0
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._window = [0.0] * self.period
+        self._index = 0
+
+    def update(self, value: float) -> Optional[float]:
+        """Consume one value and return the updated standard deviation.
+
+        Args:
+            value: New input value
+
+        Returns:
+            The standard deviation, or None until ``period`` values were seen
+        """
+        if self.count < self.period:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        else:
+            self.count += 1
+            old = self._window[self._index]
+            old_mean = self.mean
+            self.mean += (value - old) / self.period
+            self._m2 += (value - old) * (value - self.mean + old - old_mean)
+        self._window[self._index] = value
+        self._index = (self._index + 1) % self.period
+        if self.count >= self.period:
+            self.value = math.sqrt(max(self._m2, 0.0) / (self.period - self.ddof))
+        return self.value
+
+    def compute(self, values: Iterable[float]) -> np.ndarray:
+        """Compute the rolling standard deviation over a whole array.
+
+        Args:
+            values: Input values, oldest first
+
+        Returns:
+            Array of standard deviations, NaN for the first ``period - 1``
+            positions
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(len(values), np.nan)
+        if len(values) >= self.period:
+            out[self.period - 1:] = sliding_window_view(values, self.period).std(axis=1, ddof=self.ddof)
+        return out
@@ -0,0 +1,61 @@
+from typing import Iterable, List, Optional
+import numpy as np
+from .Indicator import Indicator
+
+class SMA(Indicator):
+    """Simple moving average over a fixed window.
+
+    Keeps a ring of the last ``period`` values and a running sum, so each
+    update is O(1) regardless of the period.
+    """
+
+    def __init__(self, period: int = 20) -> None:
+        """Initialize the SMA.
+
+        Args:
+            period: Number of values averaged
+        """
+        super().__init__(period)
+        self._window: List[float] = [0.0] * period
+        self._index: int = 0
+        self._sum: float = 0.0
+
+    def reset(self) -> None:
+        """Clear all state so the indicator starts over."""
+        super().reset()
+        self._window = [0.0] * self.period
+        self._index = 0
+        self._sum = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        """Consume one value and return the updated average.
+
+        Args:
+            value: New input value
+
+        Returns:
+            The moving average, or None until ``period`` values were seen
+        """
+        self._sum += value - self._window[self._index]
+        self._window[self._index] = value
+        self._index = (self._index + 1) % self.period
+        self.count += 1
+        if self.count >= self.period:
+            self.value = self._sum / self.period
+        return self.value
+
+    def compute(self, values: Iterable[float]) -> np.ndarray:
+        """Compute the moving average over a whole array.
+
+        Args:
+            values: Input values, oldest first
+
+        Returns:
+            Array of averages, NaN for the first ``period - 1`` positions
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(len(values), np.nan)
+        if len(values) >= self.period:
+            sums = np.cumsum(np.concatenate(([0.0], values)))
+            out[self.period - 1:] = (sums[self.period:] - sums[:-self.period]) / self.period
+        return out
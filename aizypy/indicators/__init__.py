@@ -0,0 +1,25 @@
+"""
+Streaming technical indicators with O(1) updates and vectorized batch paths
+"""
+
+from .Indicator import Indicator
+from .SMA import SMA
+from .EMA import EMA
+from .RSI import RSI
+from .RollingStd import RollingStd
+from .BollingerBands import BollingerBands, Bands
+from .ATR import ATR
+from .MACD import MACD, MACDValue
+
+__all__ = [
+    "Indicator",
+    "SMA",
+    "EMA",
+    "RSI",
+    "RollingStd",
+    "BollingerBands",
+    "Bands",
+    "ATR",
+    "MACD",
+    "MACDValue",
+]
@@ -0,0 +1,372 @@
+"""
+AIZYClientPy Benchmark Suite
+
+Measures the throughput of the framework's hot paths:
+- OrderManager create/validate/execute/close at 10^3 to 10^6 orders
+- CandleData JSON decoding
+- WebSocketHandler.on_message dispatch latency (inline and per-pair routed)
+- End-to-end TestEngine candles/sec with each example bot
+- Package import time (``python -X importtime``) of a live bot and of
+  the backtesting tools
+
+Results are printed as a table and written as JSON. When a baseline file
+is given, every metric is compared with it and the run fails (exit code 1)
+if any metric is worse than the baseline by more than the threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # full run, compare with baseline.json
+    python benchmarks/run_benchmarks.py --quick              # smaller sizes, compare with baseline_quick.json
+    python benchmarks/run_benchmarks.py --save-baseline      # record a new baseline
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import gc
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "examples"))
+
+import aizypy
+from aizypy import CandleData, GBMGenerator, OrderManager, TestEngine, WebSocketHandler
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+QUICK_BASELINE = os.path.join(HERE, "baseline_quick.json")
+
+Results = Dict[str, Dict[str, Any]]
+
+def record(results: Results, name: str, value: float, unit: str, higher_is_better: bool = True) -> None:
+    """Store one metric.
+
+    Args:
+        results: Results being collected
+        name: Metric name
+        value: Measured value
+        unit: Unit of the value
+        higher_is_better: Whether larger values are improvements
+    """
+    results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+@contextlib.contextmanager
+def timing() -> Iterator[None]:
+    """Collect garbage first and keep the collector off while timing, like timeit."""
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def keep_best(results: Results, run: Results) -> None:
+    """Merge a repeated run into the results, keeping the best value of each metric.
+
+    Args:
+        results: Results being collected
+        run: Results of one more run
+    """
+    for name, metric in run.items():
+        current = results.get(name)
+        if current is None or (metric["value"] > current["value"]) == metric["higher_is_better"]:
+            results[name] = metric
+
+def quiet_logger() -> logging.Logger:
+    """Logger that builds records at INFO like a bot's but writes nothing."""
+    logger = logging.getLogger("aizypy.benchmark")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
+
+def bench_order_manager(results: Results, sizes: List[int]) -> None:
+    """Measure each OrderManager lifecycle step at several order counts.
+
+    Args:
+        results: Results being collected
+        sizes: Numbers of orders to process
+    """
+    for n in sizes:
+        best: Dict[str, float] = {}
+        # Small sizes are repeated and the best run kept to reduce noise
+        for _ in range(min(5, max(1, 10 ** 5 // n))):
+            manager = OrderManager(quiet_logger())
+            with timing():
+                started = time.perf_counter()
+                orders = [manager.create_order("buy" if i % 2 else "sell", 1.0, 100.0 + i % 50, "BTC/USD")
+                          for i in range(n)]
+                created = time.perf_counter()
+                for order in orders:
+                    manager.validate_order(order)
+                validated = time.perf_counter()
+                for order in orders:
+                    manager.execute_order(order)
+                executed = time.perf_counter()
+                for order in orders:
+                    manager.close_order(order)
+                closed = time.perf_counter()
+            for step, seconds in (("create", created - started), ("validate", validated - created),
+                                  ("execute", executed - validated), ("close", closed - executed)):
+                best[step] = min(best.get(step, seconds), seconds)
+        for step, seconds in best.items():
+            record(results, f"order_manager.{step}.{n}", n / seconds, "orders/s")
+
+def bench_decode(results: Results, count: int) -> None:
+    """Measure CandleData decoding from JSON.
+
+    Args:
+        results: Results being collected
+        count: Number of candles to decode
+    """
+    messages = [{"timestamp": 1_700_000_000_000 + i * 60_000, "open": "100.5", "high": "101.0",
+                 "low": "99.5", "close": "100.0", "volume": "12.5"} for i in range(count)]
+    with timing():
+        started = time.perf_counter()
+        for message in messages:
+            CandleData.from_json(message)
+        elapsed = time.perf_counter() - started
+    record(results, "candle.from_json", count / elapsed, "candles/s")
+
+    payload = json.dumps(messages).encode()
+    with timing():
+        started = time.perf_counter()
+        CandleData.decode(payload)
+        elapsed = time.perf_counter() - started
+    record(results, "candle.decode_batch", count / elapsed, "candles/s")
+
+async def _dispatch_latency(count: int, routed: bool) -> List[float]:
+    """Send messages through a WebSocketHandler and time their delivery.
+
+    Args:
+        count: Number of messages
+        routed: Whether messages go through a per-pair dispatch task
+
+    Returns:
+        Delivery latency of each message in seconds
+    """
+    latencies: List[float] = []
+    clock = time.perf_counter
+
+    async def callback(data: List[Any]) -> None:
+        latencies.append(clock() - data[1])
+
+    handler = WebSocketHandler(quiet_logger())
+    handler.set_callback(callback)
+    if routed:
+        handler.route_key = lambda data: data[0]
+        for i in range(10):
+            handler.subscribe(f"P{i}/USD")
+    pairs = [f"P{i % 10}/USD" for i in range(count)]
+    for pair in pairs:
+        await handler.on_message([pair, clock()])
+        # Yield to the loop between messages, as a socket read would
+        await asyncio.sleep(0)
+    await handler.drain()
+    await handler.close()
+    return latencies
+
+def bench_dispatch(results: Results, count: int) -> None:
+    """Measure WebSocketHandler.on_message to callback latency.
+
+    Args:
+        results: Results being collected
+        count: Number of messages per mode
+    """
+    for mode, routed in (("inline", False), ("routed", True)):
+        started = time.perf_counter()
+        latencies = sorted(asyncio.run(_dispatch_latency(count, routed)))
+        elapsed = time.perf_counter() - started
+        record(results, f"dispatch.{mode}.throughput", count / elapsed, "messages/s")
+        record(results, f"dispatch.{mode}.p50_us", latencies[len(latencies) // 2] * 1e6, "us", False)
+        record(results, f"dispatch.{mode}.p99_us", latencies[int(len(latencies) * 0.99)] * 1e6, "us", False)
+
+def bench_test_engine(results: Results, candles: int) -> None:
+    """Measure end-to-end TestEngine throughput with each example bot.
+
+    Args:
+        results: Results being collected
+        candles: Number of GBM candles per run
+    """
+    from simple_moving_average_bot import SimpleMovingAverageBot
+    from rsi_bot import RSIBot
+    from grid_trading_bot import GridTradingBot
+
+    bots: Dict[str, Callable[..., Any]] = {
+        "sma": SimpleMovingAverageBot,
+        "rsi": RSIBot,
+        "grid": functools.partial(GridTradingBot, grid_size=10, grid_spacing=5.0),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, bot in bots.items():
+            factory = functools.partial(bot, log_file=os.path.join(tmp, f"{name}.log"))
+            engine = TestEngine(factory, data_source=GBMGenerator(count=candles, seed=42))
+            started = time.perf_counter()
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                asyncio.run(engine.run())
+            record(results, f"test_engine.{name}", candles / (time.perf_counter() - started), "candles/s")
+        aizypy.LogPipeline.stop_all()
+
+IMPORTS = {
+    # A live bot must not load the backtesting machinery
+    "live": "from aizypy import AizyBot; import sys; assert 'aizypy.TestEngine' not in sys.modules",
+    "full": "from aizypy import AizyBot, TestEngine, VectorTestEngine",
+}
+
+def import_time_ms(code: str) -> float:
+    """Measure the import time of aizypy modules with ``python -X importtime``.
+
+    Args:
+        code: Statements run in a fresh interpreter
+
+    Returns:
+        Sum of the cumulative times of the top-level aizypy imports, in
+        milliseconds
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                               capture_output=True, text=True, check=True)
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", nesting shown by indentation
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].startswith(" aizypy"):
+            total_us += int(fields[1])
+    return total_us / 1000
+
+def bench_import(results: Results, runs: int) -> None:
+    """Measure package import time for a live bot and for backtesting.
+
+    Args:
+        results: Results being collected
+        runs: Fresh interpreters started per case; the fastest is kept
+    """
+    import_time_ms(IMPORTS["full"])  # Compile bytecode caches first
+    for name, code in IMPORTS.items():
+        best = min(import_time_ms(code) for _ in range(runs))
+        record(results, f"import.{name}_ms", best, "ms", False)
+
+def compare(results: Results, baseline: Results, threshold: float) -> List[str]:
+    """Find metrics that regressed against a baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Allowed relative slowdown (0.2 means 20% worse)
+
+    Returns:
+        Description of each regression
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None or not reference["value"]:
+            continue
+        ratio = current["value"] / reference["value"]
+        change = ratio - 1 if current["higher_is_better"] else 1 - ratio
+        if change < -threshold:
+            regressions.append(f"{name}: {current['value']:.4g} {current['unit']} "
+                               f"vs baseline {reference['value']:.4g} ({change:+.0%})")
+    return regressions
+
+def print_table(results: Results, baseline: Optional[Results]) -> None:
+    """Print the results, with the change against the baseline when given.
+
+    Args:
+        results: Current results
+        baseline: Baseline results, if any
+    """
+    width = max(len(name) for name in results)
+    for name, metric in results.items():
+        line = f"{name:<{width}}  {metric['value']:>14,.2f} {metric['unit']:<11}"
+        reference = (baseline or {}).get(name)
+        if reference and reference["value"]:
+            ratio = metric["value"] / reference["value"]
+            change = ratio - 1 if metric["higher_is_better"] else 1 - ratio
+            line += f"  {change:+7.1%}"
+        print(line)
+
+def main() -> int:
+    """Run the benchmark suite.
+
+    Returns:
+        Process exit code, 1 if any metric regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="use small sizes for a fast smoke run")
+    parser.add_argument("--output", default=None, help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=None,
+                        help="baseline JSON to compare against (default: baseline.json, "
+                             "or baseline_quick.json with --quick)")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs of the decode, dispatch and TestEngine benchmarks; the best is kept (default 3)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative slowdown before a metric is flagged (default 0.25)")
+    args = parser.parse_args()
+    if args.baseline is None:
+        args.baseline = QUICK_BASELINE if args.quick else DEFAULT_BASELINE
+
+    order_sizes = [10 ** 3, 10 ** 4] if args.quick else [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    results: Results = {}
+    bench_order_manager(results, order_sizes)
+    bench_import(results, 3 if args.quick else 5)
+    for _ in range(max(1, args.repeat)):
+        run: Results = {}
+        bench_decode(run, 10 ** 4 if args.quick else 10 ** 5)
+        bench_dispatch(run, 10 ** 4 if args.quick else 10 ** 5)
+        bench_test_engine(run, 1000 if args.quick else 5000)
+        keep_best(results, run)
+
+    report = {
+        "meta": {
+            "aizypy": aizypy.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n[REGRESSION] {len(regressions)} metric(s) worse than baseline by more than "
+                  f"{args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
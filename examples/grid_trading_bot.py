@@ -3,14 +3,15 @@ Grid Trading Bot Example
 
 This bot implements a grid trading strategy:
 - Creates a grid of buy and sell orders at regular price intervals
-- Automatically places new orders when existing orders are filled
+- Takes profit one level away from each filled order, then re-places the level
 - Aims to profit from price oscillations within a range
 """
 
 from aizypy import AizyBot
 from aizypy import CandleData
 from aizypy import TestEngine
-from typing import List, Dict, Optional
+from aizypy import Trade
+from typing import List, Dict, Optional, Set
 import logging
 
 class GridTradingBot(AizyBot):
@@ -34,10 +35,13 @@ class GridTradingBot(AizyBot):
         self.position_size: float = position_size
         self.grid_levels: Dict[float, str] = {}  # price -> order_type mapping
         self.active_orders: Dict[str, float] = {}  # order_id -> price mapping
+        self.positions: Dict[str, float] = {}  # filled order_id -> grid price
+        self.free_levels: Set[float] = set()  # grid prices without an order or position
         self.initial_price: Optional[float] = None
+        self.register_state("grid_levels", "active_orders", "positions", "free_levels", "initial_price")
         self.logger.info(
-            f"Initialized Grid Trading Bot (Grid Size: {grid_size}, "
-            f"Spacing: {grid_spacing}, Position Size: {position_size})"
+            "Initialized Grid Trading Bot (Grid Size: %d, Spacing: %s, Position Size: %s)",
+            grid_size, grid_spacing, position_size
         )
 
     def setup_grid(self, current_price: float) -> None:
@@ -57,55 +61,46 @@ class GridTradingBot(AizyBot):
         for i in range(1, self.grid_size + 1):
             price = current_price - (i * self.grid_spacing)
             self.grid_levels[price] = "buy"
+
+        self.free_levels = set(self.grid_levels)
             
-        self.logger.info(f"Grid setup complete with {len(self.grid_levels)} levels")
+        self.logger.info("Grid setup complete with %d levels", len(self.grid_levels))
 
     async def place_grid_orders(self) -> None:
-        """Place orders at all grid levels that don't have active orders."""
-        for price, order_type in self.grid_levels.items():
-            if price not in self.active_orders.values():
-                self.logger.info(f"Placing {order_type} order at price level {price:.2f}")
-                await self.place_order(
-                    side=order_type,
-                    amount=self.position_size,
-                    price=price,
-                    pair="BTC/USD",
-                    order_type="limit"
-                )
+        """Place limit orders at every free grid level in one batch."""
+        if not self.free_levels:
+            return
+        orders = [
+            {"side": self.grid_levels[price], "amount": self.position_size, "price": price,
+             "pair": "BTC/USD", "order_type": "limit"}
+            for price in self.free_levels
+        ]
+        self.logger.info("Placing %d grid orders", len(orders))
+        self.free_levels.clear()
+        for order in await self.place_orders(orders):
+            self.active_orders[order.order_id] = order.price
 
-    async def handle_order_filled(self, order_id: str, price: float) -> None:
-        """Handle filled orders by placing new orders on the opposite side.
+    async def on_order_filled(self, order: Trade) -> None:
+        """Turn a filled grid order into a position targeting the next level.
         
         Args:
-            order_id: ID of the filled order
-            price: Price level of the filled order
+            order: The grid order that was filled
         """
-        if order_id in self.active_orders:
-            filled_price = self.active_orders[order_id]
-            original_type = self.grid_levels[filled_price]
-            
-            # Place a new order on the opposite side
-            new_type = "buy" if original_type == "sell" else "sell"
-            self.logger.info(f"Order filled at {price:.2f}, placing {new_type} order")
-            
-            await self.place_order(
-                side=new_type,
-                amount=self.position_size,
-                price=price,
-                pair="BTC/USD",
-                order_type="limit"
-            )
-            
-            del self.active_orders[order_id]
+        price = self.active_orders.pop(order.order_id, None)
+        if price is not None:
+            self.logger.info("%s order filled at %.2f", order.side.capitalize(), price)
+            self.positions[order.order_id] = price
 
     async def bot_action(self, candle_data: CandleData) -> None:
         """Process new candle data and manage the grid trading strategy.
         
         Strategy:
         - Set up initial grid on first run
-        - Monitor price movements
-        - Place new orders when grid levels become empty
-        - Handle filled orders by placing opposite orders
+        - Close positions once price reaches the next grid level in
+          their favour
+        - Re-place orders at grid levels freed by closed positions
+        
+        Fills of resting limit orders are reported through on_order_filled.
         
         Args:
             candle_data: Latest market candle data
@@ -114,18 +109,21 @@ class GridTradingBot(AizyBot):
         
         # Initialize grid on first run
         if self.initial_price is None:
-            self.logger.info(f"Initializing grid around price {current_price:.2f}")
+            self.logger.info("Initializing grid around price %.2f", current_price)
             self.setup_grid(current_price)
             await self.place_grid_orders()
             return
 
-        # Check for filled orders (simplified simulation)
-        active_trades = self.list_active_trades()
-        for trade in active_trades:
-            if (trade.side == "buy" and current_price <= trade.price) or \
-               (trade.side == "sell" and current_price >= trade.price):
-                await self.handle_order_filled(trade.trade_id, trade.price)
-                await self.close_trade(trade)
+        # Take profit one grid level away from the fill
+        for order_id, price in list(self.positions.items()):
+            if self.grid_levels[price] == "buy":
+                reached = candle_data.high >= price + self.grid_spacing
+            else:
+                reached = candle_data.low <= price - self.grid_spacing
+            if reached:
+                await self.close_trade(order_id)
+                del self.positions[order_id]
+                self.free_levels.add(price)
 
         # Ensure all grid levels have active orders
         await self.place_grid_orders()
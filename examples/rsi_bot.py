@@ -9,8 +9,12 @@ This bot implements a trading strategy based on the RSI indicator:
 from aizypy import AizyBot
 from aizypy import CandleData
 from aizypy import TestEngine
-from typing import List, Optional
+from aizypy import VectorTestEngine
+from aizypy import CandleWindow
+from aizypy.indicators import RSI
+from typing import Optional
 import logging
+import numpy as np
 
 class RSIBot(AizyBot):
     def __init__(self, 
@@ -31,43 +35,23 @@ class RSIBot(AizyBot):
         self.rsi_period: int = rsi_period
         self.oversold_level: float = oversold_level
         self.overbought_level: float = overbought_level
-        self.prices: List[float] = []
-        self.gains: List[float] = []
-        self.losses: List[float] = []
+        # Simple moving averages of gains and losses, as this example always used
+        self.rsi: RSI = RSI(rsi_period, smoothing="simple")
         self.last_position: Optional[str] = None
+        self.register_state("rsi", "last_position")
         self.logger.info(
-            f"Initialized RSI bot (Period: {rsi_period}, "
-            f"Oversold: {oversold_level}, Overbought: {overbought_level})"
+            "Initialized RSI bot (Period: %d, Oversold: %s, Overbought: %s)",
+            rsi_period, oversold_level, overbought_level
         )
 
-    def calculate_rsi(self) -> float:
-        """Calculate the Relative Strength Index.
+    def on_warm_up(self, candles: CandleWindow, pair: Optional[str] = None) -> None:
+        """Prime the RSI from historical closing prices.
         
-        Returns:
-            The calculated RSI value
+        Args:
+            candles: Historical OHLCV arrays
+            pair: Pair of the history
         """
-        if len(self.prices) < 2:
-            return 50.0  # Default to neutral when insufficient data
-            
-        # Calculate price changes
-        changes = [self.prices[i] - self.prices[i-1] 
-                  for i in range(1, len(self.prices))]
-        
-        # Separate gains and losses
-        gains = [change if change > 0 else 0.0 for change in changes]
-        losses = [-change if change < 0 else 0.0 for change in changes]
-        
-        # Calculate average gain and loss
-        avg_gain = sum(gains[-self.rsi_period:]) / self.rsi_period
-        avg_loss = sum(losses[-self.rsi_period:]) / self.rsi_period
-        
-        if avg_loss == 0:
-            return 100.0
-            
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        self.rsi.warm_up(candles.close)
 
     async def bot_action(self, candle_data: CandleData) -> None:
         """Process new candle data and execute trading strategy.
@@ -81,30 +65,46 @@ class RSIBot(AizyBot):
         Args:
             candle_data: Latest market candle data
         """
-        self.prices.append(candle_data.close)
+        rsi = self.rsi.update(candle_data.close)
         
         # Wait until we have enough data to calculate RSI
-        if len(self.prices) < self.rsi_period + 1:
-            self.logger.info(f"Collecting initial data: {len(self.prices)}/{self.rsi_period + 1}")
+        if rsi is None:
+            self.logger.info("Collecting initial data: %d/%d", self.rsi.count, self.rsi_period + 1)
             return
 
-        rsi = self.calculate_rsi()
         current_price = candle_data.close
         
-        self.logger.info(f"Current Price: {current_price:.2f}, RSI: {rsi:.2f}")
+        self.logger.info("Current Price: %.2f, RSI: %.2f", current_price, rsi)
 
         # Check for buy signal (oversold condition)
         if rsi < self.oversold_level and self.last_position != "long":
-            self.logger.info(f"Buy signal: RSI ({rsi:.2f}) below oversold level ({self.oversold_level})")
+            self.logger.info("Buy signal: RSI (%.2f) below oversold level (%s)", rsi, self.oversold_level)
             await self.place_order("buy", 1.0, current_price, "BTC/USD")
             self.last_position = "long"
 
         # Check for sell signal (overbought condition)
         elif rsi > self.overbought_level and self.last_position != "short":
-            self.logger.info(f"Sell signal: RSI ({rsi:.2f}) above overbought level ({self.overbought_level})")
+            self.logger.info("Sell signal: RSI (%.2f) above overbought level (%s)", rsi, self.overbought_level)
             await self.place_order("sell", 1.0, current_price, "BTC/USD")
             self.last_position = "short"
 
+def rsi_signal(candles: CandleWindow, rsi_period: int = 14,
+               oversold_level: float = 30.0, overbought_level: float = 70.0) -> np.ndarray:
+    """Vectorized equivalent of RSIBot for VectorTestEngine.
+    
+    Args:
+        candles: OHLCV columns of the whole test
+        rsi_period: Number of periods for RSI calculation
+        oversold_level: RSI level below which to buy
+        overbought_level: RSI level above which to sell
+        
+    Returns:
+        Per-candle order signals (+1 buy, -1 sell, 0 none)
+    """
+    rsi = RSI(rsi_period, smoothing="simple").compute(candles.close)
+    state = np.where(rsi < oversold_level, 1, np.where(rsi > overbought_level, -1, 0))
+    return VectorTestEngine.changes(state)
+
 async def main() -> None:
     """Run the RSI bot with the test engine."""
     # Test parameters
@@ -116,7 +116,7 @@ async def main() -> None:
 
     print(f"Starting RSI bot test (Duration: {test_duration} minutes, Interval: {test_interval} minute(s))")
     await TestEngine.test(
-        lambda *args, **kwargs: RSIBot(rsi_period=rsi_period, oversold=oversold, overbought=overbought, *args, **kwargs),
+        lambda *args, **kwargs: RSIBot(rsi_period=rsi_period, oversold_level=oversold, overbought_level=overbought, *args, **kwargs),
         duration=test_duration,
         interval=test_interval
     )
@@ -9,31 +9,38 @@ This bot implements a basic trading strategy based on the Simple Moving Average
 from aizypy import AizyBot
 from aizypy import CandleData
 from aizypy import TestEngine
-from typing import List, Optional
+from aizypy import VectorTestEngine
+from aizypy import CandleWindow
+from aizypy.indicators import SMA
+from typing import Optional
 import logging
+import numpy as np
 
 class SimpleMovingAverageBot(AizyBot):
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, sma_period: int = 20, **kwargs) -> None:
         """Initialize the SMA trading bot.
         
         Args:
-            sma_period: Number of periods to use for SMA calculation
             *args: Additional positional arguments for AizyBot
+            sma_period: Number of periods to use for SMA calculation
+                (keyword-only, so positional AizyBot arguments keep working)
             **kwargs: Additional keyword arguments for AizyBot
         """
         super().__init__(*args, **kwargs)
-        self.sma_period: int = 20
-        self.prices: List[float] = []
+        self.sma_period: int = sma_period
+        self.sma: SMA = SMA(sma_period)
         self.last_position: Optional[str] = None
-        self.logger.info(f"Initialized SMA bot with period {self.sma_period}")
+        self.register_state("sma", "last_position")
+        self.logger.info("Initialized SMA bot with period %d", self.sma_period)
 
-    def calculate_sma(self) -> float:
-        """Calculate the Simple Moving Average.
+    def on_warm_up(self, candles: CandleWindow, pair: Optional[str] = None) -> None:
+        """Prime the SMA from historical closing prices.
         
-        Returns:
-            The calculated SMA value
+        Args:
+            candles: Historical OHLCV arrays
+            pair: Pair of the history
         """
-        return sum(self.prices[-self.sma_period:]) / self.sma_period
+        self.sma.warm_up(candles.close)
 
     async def bot_action(self, candle_data: CandleData) -> None:
         """Process new candle data and execute trading strategy.
@@ -47,17 +54,16 @@ class SimpleMovingAverageBot(AizyBot):
         Args:
             candle_data: Latest market candle data
         """
-        self.prices.append(candle_data.close)
+        sma = self.sma.update(candle_data.close)
         
         # Wait until we have enough data to calculate SMA
-        if len(self.prices) < self.sma_period:
-            self.logger.info(f"Collecting initial data: {len(self.prices)}/{self.sma_period}")
+        if sma is None:
+            self.logger.info("Collecting initial data: %d/%d", self.sma.count, self.sma_period)
             return
 
-        sma = self.calculate_sma()
         current_price = candle_data.close
         
-        self.logger.info(f"Current Price: {current_price:.2f}, SMA: {sma:.2f}")
+        self.logger.info("Current Price: %.2f, SMA: %.2f", current_price, sma)
 
         # Check for buy signal
         if current_price > sma and self.last_position != "long":
@@ -71,6 +77,19 @@ class SimpleMovingAverageBot(AizyBot):
             await self.place_order("sell", 1.0, current_price, "BTC/USD")
             self.last_position = "short"
 
+def sma_signal(candles: CandleWindow, sma_period: int = 20) -> np.ndarray:
+    """Vectorized equivalent of SimpleMovingAverageBot for VectorTestEngine.
+    
+    Args:
+        candles: OHLCV columns of the whole test
+        sma_period: Number of periods to use for SMA calculation
+        
+    Returns:
+        Per-candle order signals (+1 buy, -1 sell, 0 none)
+    """
+    sma = SMA(sma_period).compute(candles.close)
+    return VectorTestEngine.changes(candles.close - sma)
+
 async def main() -> None:
     """Run the SMA bot with the test engine."""
     # Test parameters
@@ -31,7 +31,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/AizyDev/AIZYClientPy",
-    packages=["aizypy"],
+    packages=["aizypy", "aizypy.indicators"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -51,6 +51,7 @@ setup(
         "aiohttp>=3.8.0",
         "python-dateutil>=2.8.2",
         "pytz>=2021.3",
+        "numpy>=1.20",
     ],
     extras_require={
         "dev": [
@@ -0,0 +1,33 @@
+import importlib.util
+import json
+import os
+
+_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "run_benchmarks.py")
+_spec = importlib.util.spec_from_file_location("run_benchmarks", _PATH)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+def _results(**values):
+    results = {}
+    for name, (value, higher_is_better) in values.items():
+        bench.record(results, name, value, "x", higher_is_better)
+    return results
+
+def test_compare_flags_only_regressions_beyond_the_threshold():
+    baseline = _results(rate=(100.0, True), latency=(10.0, False), fresh=(0.0, True))
+    current = _results(rate=(80.0, True), latency=(12.0, False), fresh=(1.0, True), new=(1.0, True))
+    assert bench.compare(current, baseline, 0.25) == []
+    regressions = bench.compare(current, baseline, 0.1)
+    assert [line.split(":")[0] for line in regressions] == ["rate", "latency"]
+
+def test_keep_best_respects_the_direction_of_each_metric():
+    results = _results(rate=(100.0, True), latency=(10.0, False))
+    bench.keep_best(results, _results(rate=(90.0, True), latency=(8.0, False)))
+    bench.keep_best(results, _results(rate=(120.0, True), latency=(9.0, False)))
+    assert (results["rate"]["value"], results["latency"]["value"]) == (120.0, 8.0)
+
+def test_stored_baselines_use_the_result_format():
+    for path in (bench.DEFAULT_BASELINE, bench.QUICK_BASELINE):
+        with open(path) as f:
+            metrics = json.load(f)["results"]
+        assert metrics and all(set(m) == {"value", "unit", "higher_is_better"} for m in metrics.values())
@@ -0,0 +1,42 @@
+import json
+import pickle
+from datetime import datetime, timezone
+import pytest
+from aizypy import CandleData
+
+MS = 1_700_000_000_000
+
+def test_constructor_and_batch_decode_agree_on_int_seconds():
+    seconds = MS // 1000
+    single = CandleData(seconds, 1.0, 2.0, 0.5, 1.5, 10.0)
+    batch, = CandleData.from_json_many([[seconds, 1.0, 2.0, 0.5, 1.5, 10.0]])
+    assert single.timestamp == batch.timestamp == MS
+
+@pytest.mark.parametrize("value", [MS, MS / 1000, str(MS), str(MS / 1000),
+                                   datetime(2023, 11, 14, 22, 13, 20),
+                                   datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)])
+def test_timestamp_forms_normalize_to_epoch_ms(value):
+    assert CandleData(value, 1.0, 1.0, 1.0, 1.0, 1.0).timestamp == MS
+
+def test_datetime_property_round_trips():
+    candle = CandleData(MS, 1.0, 1.0, 1.0, 1.0, 1.0)
+    assert CandleData.to_epoch_ms(candle.datetime) == MS
+
+def test_decode_accepts_objects_rows_and_wrapped_lists():
+    message = {"timestamp": MS, "open": "1", "high": "2", "low": "0.5", "close": "1.5", "volume": "3",
+               "pair": "BTC/USD"}
+    for payload in (json.dumps(message), json.dumps([message]), json.dumps({"candles": [message]}).encode()):
+        candle, = CandleData.decode(payload)
+        assert (candle.timestamp, candle.close, candle.pair) == (MS, 1.5, "BTC/USD")
+    row, = CandleData.decode(json.dumps([[MS, 1, 2, 0.5, 1.5, 3]]))
+    assert row.to_row() == [MS, 1.0, 2.0, 0.5, 1.5, 3.0]
+
+def test_slotted_candles_pickle():
+    candle = CandleData(MS, 1.0, 2.0, 0.5, 1.5, 10.0, "ETH/USD")
+    assert not hasattr(candle, "__dict__")
+    copy = pickle.loads(pickle.dumps(candle))
+    assert (copy.timestamp, copy.to_row(), copy.pair) == (MS, candle.to_row(), "ETH/USD")
+
+def test_from_ms_keeps_small_millisecond_timestamps():
+    candle = CandleData.from_ms(60_000, 1.0, 2.0, 0.5, 1.5, 10.0, "ETH/USD")
+    assert (candle.timestamp, candle.to_row(), candle.pair) == (60_000, [60_000, 1.0, 2.0, 0.5, 1.5, 10.0], "ETH/USD")
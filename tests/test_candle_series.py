@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from aizypy import AizyBot, CandleData, CandleSeries
+
+def test_window_is_chronological_across_wraparound():
+    series = CandleSeries(5)
+    for i in range(12):
+        series.append_values(i, i + 1.0, i - 1.0, i + 0.5, 10.0 * i)
+    assert len(series) == 5
+    assert series.closes.tolist() == [7.5, 8.5, 9.5, 10.5, 11.5]
+    window = series.last(3)
+    assert window.open.tolist() == [9.0, 10.0, 11.0] and window.volume.tolist() == [90.0, 100.0, 110.0]
+    assert series.last(50).high.tolist() == series.highs.tolist()
+    assert series.last(0).close.tolist() == []
+
+def test_views_are_zero_copy_and_read_only():
+    series = CandleSeries(4)
+    for i in range(6):
+        series.append_values(i, i, i, float(i), i)
+    closes = series.closes
+    assert np.shares_memory(closes, series._data)
+    with pytest.raises(ValueError):
+        closes[0] = 0.0
+
+def test_append_and_clear_track_the_timestamp():
+    series = CandleSeries(3)
+    series.append(CandleData(1_700_000_000_000, 1.0, 2.0, 0.5, 1.5, 3.0))
+    assert series.last_timestamp == 1_700_000_000_000
+    series.clear()
+    assert len(series) == 0 and series.last_timestamp is None and series.closes.tolist() == []
+    with pytest.raises(ValueError):
+        CandleSeries(0)
+
+def test_bot_buffer_keeps_history_size_candles():
+    bot = AizyBot(log_file="/dev/null", history_size=10)
+    assert bot.candles.capacity == 10 and len(bot.candles) == 0
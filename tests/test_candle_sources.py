@@ -0,0 +1,70 @@
+import pickle
+import pytest
+from aizypy import BinaryCandleSource, CSVCandleSource
+
+ROWS = [(1_700_000_000 + 60 * i, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0 * i) for i in range(50)]
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "candles.csv"
+    lines = ["symbol,volume,timestamp,open,high,low,close"]
+    lines += [f"BTC,{v},{t},{o},{h},{l},{c}" for t, o, h, l, c, v in ROWS]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+def test_csv_source_reads_columns_in_any_order(csv_path):
+    candles = list(CSVCandleSource(csv_path))
+    assert [c.to_row() for c in candles] == [[t * 1000, o, h, l, c, v] for t, o, h, l, c, v in ROWS]
+
+def test_binary_source_round_trips_the_csv(csv_path, tmp_path):
+    binary_path = str(tmp_path / "candles.bin")
+    assert BinaryCandleSource.convert_csv(csv_path, binary_path) == len(ROWS)
+    with BinaryCandleSource(binary_path) as source:
+        assert len(source) == len(ROWS)
+        assert [c.to_row() for c in source] == [c.to_row() for c in CSVCandleSource(csv_path)]
+        assert source.column("close")[-1] == ROWS[-1][4]
+        copy = pickle.loads(pickle.dumps(source))
+        assert [c.close for c in copy] == [row[4] for row in ROWS]
+        copy.close()
+
+def test_binary_source_rejects_other_files(tmp_path):
+    path = tmp_path / "not_candles.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        BinaryCandleSource(str(path))
+    with pytest.raises(ValueError):
+        CSVCandleSource(str(path), timestamp_unit="us")
+
+def test_millisecond_sources_keep_early_timestamps(tmp_path):
+    path = tmp_path / "early.csv"
+    path.write_text("timestamp,open,high,low,close,volume\n0,1,2,0.5,1.5,3\n60000,1,2,0.5,1.5,3\n120000,1,2,0.5,1.5,3\n")
+    assert [c.timestamp for c in CSVCandleSource(str(path), timestamp_unit="ms")] == [0, 60_000, 120_000]
+    binary_path = str(tmp_path / "early.bin")
+    BinaryCandleSource.convert_csv(str(path), binary_path, timestamp_unit="ms")
+    with BinaryCandleSource(binary_path) as source:
+        assert [c.timestamp for c in source] == [0, 60_000, 120_000]
+
+def test_convert_parses_the_csv_once(csv_path, tmp_path, monkeypatch):
+    calls = []
+    rows = CSVCandleSource.rows
+
+    def counting_rows(self):
+        calls.append(self.path)
+        return rows(self)
+
+    monkeypatch.setattr(CSVCandleSource, "rows", counting_rows)
+    assert BinaryCandleSource.convert_csv(csv_path, str(tmp_path / "candles.bin")) == len(ROWS)
+    assert calls == [csv_path]
+
+def test_columns_are_little_endian_and_closed_sources_refuse_reads(csv_path, tmp_path):
+    binary_path = str(tmp_path / "candles.bin")
+    BinaryCandleSource.convert_csv(csv_path, binary_path)
+    source = BinaryCandleSource(binary_path)
+    timestamps = source.column("timestamp")
+    assert (timestamps.dtype.str, source.column("volume").dtype.str) == ("<i8", "<f8")
+    source.close()
+    assert timestamps[0] == ROWS[0][0] * 1000
+    with pytest.raises(ValueError, match="source is closed"):
+        list(source)
+    with pytest.raises(ValueError, match="source is closed"):
+        source.column("close")
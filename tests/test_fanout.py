@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import pytest
+from aizypy import FanOut
+
+def _quiet_logger():
+    logger = logging.getLogger("test.fanout")
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
+
+def _recorder(received, name, delay=0.0, fail_odd=False):
+    async def callback(data):
+        if fail_odd and data % 2:
+            raise RuntimeError("bad message")
+        if delay:
+            await asyncio.sleep(delay)
+        received.setdefault(name, []).append(data)
+    return callback
+
+def test_deliver_isolates_errors_and_timeouts():
+    received = {}
+    fanout = FanOut(timeout=0.05, logger=_quiet_logger())
+    fanout.subscribe(_recorder(received, "a", 0.01), name="a")
+    fanout.subscribe(_recorder(received, "bad", fail_odd=True), name="bad")
+    fanout.subscribe(_recorder(received, "slow", 1.0), name="slow")
+
+    async def main():
+        for i in range(4):
+            await fanout.deliver(i)
+
+    asyncio.run(main())
+    assert received == {"a": [0, 1, 2, 3], "bad": [0, 2]}
+    stats = fanout.stats()
+    assert stats["a"]["delivered"] == 4
+    assert (stats["bad"]["delivered"], stats["bad"]["errors"]) == (2, 2)
+    assert (stats["slow"]["delivered"], stats["slow"]["timeouts"]) == (0, 4)
+
+def test_deliver_can_let_errors_propagate():
+    received = {}
+    fanout = FanOut(logger=_quiet_logger(), isolate_errors=False)
+    fanout.subscribe(_recorder(received, "bad", fail_odd=True), name="bad")
+    asyncio.run(fanout.deliver(0))
+    with pytest.raises(RuntimeError):
+        asyncio.run(fanout.deliver(1))
+    assert received == {"bad": [0]} and fanout.stats()["bad"]["errors"] == 1
+
+def test_deliver_runs_subscribers_concurrently():
+    received = {}
+    fanout = FanOut()
+    for name in "abcd":
+        fanout.subscribe(_recorder(received, name, 0.05))
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await fanout.deliver(1)
+        return loop.time() - started
+
+    assert asyncio.run(main()) < 0.15
+    assert len(received) == 4
+
+def test_publish_lets_a_slow_subscriber_fall_behind_alone():
+    received = {}
+    fanout = FanOut(queue_size=2, overflow="drop_oldest")
+    fanout.subscribe(_recorder(received, "fast"), name="fast")
+    fanout.subscribe(_recorder(received, "slow", 0.01), name="slow")
+
+    async def main():
+        for i in range(20):
+            await fanout.publish(i)
+            await asyncio.sleep(0)
+        await fanout.drain()
+        await fanout.close()
+
+    asyncio.run(main())
+    assert received["fast"] == list(range(20))
+    assert received["slow"][-1] == 19 and len(received["slow"]) < 20
+    stats = fanout.stats()
+    assert stats["slow"]["dropped"] == 20 - len(received["slow"]) and stats["fast"]["dropped"] == 0
+
+def test_unsubscribe_delivers_queued_messages_first():
+    received = {}
+    fanout = FanOut()
+    callback = _recorder(received, "a", 0.001)
+    fanout.subscribe(callback)
+
+    async def main():
+        for i in range(5):
+            await fanout.publish(i)
+        assert await fanout.unsubscribe(callback)
+        assert not await fanout.unsubscribe(callback)
+        await fanout.publish(5)
+
+    asyncio.run(main())
+    assert received["a"] == [0, 1, 2, 3, 4] and fanout.subscribers == []
+
+def test_default_names_and_option_checks():
+    async def on_message(data):
+        pass
+
+    fanout = FanOut()
+    assert fanout.subscribe(on_message).name.endswith("on_message#1")
+    with pytest.raises(ValueError):
+        fanout.subscribe(on_message, overflow="newest")
+    with pytest.raises(ValueError):
+        fanout.subscribe(on_message, timeout=0)
+    with pytest.raises(ValueError):
+        FanOut(queue_size=-1)
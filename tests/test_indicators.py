@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from aizypy.indicators import ATR, EMA, MACD, RSI, SMA, BollingerBands, RollingStd
+
+VALUES = 100 + np.cumsum(np.random.default_rng(0).normal(size=400))
+HIGHS, LOWS = VALUES + 1.5, VALUES - 1.5
+
+def _rows(result):
+    if isinstance(result, tuple):
+        return np.column_stack(result)
+    return np.asarray(result, dtype=float).reshape(-1, 1)
+
+def _stream(indicator, values):
+    return [indicator.update(value) for value in values]
+
+def _assert_matches(streamed, batch):
+    ready = [value is not None for value in streamed]
+    assert ready == np.isfinite(batch).all(axis=1).tolist()
+    rows = [np.atleast_1d(np.asarray(value, dtype=float)) for value in streamed if value is not None]
+    assert np.allclose(rows, batch[ready], rtol=1e-9, atol=1e-9)
+
+SINGLE_INPUT = [lambda: SMA(20), lambda: EMA(12), lambda: RSI(14), lambda: RSI(14, "simple"),
+                lambda: RollingStd(20, ddof=1),
+                lambda: BollingerBands(20, 2.0), lambda: MACD(12, 26, 9)]
+
+@pytest.mark.parametrize("make", SINGLE_INPUT)
+def test_streaming_updates_match_the_batch_computation(make):
+    _assert_matches(_stream(make(), VALUES), _rows(make().compute(VALUES)))
+
+@pytest.mark.parametrize("make", SINGLE_INPUT)
+def test_warm_up_continues_like_streaming(make):
+    streamed, warmed = make(), make()
+    _stream(streamed, VALUES[:300])
+    warmed.warm_up(VALUES[:300])
+    assert warmed.ready and warmed.count == streamed.count
+    for value in VALUES[300:]:
+        a, b = streamed.update(value), warmed.update(value)
+        assert np.allclose(np.asarray(a, dtype=float), np.asarray(b, dtype=float), rtol=1e-9)
+
+def test_atr_streams_batches_and_warms_up():
+    atr = ATR(14)
+    streamed = [atr.update(h, l, c) for h, l, c in zip(HIGHS, LOWS, VALUES)]
+    _assert_matches(streamed, _rows(ATR(14).compute(HIGHS, LOWS, VALUES)))
+    warmed = ATR(14)
+    warmed.warm_up(HIGHS, LOWS, VALUES)
+    assert warmed.update(101.0, 98.0, 99.0) == pytest.approx(atr.update(101.0, 98.0, 99.0))
+
+def test_simple_values_against_definitions():
+    assert SMA(5).compute(VALUES)[-1] == pytest.approx(VALUES[-5:].mean())
+    assert RollingStd(5).compute(VALUES)[-1] == pytest.approx(VALUES[-5:].std())
+    rising = np.arange(1.0, 40.0)
+    assert RSI(14).compute(rising)[-1] == pytest.approx(100.0)
+    sma = SMA(3)
+    assert [sma.update(v) for v in (1.0, 2.0, 3.0, 4.0)] == [None, None, 2.0, 3.0]
+    sma.reset()
+    assert not sma.ready and sma.update(5.0) is None
+
+def test_simple_rsi_averages_the_last_period_changes():
+    changes = np.diff(VALUES[-15:])
+    gain, loss = np.clip(changes, 0, None).mean(), np.clip(-changes, 0, None).mean()
+    assert RSI(14, "simple").compute(VALUES)[-1] == pytest.approx(100 - 100 / (1 + gain / loss))
+    with pytest.raises(ValueError):
+        RSI(14, "ema")
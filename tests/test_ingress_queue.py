@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import pytest
+from aizypy import CandleData, IngressQueue, WebSocketHandler
+
+def candle(pair: str, close: float) -> CandleData:
+    return CandleData(0, close, close, close, close, 1.0, pair)
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        IngressQueue(1, "bogus")
+    with pytest.raises(ValueError):
+        IngressQueue(1, "conflate")
+
+def test_drop_oldest_at_capacity():
+    queue = IngressQueue(2, "drop_oldest")
+    for i in range(5):
+        queue.put_nowait(i)
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [3, 4]
+    assert queue.dropped == 3
+    assert queue.high_water == 2
+
+def test_block_raises_when_full():
+    queue = IngressQueue(1, "block")
+    queue.put_nowait(1)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(2)
+
+def test_conflate_replaces_same_key_at_capacity():
+    queue = IngressQueue(1, "conflate", WebSocketHandler.route_key)
+    queue.put_nowait(candle("BTC/USD", 1.0))
+    queue.put_nowait(candle("BTC/USD", 2.0))
+    assert queue.qsize() == 1
+    assert queue.get_nowait().close == 2.0
+    assert queue.conflated == 1
+    assert queue.dropped == 1
+
+def test_conflate_keeps_position_and_drops_oldest_other_key():
+    queue = IngressQueue(2, "conflate", WebSocketHandler.route_key)
+    queue.put_nowait(candle("BTC/USD", 1.0))
+    queue.put_nowait(candle("ETH/USD", 1.0))
+    queue.put_nowait(candle("BTC/USD", 2.0))
+    queue.put_nowait(candle("SOL/USD", 1.0))
+    assert [(c.pair, c.close) for c in (queue.get_nowait(), queue.get_nowait())] == [
+        ("ETH/USD", 1.0), ("SOL/USD", 1.0)]
+
+def test_conflate_join_completes_after_replacements():
+    async def run():
+        queue = IngressQueue(1, "conflate", WebSocketHandler.route_key)
+        for close in range(3):
+            await queue.put(candle("BTC/USD", close))
+        queue.get_nowait()
+        queue.task_done()
+        await asyncio.wait_for(queue.join(), 1)
+    asyncio.run(run())
+
+def test_handler_conflates_at_capacity():
+    async def run():
+        seen = []
+
+        async def callback(data):
+            seen.append(data.close)
+
+        handler = WebSocketHandler(logging.getLogger("test"), queue_size=1, overflow="conflate")
+        handler.set_callback(callback)
+        for close in range(5):
+            await handler.on_message(candle("BTC/USD", close))
+        await handler.drain()
+        await handler.close()
+        return seen
+    assert asyncio.run(run())[-1] == 4
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import aizypy
+
+def _loaded_after(statement):
+    code = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    return set(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True,
+                              text=True).stdout.split())
+
+def test_live_bot_import_skips_backtesting():
+    loaded = _loaded_after("from aizypy import AizyBot")
+    assert "aizypy.AizyBot" in loaded
+    assert not loaded & {"aizypy.TestEngine", "aizypy.VectorTestEngine", "aizypy.MarketGenerator", "numpy"}
+
+def test_package_import_loads_no_exports():
+    loaded = _loaded_after("import aizypy")
+    assert not [name for name in loaded if name.startswith("aizypy.")]
+
+def test_every_export_resolves_to_itself():
+    for name in aizypy.__all__:
+        assert getattr(aizypy, name).__name__ == name
+    assert set(aizypy.__all__) <= set(dir(aizypy))
+
+def test_submodule_import_does_not_shadow_the_export():
+    import aizypy.CandleData
+    assert isinstance(aizypy.CandleData, type)
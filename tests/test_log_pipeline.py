@@ -0,0 +1,41 @@
+import json
+import logging
+from aizypy import LogPipeline
+
+def _log_failure(pipeline, name):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    pipeline.attach(logger)
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("order %s failed", 42)
+    logger.info("done")
+    pipeline.stop()
+
+def test_jsonl_keeps_the_traceback_in_its_own_field(tmp_path):
+    path = tmp_path / "bot.jsonl"
+    _log_failure(LogPipeline(str(path), "jsonl"), "test.pipeline.jsonl")
+    failure, done = [json.loads(line) for line in path.read_text().splitlines()]
+    assert failure["msg"] == "order 42 failed" and failure["level"] == "ERROR"
+    assert failure["exc"].startswith("Traceback") and "ZeroDivisionError" in failure["exc"]
+    assert done["msg"] == "done" and "exc" not in done
+
+def test_text_format_still_writes_the_traceback(tmp_path):
+    path = tmp_path / "bot.log"
+    _log_failure(LogPipeline(str(path)), "test.pipeline.text")
+    text = path.read_text()
+    assert text.startswith("order 42 failed\nTraceback")
+    assert "ZeroDivisionError" in text and text.endswith("done\n")
+
+def test_pipelines_are_shared_per_file_and_format(tmp_path):
+    path = str(tmp_path / "shared.log")
+    text, jsonl = LogPipeline.for_file(path), LogPipeline.for_file(path, "jsonl")
+    try:
+        assert LogPipeline.for_file(path) is text and jsonl is not text
+    finally:
+        text.stop()
+        jsonl.stop()
+    assert LogPipeline.for_file(path) is not text
+    LogPipeline.for_file(path).stop()
@@ -0,0 +1,77 @@
+import asyncio
+import multiprocessing
+import pytest
+from aizypy import CandleData, MarketDataBus, MarketDataReader
+
+MS = 1_700_000_000_000
+
+def _publish(bus, start, count, pair="BTC/USD"):
+    for i in range(start, start + count):
+        bus.publish_values(MS + 60_000 * i, i, i + 1.0, i - 1.0, i + 0.5, 2.0, pair)
+
+def test_reader_sees_candles_published_after_it_attached():
+    with MarketDataBus(capacity=16) as bus:
+        _publish(bus, 0, 3)
+        with MarketDataReader(bus.name) as reader:
+            assert reader.poll() == [] and reader.available == 0
+            bus.publish(CandleData(MS, 1.0, 2.0, 0.5, 1.5, 9.0, "ETH/USD"))
+            _publish(bus, 3, 2, pair=None)
+            first, *rest = reader.poll()
+            assert (first.timestamp, first.close, first.volume, first.pair) == (MS, 1.5, 9.0, "ETH/USD")
+            assert [(c.close, c.pair) for c in rest] == [(3.5, None), (4.5, None)]
+            assert reader.missed == 0
+
+def test_oldest_start_and_lapped_readers():
+    with MarketDataBus(capacity=8) as bus:
+        _publish(bus, 0, 20)
+        with MarketDataReader(bus.name, start="oldest") as oldest, MarketDataReader(bus.name) as latest:
+            assert [c.close for c in oldest.poll(max_records=3)] == [13.5, 14.5, 15.5]
+            assert oldest.available == 4
+            _publish(bus, 20, 30)
+            records = latest.poll_records()
+            assert len(records) + latest.missed == 30 and latest.missed == 23
+            assert records["close"].tolist() == [i + 0.5 for i in range(43, 50)]
+            assert [c.close for c in oldest.poll()][-1] == 49.5
+
+def test_run_hands_candles_to_a_callback():
+    received = []
+
+    async def callback(candle):
+        received.append(candle.close)
+
+    async def main(bus, reader):
+        task = asyncio.create_task(reader.run(callback))
+        _publish(bus, 0, 3)
+        while len(received) < 3:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    with MarketDataBus(capacity=8) as bus, MarketDataReader(bus.name) as reader:
+        asyncio.run(main(bus, reader))
+    assert received == [0.5, 1.5, 2.5]
+
+def test_rejects_long_pairs_foreign_blocks_and_closed_buses():
+    with MarketDataBus(capacity=4) as bus:
+        with pytest.raises(ValueError):
+            bus.publish_values(MS, 1.0, 1.0, 1.0, 1.0, 1.0, "A" * 17)
+        name = bus.name
+    with pytest.raises(FileNotFoundError):
+        MarketDataReader(name)
+    with MarketDataBus(capacity=4) as other:
+        other._shm.buf[:8] = b"NOTABUS!"
+        with pytest.raises(ValueError):
+            MarketDataReader(other.name)
+
+def _read_in_child(name):
+    with MarketDataReader(name, start="oldest") as reader:
+        return [c.close for c in reader.poll()]
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_reader_in_another_process():
+    with MarketDataBus(capacity=64) as bus:
+        _publish(bus, 0, 10)
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            results = pool.map(_read_in_child, [bus.name] * 2)
+        assert results == [[i + 0.5 for i in range(10)]] * 2
+        with MarketDataReader(bus.name, start="oldest") as reader:
+            assert len(reader.poll()) == 10
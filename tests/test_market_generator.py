@@ -0,0 +1,42 @@
+import math
+import numpy as np
+import pytest
+from aizypy import GBMGenerator, RandomWalkGenerator, RegimeSwitchingGenerator, UniformGenerator
+
+GENERATORS = [UniformGenerator, RandomWalkGenerator, GBMGenerator, RegimeSwitchingGenerator]
+
+@pytest.mark.parametrize("generator", GENERATORS)
+def test_seeded_candles_are_reproducible_and_consistent(generator):
+    candles = list(generator(count=500, seed=3, block_size=128, interval=5))
+    assert [c.to_row() for c in candles] == [c.to_row() for c in generator(count=500, seed=3, block_size=128, interval=5)]
+    assert len(candles) == 500
+    assert all(b.timestamp - a.timestamp == 300_000 for a, b in zip(candles, candles[1:]))
+    assert all(c.low <= min(c.open, c.close) <= max(c.open, c.close) <= c.high and c.low > 0 for c in candles)
+
+@pytest.mark.parametrize("generator", [RandomWalkGenerator, GBMGenerator, RegimeSwitchingGenerator])
+def test_paths_are_continuous_across_blocks(generator):
+    candles = list(generator(count=300, seed=1, block_size=64))
+    assert candles[0].open == generator(count=1).start_price
+    assert all(b.open == a.close for a, b in zip(candles, candles[1:]))
+
+def test_blocks_match_the_candle_stream():
+    generator = GBMGenerator(count=1000, seed=9, block_size=300)
+    blocks = list(generator.blocks())
+    assert [len(block["close"]) for block in blocks] == [300, 300, 300, 100]
+    closes = np.concatenate([block["close"] for block in blocks])
+    assert closes.tolist() == [c.close for c in generator]
+
+def test_gbm_volatility_matches_its_parameter():
+    generator = GBMGenerator(count=200_000, seed=2, volatility=0.5)
+    closes = np.concatenate([block["close"] for block in generator.blocks()])
+    annualized = np.diff(np.log(closes)).std() * math.sqrt(525_600)
+    assert annualized == pytest.approx(0.5, rel=0.02)
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        GBMGenerator(start_price=0)
+    with pytest.raises(ValueError):
+        RandomWalkGenerator(block_size=0)
+
+def test_integer_start_is_epoch_milliseconds():
+    assert [c.timestamp for c in GBMGenerator(count=3, start=0, interval=1)] == [0, 60_000, 120_000]
@@ -0,0 +1,67 @@
+import asyncio
+import contextlib
+import io
+from aizypy import AizyBot, CandleData, MatchingEngine, Order, OrderStatus
+from aizypy import TestEngine as BacktestEngine
+
+def limit(side: str, price: float) -> Order:
+    order = Order(side, 1.0, price, "BTC/USD", "limit")
+    order.status = OrderStatus.PENDING
+    return order
+
+def test_match_fills_crossed_orders_in_price_order():
+    engine = MatchingEngine()
+    orders = [limit("buy", 99), limit("buy", 97), limit("sell", 101), limit("sell", 105)]
+    for order in orders:
+        engine.add(order)
+    filled = engine.match(high=102, low=98)
+    assert [order.price for order in filled] == [99, 101]
+    assert len(engine) == 2
+    assert engine.best_bid() == 97
+    assert engine.best_ask() == 105
+
+def test_cancelled_order_is_not_filled():
+    engine = MatchingEngine()
+    order = limit("buy", 100)
+    engine.add(order)
+    assert engine.cancel(order)
+    assert not engine.cancel(order)
+    assert engine.match(high=110, low=90) == []
+
+def test_order_no_longer_pending_is_not_filled():
+    engine = MatchingEngine()
+    order = limit("sell", 100)
+    engine.add(order)
+    order.status = OrderStatus.CANCELLED
+    assert engine.match(high=110, low=90) == []
+    assert len(engine) == 0
+
+def test_cancelled_entries_are_purged():
+    engine = MatchingEngine()
+    orders = [limit("buy", 50 + i % 10) for i in range(1000)]
+    for order in orders:
+        engine.add(order)
+    for order in orders[:900]:
+        engine.cancel(order)
+    assert len(engine) == 100
+    assert len(engine._bids) <= 2 * len(engine) + MatchingEngine.COMPACT_SLACK
+
+class CancellingBot(AizyBot):
+    """Places one limit buy far below the market, then cancels it directly."""
+
+    async def bot_action(self, candle_data: CandleData) -> None:
+        if not self.order_manager.orders:
+            await self.place_order("buy", 1.0, candle_data.close * 0.5, "BTC/USD", "limit")
+            self.order_manager.cancel_order(self.order_manager.orders[0])
+
+def test_bot_cancelled_order_opens_no_position():
+    candles = [CandleData(1_700_000_000_000 + 60_000 * i, 100.0, 101.0, 99.0, 100.0, 1.0) for i in range(5)]
+    candles += [CandleData(1_700_000_000_000 + 60_000 * (5 + i), 40.0, 41.0, 39.0, 40.0, 1.0) for i in range(5)]
+    engine = BacktestEngine(lambda **kwargs: CancellingBot(log_file="/dev/null", **kwargs),
+                        data_source=candles, report="aggregate")
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(engine.run())
+    assert engine.bot_instance.list_active_trades() == []
+    assert engine.metrics.open_positions == 0
+    assert engine.metrics.exposure == 0.0
+    assert engine.open_trade_times == {}
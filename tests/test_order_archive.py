@@ -0,0 +1,39 @@
+from aizypy import Order, OrderArchive, OrderStatus
+
+def _order(order_id, pair="BTC/USD", status=OrderStatus.CLOSED):
+    return Order(side="buy", amount=1.5, price=10.25, pair=pair, order_type="limit", order_id=order_id,
+                 status=status, created_ns=123)
+
+def test_orders_round_trip_through_the_file(tmp_path):
+    archive = OrderArchive(str(tmp_path / "orders.jsonl"))
+    archive.append(_order("a"))
+    archive.append(_order("b", "ETH/USD", OrderStatus.FAILED))
+    restored = archive.get("b")
+    assert (restored.order_id, restored.pair, restored.side, restored.amount, restored.price,
+            restored.order_type, restored.status, restored.created_ns) == (
+        "b", "ETH/USD", "buy", 1.5, 10.25, "limit", OrderStatus.FAILED, 123)
+    assert archive.get("missing") is None and archive.count == 2
+    archive.close()
+    assert (tmp_path / "orders.jsonl").read_text().splitlines()[0] == \
+        '["a","BTC/USD","buy",1.5,10.25,"limit","Closed",123]'
+
+def test_reopening_keeps_existing_orders(tmp_path):
+    path = str(tmp_path / "orders.jsonl")
+    first = OrderArchive(path)
+    first.append(_order("a"))
+    first.close()
+    second = OrderArchive(path)
+    second.append(_order("b", "ETH/USD"))
+    second.append(_order("c", status=OrderStatus.CANCELLED))
+    assert [o.order_id for o in second] == ["a", "b", "c"]
+    assert [o.order_id for o in second.list_orders(pair="BTC/USD")] == ["a", "c"]
+    assert [o.order_id for o in second.list_orders(OrderStatus.CLOSED, "BTC/USD")] == ["a"]
+    assert second.count == 2
+    second.close()
+
+def test_id_lookup_matches_whole_ids(tmp_path):
+    archive = OrderArchive(str(tmp_path / "orders.jsonl"))
+    archive.append(_order("ab"))
+    archive.append(_order("a"))
+    assert archive.get("a").order_id == "a"
+    archive.close()
@@ -0,0 +1,42 @@
+import multiprocessing
+import os
+import pytest
+from datetime import datetime, timezone
+from aizypy import Order, OrderIdGenerator, OrderStatus
+from aizypy.OrderManager import _order_ids
+
+def test_ids_increase_and_embed_worker():
+    generator = OrderIdGenerator(worker_id=5)
+    ids = [generator.next_id() for _ in range(10_000)]
+    assert ids == sorted(set(ids))
+    assert all((i >> OrderIdGenerator.SEQUENCE_BITS) & 1023 == 5 for i in ids)
+
+def test_created_at_ms_matches_creation_time():
+    order = Order("buy", 1.0, 100.0, "BTC/USD")
+    assert abs(OrderIdGenerator.created_at_ms(order.order_id) - order.created_ns // 1_000_000) <= 1
+
+def _worker_id(_: int) -> int:
+    return (int(Order("buy", 1.0, 1.0, "X").order_id) >> OrderIdGenerator.SEQUENCE_BITS) & 1023
+
+def _worker_and_pid(_: int) -> tuple:
+    return _worker_id(0), (os.getpid() + _order_ids._salt) & 1023
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_workers_get_their_own_worker_id():
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        pairs = set(pool.map(_worker_and_pid, range(16), chunksize=1))
+    assert all(worker == pid for worker, pid in pairs)
+    assert _worker_id(0) == (os.getpid() + _order_ids._salt) & 1023
+
+def test_default_worker_ids_are_salted():
+    salts = {OrderIdGenerator()._salt for _ in range(20)}
+    assert len(salts) > 1
+    generator = OrderIdGenerator()
+    assert generator.worker_id == (os.getpid() + generator._salt) & 1023
+
+def test_constructor_still_accepts_a_timestamp():
+    created = datetime(2024, 5, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    by_keyword = Order("buy", 1.0, 100.0, "BTC/USD", timestamp=created)
+    positional = Order("buy", 1.0, 100.0, "BTC/USD", "market", "1", OrderStatus.CREATED, created)
+    assert by_keyword.timestamp == positional.timestamp == created
+    assert by_keyword.created_ns == 1_714_564_800_123_456_000
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from aizypy import AizyBot, OrderArchive, OrderManager, OrderStatus
+
+def _manager(**kwargs):
+    return OrderManager(logging.getLogger("test.orders"), **kwargs)
+
+def test_batch_applies_the_single_order_rules():
+    requests = [{"side": "buy", "amount": 1.0, "price": 10.0, "pair": "BTC/USD"},
+                {"side": "sell", "amount": 0.0, "price": 10.0, "pair": "BTC/USD"},
+                {"side": "buy", "amount": 2.0, "price": 9.0, "pair": "ETH/USD", "order_type": "limit"},
+                {"side": "buy", "amount": 1.0, "price": 9.0, "pair": "ETH/USD", "order_type": "stop"}]
+    batch = _manager()
+    placed = batch.place_orders(requests)
+    single = _manager()
+    for request in requests:
+        order = single.create_order(**request)
+        if single.validate_order(order):
+            single.execute_order(order)
+    assert [o.status for o in batch.orders] == [o.status for o in single.orders] == [
+        OrderStatus.ACTIVE, OrderStatus.FAILED, OrderStatus.PENDING, OrderStatus.VALIDATED]
+    assert [o.amount for o in placed] == [1.0, 2.0, 1.0]
+
+def test_execute_requires_validation():
+    manager = _manager()
+    order = manager.create_order("buy", 1.0, 10.0, "BTC/USD")
+    assert not manager.execute_order(order) and order.status is OrderStatus.CREATED
+
+def test_cancel_orders_and_close_all_filter():
+    manager = _manager()
+    manager.place_orders([{"side": side, "amount": 1.0, "price": price, "pair": pair, "order_type": order_type}
+                          for side in ("buy", "sell") for pair in ("BTC/USD", "ETH/USD")
+                          for price, order_type in ((10.0, "market"), (5.0, "limit"))])
+    cancelled = manager.cancel_orders(lambda order: order.side == "buy", pair="BTC/USD")
+    assert [(o.side, o.pair, o.order_type) for o in cancelled] == [("buy", "BTC/USD", "limit")]
+    closed = manager.close_all(side="sell")
+    assert sorted(o.pair for o in closed) == ["BTC/USD", "ETH/USD"]
+    assert all(o.status is OrderStatus.CLOSED for o in closed)
+    assert len(manager.list_active_trades()) == 2 and len(manager.list_pending_orders()) == 3
+
+def test_retention_moves_terminal_orders_to_the_archive(tmp_path):
+    manager = _manager(retain_terminal=2, archive=OrderArchive(str(tmp_path / "orders.jsonl")))
+    orders = [manager.create_order("buy", 1.0, 10.0 + i, "BTC/USD") for i in range(5)]
+    for order in orders:
+        manager.cancel_order(order)
+    assert manager.evicted == 3 and [o.order_id for o in manager.orders] == [o.order_id for o in orders[3:]]
+    archived = manager.get_order_by_id(orders[0].order_id, include_archived=True)
+    assert (archived.price, archived.status) == (10.0, OrderStatus.CANCELLED)
+    assert len(manager.list_orders(OrderStatus.CANCELLED, include_archived=True)) == 5
+    manager.archive.close()
+
+def test_compact_without_retention_limit():
+    manager = _manager()
+    for i in range(4):
+        manager.cancel_order(manager.create_order("buy", 1.0, 10.0, "BTC/USD"))
+    manager.create_order("buy", 1.0, 10.0, "BTC/USD")
+    assert manager.compact(retain=1) == 3 and len(manager.orders) == 2
+
+class RecordingSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def send_orders(self, orders):
+        self.messages.append(("orders", len(orders)))
+
+    async def send_close_orders(self, orders):
+        self.messages.append(("close", len(orders)))
+
+def test_bot_batches_are_single_messages():
+    socket = RecordingSocket()
+    bot = AizyBot(log_file="/dev/null", websocket=socket)
+
+    async def main():
+        await bot.place_orders([{"side": "buy", "amount": 1.0, "price": 10.0 + i, "pair": "BTC/USD"}
+                                for i in range(20)])
+        return await bot.close_all(pair="BTC/USD")
+
+    closed = asyncio.run(main())
+    assert len(closed) == 20 and socket.messages == [("orders", 20), ("close", 20)]
+    assert bot.metrics.open_positions == 0
+
+def test_indexes_follow_every_status_change():
+    manager = _manager()
+    btc = [manager.create_order("buy", 1.0, 10.0, "BTC/USD") for _ in range(3)]
+    eth = manager.create_order("sell", 1.0, 20.0, "ETH/USD", order_type="limit")
+    for order in btc + [eth]:
+        manager.validate_order(order)
+        manager.execute_order(order)
+    manager.close_order(btc[0])
+    assert manager.get_order_by_id(eth.order_id) is eth and manager.get_order_by_id("missing") is None
+    assert manager.list_orders(OrderStatus.ACTIVE, "BTC/USD") == btc[1:]
+    assert manager.list_orders(OrderStatus.CLOSED) == [btc[0]]
+    assert manager.list_orders(pair="ETH/USD") == [eth] and manager.list_orders(pair="XRP/USD") == []
+    assert manager.fill_order(eth) and not manager.fill_order(eth)
+    assert manager.list_active_trades() == btc[1:] + [eth] and manager.list_pending_orders() == []
+    assert not manager.cancel_order(eth) and manager.orders == btc + [eth]
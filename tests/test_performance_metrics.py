@@ -0,0 +1,48 @@
+import asyncio
+import contextlib
+import io
+import numpy as np
+import pytest
+from aizypy import AizyBot, PerformanceMetrics
+from aizypy import TestEngine as BacktestEngine
+
+def test_streaming_metrics_match_batch_computation():
+    rng = np.random.default_rng(1)
+    prices = 100 + np.cumsum(rng.normal(0, 1, 500))
+    metrics = PerformanceMetrics()
+    for i, price in enumerate(prices):
+        if i % 10 == 0:
+            metrics.open_position("buy" if i % 20 == 0 else "sell", price)
+        elif i % 10 == 5:
+            metrics.close_position("buy" if i % 20 == 5 else "sell", prices[i - 5], price)
+        metrics.update(price)
+    curve = np.asarray(metrics.equity_curve)
+    changes = np.diff(curve, prepend=0.0)
+    assert len(curve) == metrics.candles == 500
+    assert metrics.max_drawdown == pytest.approx(np.max(np.maximum.accumulate(np.maximum(curve, 0)) - curve))
+    assert metrics.sharpe == pytest.approx(changes.mean() / changes.std(ddof=1))
+    assert metrics.trades == 50 and metrics.wins + metrics.losses == 50
+    assert metrics.exposure == pytest.approx(0.5)
+
+def test_equity_curve_can_be_disabled():
+    metrics = PerformanceMetrics(keep_equity_curve=False)
+    for price in range(1, 1000):
+        metrics.update(float(price))
+    assert len(metrics.equity_curve) == 0 and metrics.candles == 999
+
+class AlternatingBot(AizyBot):
+    async def bot_action(self, candle_data):
+        trades = self.list_active_trades()
+        if trades:
+            await self.close_trade(trades[0])
+        else:
+            await self.place_order("buy", 1.0, candle_data.close, "BTC/USD")
+
+def test_bot_keeps_no_equity_curve_but_engine_does():
+    engine = BacktestEngine(lambda **kwargs: AlternatingBot(log_file="/dev/null", **kwargs), duration=60, seed=3,
+                            report="aggregate")
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(engine.run())
+    assert engine.bot_instance.metrics.candles == 60 and engine.bot_instance.metrics.trades == 30
+    assert len(engine.bot_instance.metrics.equity_curve) == 0
+    assert len(engine.metrics.equity_curve) == engine.metrics.candles > 0
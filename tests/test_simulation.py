@@ -0,0 +1,78 @@
+import asyncio
+import contextlib
+import io
+import time
+import pytest
+from aizypy import AizyBot
+from aizypy import TestEngine as BacktestEngine
+from aizypy.SimulationClock import EventQueue, SimulatedClock
+
+def test_events_run_in_time_order_with_stable_ties():
+    clock = SimulatedClock(0)
+    queue = EventQueue(clock)
+    seen = []
+
+    async def event(name):
+        seen.append((clock.now, name))
+        if name == "a":
+            queue.schedule(25, event, "scheduled by a")
+
+    for when, name in ((30, "c"), (10, "a"), (30, "d"), (20, "b")):
+        queue.schedule(when, event, name)
+    asyncio.run(queue.run())
+    assert seen == [(10, "a"), (20, "b"), (25, "scheduled by a"), (30, "c"), (30, "d")]
+    assert queue.processed == 5 and len(queue) == 0
+
+def test_clock_never_moves_back_and_paced_mode_sleeps():
+    clock = SimulatedClock(1000, mode="paced", speed=1000.0)
+
+    async def main():
+        started = time.perf_counter()
+        await clock.advance_to(51_000)
+        await clock.advance_to(2_000)
+        return time.perf_counter() - started
+
+    assert asyncio.run(main()) >= 0.045 and clock.now == 51_000
+    with pytest.raises(ValueError):
+        SimulatedClock(0, mode="realtime")
+    with pytest.raises(ValueError):
+        SimulatedClock(0, speed=0)
+
+class CountingBot(AizyBot):
+    def __init__(self, **kwargs):
+        super().__init__(log_file="/dev/null", **kwargs)
+        self.seen = []
+
+    async def bot_action(self, candle_data):
+        self.seen.append((candle_data.timestamp, candle_data.close))
+
+def _run(**kwargs):
+    engine = BacktestEngine(CountingBot, report="aggregate", **kwargs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(engine.run())
+    return engine
+
+def test_fast_mode_replays_every_candle_without_waiting():
+    started = time.perf_counter()
+    engine = _run(duration=2000, interval=5, seed=7)
+    assert time.perf_counter() - started < 5
+    seen = engine.bot_instance.seen
+    assert len(seen) == 2000 and all(b[0] - a[0] == 300_000 for a, b in zip(seen, seen[1:]))
+    assert engine.event_queue.processed == 2000
+
+def test_seeded_runs_are_reproducible():
+    first, second = _run(duration=50, seed=11), _run(duration=50, seed=11)
+    assert first.bot_instance.seen == second.bot_instance.seen
+    assert first.bot_instance.seen != _run(duration=50, seed=12).bot_instance.seen
+
+class FailingBot(CountingBot):
+    async def bot_action(self, candle_data):
+        await super().bot_action(candle_data)
+        if len(self.seen) == 3:
+            raise RuntimeError("strategy bug")
+
+def test_strategy_errors_fail_the_backtest():
+    engine = BacktestEngine(FailingBot, duration=10, report="aggregate", seed=1)
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(RuntimeError, match="strategy bug"):
+        asyncio.run(engine.run())
+    assert len(engine.bot_instance.seen) == 3
@@ -0,0 +1,108 @@
+import asyncio
+import pickle
+import threading
+import numpy as np
+import pytest
+from aizypy import AizyBot, CandleData, CandleSeries
+from aizypy.indicators import SMA
+
+MS = 1_700_000_000_000
+
+def _candles(count, seed=1):
+    prices = 100 + np.cumsum(np.random.default_rng(seed).normal(0, 1, count))
+    return [CandleData(MS + 60_000 * i, p, p + 1, p - 1, p, 1.0) for i, p in enumerate(prices.tolist())]
+
+class CrossBot(AizyBot):
+    def __init__(self, **kwargs):
+        super().__init__(log_file="/dev/null", history_size=50, **kwargs)
+        self.sma = SMA(10)
+        self.last_position = None
+        self.register_state("sma", "last_position")
+
+    async def bot_action(self, candle_data):
+        sma = self.sma.update(candle_data.close)
+        if sma is None:
+            return
+        position = "long" if candle_data.close > sma else "short"
+        if position != self.last_position:
+            await self.close_all()
+            await self.place_order("buy" if position == "long" else "sell", 1.0, candle_data.close, "BTC/USD")
+            await self.place_order("buy", 1.0, candle_data.close - 5, "BTC/USD", order_type="limit")
+            self.last_position = position
+
+async def _feed(bot, candles):
+    for candle in candles:
+        await bot._on_candle(candle)
+
+def test_restored_bot_continues_like_the_original(tmp_path):
+    path = str(tmp_path / "bot.snap")
+    candles = _candles(300)
+    original = CrossBot(snapshot_path=path)
+    asyncio.run(_feed(original, candles[:200]))
+    assert original.snapshot() > 0
+
+    restored = CrossBot(snapshot_path=path)
+    assert restored.restore()
+    assert [(o.order_id, o.status) for o in restored.order_manager.orders] == [
+        (o.order_id, o.status) for o in original.order_manager.orders]
+    assert np.array_equal(restored.candles.closes, original.candles.closes)
+    assert restored.metrics.snapshot() == original.metrics.snapshot()
+    assert restored.last_position == original.last_position
+
+    asyncio.run(_feed(original, candles[200:]))
+    asyncio.run(_feed(restored, candles[200:]))
+    assert restored.metrics.snapshot() == pytest.approx(original.metrics.snapshot())
+    assert len(restored.list_active_trades()) == len(original.list_active_trades())
+    assert restored.sma.value == original.sma.value
+
+def test_periodic_snapshots_are_written_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "bot.snap")
+    bot = CrossBot(snapshot_path=path, snapshot_interval=0.0)
+    writers = []
+    write = bot._write_snapshot
+
+    def recording_write(*args):
+        writers.append(threading.get_ident())
+        write(*args)
+
+    bot._write_snapshot = recording_write
+
+    async def main():
+        await _feed(bot, _candles(50))
+        await bot.stop()
+
+    asyncio.run(main())
+    assert writers and writers[0] != threading.get_ident() and writers[-1] == threading.get_ident()
+    restored = CrossBot()
+    assert restored.restore(path) and restored.metrics.snapshot() == bot.metrics.snapshot()
+
+def test_restore_without_snapshot_and_bad_files(tmp_path):
+    bot = CrossBot()
+    assert not bot.restore(str(tmp_path / "missing"))
+    with pytest.raises(ValueError):
+        bot.restore()
+    bad = tmp_path / "bad"
+    bad.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        bot.restore(str(bad))
+
+def test_restore_resizes_candle_buffers(tmp_path):
+    path = str(tmp_path / "bot.snap")
+    original = CrossBot()
+    asyncio.run(_feed(original, _candles(80)))
+    original.snapshot(path)
+    smaller = AizyBot(log_file="/dev/null", history_size=20)
+    smaller.restore(path)
+    assert smaller.candles.capacity == 20
+    assert np.array_equal(smaller.candles.closes, original.candles.closes[-20:])
+
+def test_candle_series_pickles_only_its_window():
+    series = CandleSeries(8)
+    for candle in _candles(13):
+        series.append(candle)
+    copy = pickle.loads(pickle.dumps(series))
+    assert len(copy) == 8 and copy.capacity == 8
+    assert copy.last_timestamp == series.last_timestamp
+    assert np.array_equal(copy.closes, series.closes)
+    copy.append_values(1.0, 2.0, 0.5, 1.5, 3.0)
+    assert copy.closes[-1] == 1.5 and np.array_equal(copy.closes[:-1], series.closes[1:])
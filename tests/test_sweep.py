@@ -0,0 +1,39 @@
+import asyncio
+import contextlib
+import io
+from aizypy import AizyBot
+from aizypy import TestEngine as BacktestEngine
+
+class ThresholdBot(AizyBot):
+    def __init__(self, threshold=1500.0, **kwargs):
+        super().__init__(log_file="/dev/null", **kwargs)
+        self.threshold = threshold
+
+    async def bot_action(self, candle_data):
+        if candle_data.close > self.threshold and not self.list_active_trades():
+            await self.place_order("buy", 1.0, candle_data.close, "BTC/USD")
+        elif candle_data.close < self.threshold:
+            for trade in self.list_active_trades():
+                await self.close_trade(trade)
+
+def test_sweep_matches_individual_runs_in_grid_order():
+    grid = {"threshold": [1200.0, 1500.0, 1800.0]}
+    results = asyncio.run(BacktestEngine.sweep(ThresholdBot, grid, workers=2, duration=200, include_trades=True))
+    assert [r["params"] for r in results] == [{"threshold": t} for t in grid["threshold"]]
+    for result in results:
+        engine = BacktestEngine(lambda **kwargs: ThresholdBot(result["params"]["threshold"], **kwargs),
+                                duration=200, seed=0, report="aggregate")
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(engine.run())
+        assert {k: result[k] for k in engine.summary()} == engine.summary()
+        assert result["candles"] == 200 and len(result["trade_log"]) == result["natural_trades"]
+    assert len({r["total_trades"] for r in results}) > 1
+
+def test_sweep_table_sorts_by_column():
+    rows = [{"params": {"threshold": t}, "total_trades": n, "total_profit_loss": pl, "natural_profit_loss": pl,
+             "average_duration": 1.0, "max_drawdown": 0.0, "sharpe": 0.0, "candles": 10, "seconds": 0.1}
+            for t, n, pl in ((1.0, 3, -5.0), (2.0, 4, 7.5))]
+    lines = BacktestEngine.format_sweep_table(rows).splitlines()
+    assert lines[0].split()[:3] == ["threshold", "total_trades", "total_profit_loss"]
+    assert [line.split()[:3] for line in lines[2:]] == [["2.00", "4", "7.50"], ["1.00", "3", "-5.00"]]
+    assert BacktestEngine.format_sweep_table([]) == ""
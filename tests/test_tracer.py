@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import pytest
+from aizypy import LatencyHistogram, Tracer, WebSocketHandler
+
+def test_tick_state_does_not_outlive_the_message():
+    tracer = Tracer(sample_rate=0.5)
+    handler = WebSocketHandler(logging.getLogger("test"), tracer=tracer)
+    seen = []
+
+    async def callback(data):
+        seen.append(tracer.start() is not None)
+
+    async def main():
+        handler.set_callback(callback)
+        await handler.on_message({"n": 1})
+        await handler.on_message({"n": 2})
+        # Outside a tick, spans are sampled on their own again
+        return [tracer.start() is not None for _ in range(4)]
+
+    outside = asyncio.run(main())
+    assert seen == [False, True]
+    assert outside.count(True) == 2
+
+def test_tick_resets_when_the_callback_raises():
+    tracer = Tracer()
+    handler = WebSocketHandler(logging.getLogger("test"), tracer=tracer)
+
+    async def callback(data):
+        raise RuntimeError("boom")
+
+    async def main():
+        handler.set_callback(callback)
+        with pytest.raises(RuntimeError):
+            await handler.on_message({})
+        tracer.mark_order()
+
+    asyncio.run(main())
+    assert "tick_to_order" not in tracer.histograms
+
+def test_sampled_tick_records_callback_and_tick_to_order():
+    tracer = Tracer()
+    spans = []
+    tracer.add_hook(spans.append)
+    handler = WebSocketHandler(logging.getLogger("test"), queue_size=4, tracer=tracer)
+
+    async def callback(data):
+        tracer.mark_order(side="buy")
+
+    async def main():
+        handler.set_callback(callback)
+        handler.subscribe("BTC/USD", callback)
+        await handler.on_message({"pair": "BTC/USD"})
+        await handler.on_message({"pair": "ETH/USD"})
+        await handler.drain()
+        await handler.close()
+
+    asyncio.run(main())
+    assert tracer.histograms["bot.callback"].count == 2
+    assert tracer.histograms["tick_to_order"].count == 2
+    assert {span.attributes.get("pair") for span in spans if span.name == "bot.callback"} == {"BTC/USD", None}
+
+def test_latency_histogram_percentiles_within_precision():
+    histogram = LatencyHistogram(precision_bits=7)
+    for value in range(1, 100_001):
+        histogram.record(value * 1000)
+    percentiles = histogram.percentiles()
+    assert histogram.count == 100_000 and histogram.max == 100_000_000
+    assert percentiles["p50"] == pytest.approx(50_000_000, rel=1 / 64)
+    assert percentiles["p99"] == pytest.approx(99_000_000, rel=1 / 64)
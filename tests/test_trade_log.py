@@ -0,0 +1,64 @@
+import gc
+import os
+import pytest
+from aizypy import TradeLog
+
+def _trade(i):
+    return {"trade_id": str(i), "side": "buy" if i % 3 else "sell", "entry_price": 100.0 + i,
+            "exit_price": 101.0 + i * 0.5, "profit_loss": 1.0 - i * 0.5, "duration_intervals": float(i % 7),
+            "open_interval": i, "close_interval": i + i % 7}
+
+def test_spilled_log_reads_back_every_trade_in_order():
+    log = TradeLog(spill_threshold=4)
+    trades = [_trade(i) for i in range(11)]
+    for trade in trades:
+        log.append(trade)
+    assert len(log) == 11 and log.spilled == 8
+    assert list(log) == trades
+    assert log[2] == trades[2] and log[-1] == trades[-1]
+    with pytest.raises(IndexError):
+        log[11]
+
+def test_totals_and_columns_match_the_trades():
+    log = TradeLog(spill_threshold=5)
+    trades = [_trade(i) for i in range(12)]
+    for trade in trades:
+        log.append(trade)
+    profit_losses = [t["profit_loss"] for t in trades]
+    summary = log.summary()
+    assert summary["trades"] == 12 and summary["profit_loss"] == pytest.approx(sum(profit_losses))
+    assert summary["win_rate"] == pytest.approx(sum(p > 0 for p in profit_losses) / 12)
+    assert (summary["best"], summary["worst"]) == (max(profit_losses), min(profit_losses))
+    columns = log.columns()
+    assert columns["profit_loss"].tolist() == profit_losses
+    assert columns["side"].tolist() == [1 if t["side"] == "buy" else -1 for t in trades]
+    assert columns["trade_id"].tolist() == [int(t["trade_id"]) for t in trades]
+    assert columns["close_interval"].tolist() == [t["close_interval"] for t in trades]
+
+def test_columns_do_not_spill_and_read_in_chunks(monkeypatch):
+    monkeypatch.setattr(TradeLog, "READ_CHUNK", 3)
+    log = TradeLog(spill_threshold=8)
+    trades = [_trade(i) for i in range(13)]
+    for trade in trades:
+        log.append(trade)
+    columns = log.columns()
+    assert log.spilled == 8 and len(log) == 13
+    assert columns["trade_id"].dtype == "int64" and columns["trade_id"].tolist() == list(range(13))
+    assert columns["exit_price"].tolist() == [t["exit_price"] for t in trades]
+
+def test_temporary_spill_file_is_removed_with_the_log():
+    log = TradeLog(spill_threshold=1)
+    log.append(_trade(0))
+    log.append(_trade(1))
+    path = log.spill_path
+    assert os.path.exists(path)
+    del log
+    gc.collect()
+    assert not os.path.exists(path)
+
+def test_unspilled_log_and_empty_summary():
+    log = TradeLog(spill_threshold=0)
+    assert not log and log.summary()["average_profit_loss"] == 0.0
+    for i in range(1000):
+        log.append(_trade(i))
+    assert log.spilled == 0 and log.spill_path is None and len(log) == 1000
@@ -0,0 +1,73 @@
+import asyncio
+import numpy as np
+import pytest
+from aizypy import AizyBot, GBMGenerator, VectorTestEngine
+
+HOLDING = 3
+
+def every_fifth(candles):
+    signals = np.zeros(len(candles.close), dtype=np.int8)
+    signals[::5] = 1
+    signals[2::5] = -1
+    return signals
+
+class EveryFifthBot(AizyBot):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, log_file="/dev/null", **kwargs)
+        self.candle = -1
+        self.opened = {}
+
+    async def bot_action(self, candle_data):
+        self.candle += 1
+        for trade in self.list_active_trades():
+            if self.candle - self.opened[trade.order_id] == HOLDING:
+                await self.close_trade(trade)
+        side = {0: "buy", 2: "sell"}.get(self.candle % 5)
+        if side:
+            await self.place_order(side, 1.0, candle_data.close, "BTC/USD")
+            self.opened[self.list_active_trades()[-1].order_id] = self.candle
+
+def test_changes_trades_only_when_the_direction_flips():
+    signals = VectorTestEngine.changes(np.array([np.nan, 1.0, 2.0, 0.0, -1.0, -3.0, 0.0, 1.0]))
+    assert signals.tolist() == [0, 1, 0, 0, -1, 0, 0, 1]
+
+def test_summary_has_the_event_engine_keys_and_values():
+    engine = VectorTestEngine(every_fifth, data_source=GBMGenerator(count=203, seed=4), holding=HOLDING)
+    engine.run()
+    report = engine.cross_check(EveryFifthBot)
+    assert report["match"], report["mismatches"]
+    assert report["vector"].keys() == report["event"].keys()
+    assert report["vector"]["natural_trades"] > 0 and report["vector"]["forced_closes"] > 0
+    for key, value in report["event"].items():
+        assert report["vector"][key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+
+def test_metrics_keep_the_equity_curve():
+    engine = VectorTestEngine(every_fifth, data_source=GBMGenerator(count=100, seed=5), holding=HOLDING)
+    engine.run()
+    assert len(engine.metrics.equity_curve) == engine.metrics.candles == 100
+    assert engine.metrics.realized == pytest.approx(engine.summary()["total_profit_loss"])
+
+def test_signal_of_the_wrong_shape_is_rejected():
+    engine = VectorTestEngine(lambda candles: np.zeros(3), duration=10, seed=1)
+    with pytest.raises(ValueError):
+        engine.run()
+
+def test_nan_signals_place_no_orders():
+    def warming_up(candles):
+        signals = np.ones(len(candles.close))
+        signals[:5] = np.nan
+        return signals
+
+    engine = VectorTestEngine(warming_up, duration=20, seed=1, holding=2)
+    engine.run()
+    assert engine.signals.tolist() == [0] * 5 + [1] * 15
+    assert engine.trades["entry_index"].tolist() == list(range(5, 20))
+
+def test_cross_check_can_run_inside_an_event_loop():
+    engine = VectorTestEngine(every_fifth, data_source=GBMGenerator(count=60, seed=2), holding=HOLDING)
+    engine.run()
+
+    async def main():
+        return await engine.cross_check_async(EveryFifthBot)
+
+    assert asyncio.run(main())["match"]
@@ -0,0 +1,69 @@
+import asyncio
+import numpy as np
+import pytest
+from aizypy import AizyBot, CandleData, CandleSeries, CandleWindow
+from aizypy.indicators import EMA, RSI, SMA
+
+MS = 1_700_000_000_000
+
+def _candles(count, seed=3):
+    prices = 100 + np.cumsum(np.random.default_rng(seed).normal(0, 1, count))
+    return [CandleData(MS + 60_000 * i, p, p + 1, p - 1, p, 2.0, "BTC/USD") for i, p in enumerate(prices.tolist())]
+
+class IndicatorBot(AizyBot):
+    def __init__(self, **kwargs):
+        super().__init__(log_file="/dev/null", history_size=100, **kwargs)
+        self.indicators = [SMA(20), EMA(12), RSI(14)]
+        self.actions = 0
+
+    def on_warm_up(self, candles, pair=None):
+        for indicator in self.indicators:
+            indicator.warm_up(candles.close)
+
+    async def bot_action(self, candle_data):
+        self.actions += 1
+        for indicator in self.indicators:
+            indicator.update(candle_data.close)
+
+async def _feed(bot, candles):
+    for candle in candles:
+        await bot._on_candle(candle)
+
+@pytest.mark.parametrize("as_window", [False, True])
+def test_warm_up_matches_replaying_the_history(as_window):
+    candles = _candles(600)
+    replayed, warmed = IndicatorBot(), IndicatorBot()
+    asyncio.run(_feed(replayed, candles[:500]))
+    history = candles[:500]
+    if as_window:
+        history = CandleWindow(*(np.array([getattr(c, name) for c in history])
+                                 for name in ("open", "high", "low", "close", "volume")))
+    window = warmed.warm_up(history)
+    assert len(window.close) == 500 and warmed.actions == 0
+    assert np.array_equal(warmed.candles.closes, replayed.candles.closes)
+    assert warmed.metrics.candles == 0 and warmed.order_manager.orders == []
+    if not as_window:
+        assert warmed.candles.last_timestamp == replayed.candles.last_timestamp
+    asyncio.run(_feed(replayed, candles[500:]))
+    asyncio.run(_feed(warmed, candles[500:]))
+    for a, b in zip(replayed.indicators, warmed.indicators):
+        assert b.value == pytest.approx(a.value, rel=1e-9)
+
+def test_warm_up_fills_the_pair_buffer():
+    bot = IndicatorBot()
+    bot.subscribe("BTC/USD")
+    bot.warm_up(_candles(30), pair="BTC/USD")
+    assert len(bot.pair_candles["BTC/USD"]) == 30 and len(bot.candles) == 0
+
+def test_extend_values_equals_appending():
+    appended, extended = CandleSeries(16), CandleSeries(16)
+    candles = _candles(40)
+    for candle in candles[:5]:
+        appended.append(candle)
+        extended.append(candle)
+    for candle in candles[5:]:
+        appended.append(candle)
+    extended.extend_values(*(np.array([getattr(c, name) for c in candles[5:]])
+                             for name in ("open", "high", "low", "close", "volume")))
+    for name in ("opens", "highs", "lows", "closes", "volumes"):
+        assert np.array_equal(getattr(extended, name), getattr(appended, name))
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from aizypy import AizyBot, CandleData, WebSocketHandler
+
+def _handler():
+    logger = logging.getLogger("test.routing")
+    logger.propagate = False
+    return WebSocketHandler(logger)
+
+def test_slow_pair_does_not_delay_other_pairs():
+    handler = _handler()
+    order = []
+
+    def recorder(name, delay):
+        async def callback(data):
+            await asyncio.sleep(delay)
+            order.append((name, data["n"]))
+        return callback
+
+    async def main():
+        handler.set_callback(recorder("main", 0))
+        handler.subscribe("SLOW/USD", recorder("slow", 0.02))
+        handler.subscribe("FAST/USD", recorder("fast", 0))
+        for n in range(3):
+            await handler.on_message({"pair": "SLOW/USD", "n": n})
+            await handler.on_message({"pair": "FAST/USD", "n": n})
+        await handler.on_message({"n": 9})
+        await asyncio.sleep(0.005)
+        fast_done = [entry for entry in order if entry[0] == "fast"]
+        await handler.drain()
+        await handler.close()
+        return fast_done
+
+    fast_done = asyncio.run(main())
+    assert fast_done == [("fast", 0), ("fast", 1), ("fast", 2)]
+    assert [n for name, n in order if name == "slow"] == [0, 1, 2]
+    assert ("main", 9) in order and order.index(("main", 9)) < order.index(("slow", 0))
+
+def test_errors_in_one_pair_keep_its_stream_running():
+    handler = _handler()
+    handled = []
+
+    async def callback(data):
+        if data["n"] == 1:
+            raise RuntimeError("bad candle")
+        handled.append(data["n"])
+
+    async def main():
+        handler.subscribe("BTC/USD", callback)
+        for n in range(3):
+            await handler.on_message({"pair": "BTC/USD", "n": n})
+        await handler.drain()
+        await handler.unsubscribe("BTC/USD")
+        await handler.close()
+
+    asyncio.run(main())
+    assert handled == [0, 2] and handler.routes == {}
+
+def test_unsubscribe_delivers_the_queued_messages():
+    handler = _handler()
+    handled = []
+
+    async def callback(data):
+        await asyncio.sleep(0.001)
+        handled.append(data["n"])
+
+    async def main():
+        handler.subscribe("BTC/USD", callback)
+        for n in range(5):
+            await handler.on_message({"pair": "BTC/USD", "n": n})
+        await handler.unsubscribe("BTC/USD")
+        await handler.close()
+
+    asyncio.run(main())
+    assert handled == [0, 1, 2, 3, 4]
+
+class PassiveBot(AizyBot):
+    async def bot_action(self, candle_data):
+        pass
+
+def test_bot_keeps_a_buffer_per_subscribed_pair():
+    bot = PassiveBot(log_file="/dev/null", history_size=10)
+
+    async def main():
+        bot.subscribe("ETH/USD")
+        for i in range(4):
+            await bot.websocket_handler.on_message(
+                CandleData(1_700_000_000_000 + 60_000 * i, 1.0, 2.0, 0.5, 1.0 + i, 1.0, "ETH/USD"))
+            await bot.websocket_handler.on_message(
+                CandleData(1_700_000_000_000 + 60_000 * i, 1.0, 2.0, 0.5, 9.0, 1.0, "BTC/USD"))
+        await bot.websocket_handler.drain()
+        await bot.websocket_handler.close()
+
+    asyncio.run(main())
+    assert bot.pair_candles["ETH/USD"].closes.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert bot.candles.closes.tolist() == [9.0] * 4